@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Public Suffix List Update Script
+
+Replaces the copy of the Public Suffix List bundled with the package
+(src/gerrit_reporting_tool/collectors/public_suffix_list.dat) with the
+current upstream list. The file is stored unmodified; it is licensed under
+MPL-2.0 (see .reuse/dep5 and LICENSES/MPL-2.0.txt).
+
+Usage:
+    python scripts/update_public_suffix_list.py
+    python scripts/update_public_suffix_list.py \\
+        --source /usr/share/publicsuffix/public_suffix_list.dat
+"""
+
+import argparse
+import sys
+import urllib.request
+from pathlib import Path
+
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from gerrit_reporting_tool.collectors.public_suffix import (
+    BUNDLED_SUFFIX_FILE,
+    ICANN_SECTION_END,
+    bundled_suffix_rules,
+)
+
+
+UPSTREAM_URL = "https://publicsuffix.org/list/public_suffix_list.dat"
+
+
+def fetch_list(source: str) -> bytes:
+    """Read the list from a URL or a local file."""
+    if "://" in source:
+        with urllib.request.urlopen(source, timeout=60) as response:
+            return bytes(response.read())
+    return Path(source).read_bytes()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--source",
+        default=UPSTREAM_URL,
+        help=f"URL or file to read the list from (default: {UPSTREAM_URL})",
+    )
+    args = parser.parse_args()
+
+    data = fetch_list(args.source)
+    text = data.decode("utf-8")
+    if ICANN_SECTION_END not in text or "Mozilla Public" not in text:
+        print(f"ERROR: {args.source} is not the Public Suffix List", file=sys.stderr)
+        return 1
+
+    old_rules = len(bundled_suffix_rules())
+    BUNDLED_SUFFIX_FILE.write_bytes(data)
+    bundled_suffix_rules.cache_clear()
+    new_rules = len(bundled_suffix_rules())
+    print(f"Updated {BUNDLED_SUFFIX_FILE}: {old_rules} -> {new_rules} ICANN rules")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -336,6 +336,20 @@ class ConfigValidator:
                     suggestion="Set github_api.token or use GITHUB_TOKEN environment variable (or specify --github-token-env for custom variable)"
                 )
 
+        # Churn sampling ranks files by the hotspots report
+        ownership = config.get("ownership", {})
+        if (
+            ownership.get("enabled")
+            and ownership.get("sample") == "churn"
+            and not config.get("hotspots", {}).get("enabled")
+        ):
+            result.add_warning(
+                message="ownership.sample is churn but hotspots are disabled; the largest files are sampled instead",
+                category=ValidationCategory.SEMANTIC,
+                path="ownership.sample",
+                suggestion="Set hotspots.enabled: true or ownership.sample: largest"
+            )
+
     def _validate_time_window_ordering(
         self,
         windows: Dict[str, int],
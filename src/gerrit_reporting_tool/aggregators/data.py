@@ -15,15 +15,24 @@ metrics into global summaries including:
 
 import logging
 from collections import defaultdict
-from typing import Any, Dict, List, cast
+from typing import Any, Dict, List, Optional, cast
+
+from gerrit_reporting_tool.collectors.identity import IdentityTable
 
 
 class DataAggregator:
     """Handles aggregation of repository data into global summaries."""
 
-    def __init__(self, config: dict[str, Any], logger: logging.Logger) -> None:
+    def __init__(
+        self,
+        config: dict[str, Any],
+        logger: logging.Logger,
+        identities: Optional[IdentityTable] = None,
+    ) -> None:
         self.config = config
         self.logger = logger
+        # Run-wide identity table shared with the git collector, if any
+        self.identities = identities
 
     def aggregate_global_data(
         self, repo_metrics: list[dict[str, Any]]
@@ -83,11 +92,13 @@ class DataAggregator:
         for repo in repo_metrics:
             days_since_last = repo.get("days_since_last_commit")
 
-            # Count total commits and lines of code
-            total_commits += repo.get("commit_counts", {}).get(primary_window, 0)
-            total_lines_added += (
-                repo.get("loc_stats", {}).get(primary_window, {}).get("added", 0)
-            )
+            # Count total commits and lines of code; copies of another
+            # repository's history (alias_of) are counted once
+            if not repo.get("alias_of"):
+                total_commits += repo.get("commit_counts", {}).get(primary_window, 0)
+                total_lines_added += (
+                    repo.get("loc_stats", {}).get(primary_window, {}).get("added", 0)
+                )
 
             # Check if repository has no commits at all (use the explicit flag)
             has_any_commits = repo.get("has_any_commits", False)
@@ -157,6 +168,79 @@ class DataAggregator:
             organizations, f"commits.{primary_window}", reverse=True, limit=None
         )
 
+        # Release leaderboard: repositories whose last release is oldest
+        released_repos = [
+            {
+                "gerrit_project": repo.get("gerrit_project", "Unknown"),
+                "tag_count": repo["releases"]["tag_count"],
+                "last_release": repo["releases"]["last_release"],
+                "days_since_last_release": repo["releases"]["days_since_last_release"],
+                "median_release_interval_days": repo["releases"][
+                    "median_release_interval_days"
+                ],
+            }
+            for repo in repo_metrics
+            if repo.get("releases", {}).get("tag_count")
+        ]
+        stale_releases = self.rank_entities(
+            released_repos, "days_since_last_release", reverse=True, limit=None
+        )
+
+        # Size leaderboard and fleet-wide bytes per extension; copies of a
+        # history (alias_of) are ranked but not counted twice in the totals
+        inventoried_repos = [
+            {
+                "gerrit_project": repo.get("gerrit_project", "Unknown"),
+                "total_bytes": repo["inventory"]["total_bytes"],
+                "total_files": repo["inventory"]["total_files"],
+                "extensions": repo["inventory"]["extensions"],
+            }
+            for repo in repo_metrics
+            if "inventory" in repo
+        ]
+        largest_repositories = self.rank_entities(
+            inventoried_repos, "total_bytes", reverse=True, limit=None
+        )
+        fleet_extensions: dict[str, dict[str, Any]] = {}
+        for repo in repo_metrics:
+            if "inventory" not in repo or repo.get("alias_of"):
+                continue
+            for row in repo["inventory"]["extensions"]:
+                totals = fleet_extensions.setdefault(
+                    row["extension"],
+                    {"extension": row["extension"], "files": 0, "bytes": 0, "repositories": 0},
+                )
+                totals["files"] += row["files"]
+                totals["bytes"] += row["bytes"]
+                totals["repositories"] += 1
+
+        # Fleet-wide ownership of the sampled lines, each history counted once
+        owned_repos = [
+            repo for repo in repo_metrics if "ownership" in repo and not repo.get("alias_of")
+        ]
+        owned_lines = sum(repo["ownership"]["lines"] for repo in owned_repos)
+        owners: dict[str, dict[str, Any]] = {}
+        owning_organizations: dict[str, dict[str, Any]] = {}
+        for repo in owned_repos:
+            for row in repo["ownership"]["authors"]:
+                owner = owners.setdefault(
+                    row["email"],
+                    {
+                        "name": row["name"],
+                        "email": row["email"],
+                        "domain": row["domain"],
+                        "lines": 0,
+                    },
+                )
+                owner["lines"] += row["lines"]
+            for row in repo["ownership"]["organizations"]:
+                organization = owning_organizations.setdefault(
+                    row["domain"], {"domain": row["domain"], "lines": 0}
+                )
+                organization["lines"] += row["lines"]
+        for row in [*owners.values(), *owning_organizations.values()]:
+            row["percent"] = round(row["lines"] / owned_lines * 100, 1) if owned_lines else 0.0
+
         # Build comprehensive summaries
         summaries = {
             "reporting_period": {
@@ -213,6 +297,36 @@ class DataAggregator:
             "top_organizations": top_organizations,
         }
 
+        # Only present when release metrics were collected
+        if released_repos:
+            summaries["stale_releases"] = stale_releases
+
+        # Only present when ownership was collected
+        if owned_repos:
+            summaries["code_ownership"] = {
+                "repositories": len(owned_repos),
+                "files": sum(repo["ownership"]["files"] for repo in owned_repos),
+                "lines": owned_lines,
+                "authors": self.rank_entities(
+                    list(owners.values()), "lines", reverse=True, limit=None
+                ),
+                "organizations": self.rank_entities(
+                    list(owning_organizations.values()), "lines", reverse=True, limit=None
+                ),
+            }
+
+        # Only present when the code-size inventory was collected
+        if inventoried_repos:
+            summaries["largest_repositories"] = largest_repositories
+            summaries["code_inventory"] = {
+                "total_bytes": sum(row["bytes"] for row in fleet_extensions.values()),
+                "total_files": sum(row["files"] for row in fleet_extensions.values()),
+                "extensions": sorted(
+                    fleet_extensions.values(),
+                    key=lambda row: (-row["bytes"], row["extension"]),
+                ),
+            }
+
         self.logger.info(
             f"Aggregation complete: {len(current_repos)} current, {len(active_repos)} active, {len(inactive_repos)} inactive, {len(no_commit_repos)} no-commit repositories"
         )
@@ -268,7 +382,11 @@ class DataAggregator:
         Aggregate author metrics across all repositories.
 
         Merges author data by email address, summing metrics across all repos
-        and tracking unique repositories touched per time window.
+        and tracking unique repositories touched per time window. With a
+        shared identity table, the organizational domain is taken from the
+        table so rollups use the same attribution as the collector.
+        Repositories that copy another one's history (``alias_of``) are
+        skipped, so their commits are not counted twice.
         """
         author_aggregates: dict[str, dict[str, Any]] = defaultdict(
             lambda: {
@@ -286,6 +404,8 @@ class DataAggregator:
 
         # Aggregate across all repositories
         for repo in repo_metrics:
+            if repo.get("alias_of"):
+                continue
             repo_name = repo.get("gerrit_project", "unknown")
 
             # Process each author in this repository
@@ -300,6 +420,9 @@ class DataAggregator:
                     author_aggregates[email]["email"] = email
                     author_aggregates[email]["username"] = author.get("username", "")
                     author_aggregates[email]["domain"] = author.get("domain", "")
+                    identity = self.identities.by_email(email) if self.identities else None
+                    if identity is not None:
+                        author_aggregates[email]["domain"] = identity.domain
 
                 # Aggregate metrics for each time window
                 for window_name in author.get("commits", {}):
@@ -0,0 +1,161 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Sparse per-day activity histograms for git metrics.
+
+Commits are folded into one histogram per repository and one per author,
+each mapping a UTC day number (epoch seconds // 86400) to commit count, lines
+added and lines removed. Time windows are answered afterwards with a binary
+search over the sorted days plus prefix sums, so per-commit work does not
+depend on how many windows are configured.
+
+Windows are day-aligned: a window starting at ``start_timestamp`` covers
+every commit on or after the UTC day containing that timestamp.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+DAY_SECONDS = 86400
+
+# (commits, lines added, lines removed)
+ActivityTotals = Tuple[int, int, int]
+
+
+def timestamp_to_day(timestamp: float) -> int:
+    """Return the UTC day number containing a Unix timestamp."""
+    return int(timestamp // DAY_SECONDS)
+
+
+def window_start_day(window_data: Dict[str, Any]) -> int:
+    """Return the first day covered by a reporter time window."""
+    return timestamp_to_day(window_data["start_timestamp"])
+
+
+class DailyHistogram:
+    """
+    Sparse day -> [commits, added, removed] histogram with range queries.
+
+    Prefix sums are built lazily on the first query after a modification.
+    """
+
+    __slots__ = ("_bins", "_days", "_commits", "_added", "_removed")
+
+    def __init__(self) -> None:
+        self._bins: Dict[int, List[int]] = {}
+        self._days: Optional[array] = None
+        self._commits = array("q")
+        self._added = array("q")
+        self._removed = array("q")
+
+    def __len__(self) -> int:
+        return len(self._bins)
+
+    def __bool__(self) -> bool:
+        return bool(self._bins)
+
+    def add(self, day: int, added: int, removed: int, commits: int = 1) -> None:
+        """Account commits on a given day."""
+        bucket = self._bins.get(day)
+        if bucket is None:
+            self._bins[day] = [commits, added, removed]
+        else:
+            bucket[0] += commits
+            bucket[1] += added
+            bucket[2] += removed
+        self._days = None
+
+    def merge(self, other: "DailyHistogram") -> None:
+        """Add all activity of another histogram into this one."""
+        for day, (commits, added, removed) in other._bins.items():
+            self.add(day, added, removed, commits)
+
+    @property
+    def first_day(self) -> Optional[int]:
+        """Earliest day with activity, or None when empty."""
+        days = self._prefix_days()
+        return days[0] if days else None
+
+    @property
+    def last_day(self) -> Optional[int]:
+        """Latest day with activity, or None when empty."""
+        days = self._prefix_days()
+        return days[-1] if days else None
+
+    def totals(self, start_day: int, end_day: Optional[int] = None) -> ActivityTotals:
+        """
+        Return (commits, added, removed) for days in [start_day, end_day].
+
+        ``end_day`` is inclusive; None means no upper bound.
+        """
+        days = self._prefix_days()
+        lo = bisect_left(days, start_day)
+        hi = len(days) if end_day is None else bisect_right(days, end_day)
+        if hi <= lo:
+            return (0, 0, 0)
+        return (
+            self._commits[hi] - self._commits[lo],
+            self._added[hi] - self._added[lo],
+            self._removed[hi] - self._removed[lo],
+        )
+
+    def items(self) -> List[Tuple[int, int, int, int]]:
+        """Return (day, commits, added, removed) sorted by day."""
+        return [(day, *self._bins[day]) for day in self._prefix_days()]
+
+    @classmethod
+    def from_items(cls, items: Iterable[Sequence[int]]) -> "DailyHistogram":
+        """Rebuild a histogram from (day, commits, added, removed) rows."""
+        histogram = cls()
+        for day, commits, added, removed in items:
+            histogram.add(day, added, removed, commits)
+        return histogram
+
+    def _prefix_days(self) -> array:
+        if self._days is None:
+            days = array("q", sorted(self._bins))
+            commits = array("q", [0])
+            added = array("q", [0])
+            removed = array("q", [0])
+            running_commits = running_added = running_removed = 0
+            for day in days:
+                day_commits, day_added, day_removed = self._bins[day]
+                running_commits += day_commits
+                running_added += day_added
+                running_removed += day_removed
+                commits.append(running_commits)
+                added.append(running_added)
+                removed.append(running_removed)
+            self._days = days
+            self._commits, self._added, self._removed = commits, added, removed
+        return self._days
+
+
+class RepoActivity:
+    """Daily histograms for one repository, each of its authors and branches."""
+
+    __slots__ = ("repository", "authors", "branches")
+
+    def __init__(self) -> None:
+        self.repository = DailyHistogram()
+        # Normalized author email -> histogram
+        self.authors: Dict[str, DailyHistogram] = {}
+        # Short branch name -> histogram, with the per-branch breakdown only
+        self.branches: Dict[str, DailyHistogram] = {}
+
+    def author(self, email: str) -> DailyHistogram:
+        """Return the histogram for an author, creating it if needed."""
+        histogram = self.authors.get(email)
+        if histogram is None:
+            histogram = self.authors[email] = DailyHistogram()
+        return histogram
+
+    def branch(self, name: str) -> DailyHistogram:
+        """Return the histogram for a branch, creating it if needed."""
+        histogram = self.branches.get(name)
+        if histogram is None:
+            histogram = self.branches[name] = DailyHistogram()
+        return histogram
@@ -0,0 +1,155 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Commit credit for co-authors and sign-offs.
+
+Commits carry only one author, yet pair-programmed changes and patches
+applied on someone's behalf name further contributors in their trailers::
+
+    Co-authored-by: Jane Doe <jane@example.org>
+    Signed-off-by: John Doe <john@example.org>
+
+The trailers are read by git itself in the same log pass as the numstat
+data (``%(trailers:...)``, see git_log.py) and stored per commit in the
+CommitBatch. How much credit the identities named there receive is decided
+by the attribution policy (``data_quality.co_author_attribution``):
+
+- ``author`` (default): only the commit author is credited; trailers are
+  not requested from git at all
+- ``co_authors``: every co-author is credited with the commit and all of
+  its lines, like the author
+- ``split``: the commit counts for the author and every co-author, and its
+  lines are split evenly between them (the remainder goes to the author)
+
+Signed-off-by identities are only credited when
+``data_quality.credit_sign_offs`` is set; they are then treated like
+co-authors. Identities matching the author's email are never credited
+twice, so the usual self sign-off changes nothing.
+
+Repository totals always count a commit once. Author and organization
+totals can add up to more than the repository total under ``co_authors``.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, List, Mapping, Optional, Tuple
+
+
+# Trailer kinds stored per commit in a CommitBatch
+TRAILER_CO_AUTHOR = 0
+TRAILER_SIGN_OFF = 1
+
+# Trailer keys (lowercase) -> kind; git matches keys case-insensitively
+TRAILER_KEYS = {
+    b"co-authored-by": TRAILER_CO_AUTHOR,
+    b"signed-off-by": TRAILER_SIGN_OFF,
+}
+
+ATTRIBUTION_AUTHOR = "author"
+ATTRIBUTION_CO_AUTHORS = "co_authors"
+ATTRIBUTION_SPLIT = "split"
+ATTRIBUTION_MODES = (ATTRIBUTION_AUTHOR, ATTRIBUTION_CO_AUTHORS, ATTRIBUTION_SPLIT)
+
+# "Name <email>"; the name may be empty
+_IDENTITY_RE = re.compile(rb"^\s*(.*?)\s*<([^<>]*)>\s*$")
+
+# "Key: value" line of a trailer block
+_TRAILER_LINE_RE = re.compile(rb"^([A-Za-z0-9-]+):\s*(.*?)\s*$")
+
+
+@dataclass(frozen=True)
+class AttributionPolicy:
+    """
+    How commit credit is shared with the identities named in trailers.
+
+    Attributes:
+        mode: One of ATTRIBUTION_MODES
+        credit_sign_offs: Credit Signed-off-by identities like co-authors
+    """
+
+    mode: str = ATTRIBUTION_AUTHOR
+    credit_sign_offs: bool = False
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "AttributionPolicy":
+        """Build the policy from the ``data_quality`` section of a config."""
+        data_quality = config.get("data_quality", {})
+        mode = data_quality.get("co_author_attribution") or ATTRIBUTION_AUTHOR
+        if mode not in ATTRIBUTION_MODES:
+            raise ValueError(
+                f"Unknown co_author_attribution {mode!r}; "
+                f"expected one of {', '.join(ATTRIBUTION_MODES)}"
+            )
+        return cls(mode, bool(data_quality.get("credit_sign_offs", False)))
+
+    @property
+    def enabled(self) -> bool:
+        """True when trailers have to be read at all."""
+        return self.mode != ATTRIBUTION_AUTHOR
+
+    def credits(self, kind: int) -> bool:
+        """Return True if identities of trailer ``kind`` receive credit."""
+        return kind == TRAILER_CO_AUTHOR or (
+            kind == TRAILER_SIGN_OFF and self.credit_sign_offs
+        )
+
+
+def parse_trailer_identity(value: bytes) -> Optional[Tuple[bytes, bytes]]:
+    """
+    Split a trailer value into raw (name, email).
+
+    Accepts ``Name <email>`` and a bare email address; anything else (for
+    example a free-form sign-off) returns None.
+    """
+    match = _IDENTITY_RE.match(value)
+    if match:
+        name, email = match.group(1), match.group(2).strip()
+        return (name, email) if email else None
+    value = value.strip()
+    if b"@" in value and b" " not in value:
+        return b"", value
+    return None
+
+
+def parse_trailer_field(field: bytes, separator: bytes) -> List[Tuple[int, bytes]]:
+    """
+    Parse git's ``%(trailers:...)`` output into (kind, value) pairs.
+
+    ``field`` holds ``Key: value`` entries joined by ``separator``; keys
+    other than TRAILER_KEYS are ignored.
+    """
+    trailers = []
+    for entry in field.split(separator):
+        key, _, value = entry.partition(b":")
+        kind = TRAILER_KEYS.get(key.strip().lower())
+        if kind is not None:
+            trailers.append((kind, value.strip()))
+    return trailers
+
+
+def parse_message_trailers(message: bytes) -> List[Tuple[int, bytes]]:
+    """
+    Return the (kind, value) trailers of a raw commit message.
+
+    For backends that read commit objects directly. Like git, only the last
+    paragraph is considered, and only if every line in it is a trailer or a
+    continuation line; continuation lines are unfolded.
+    """
+    paragraphs = message.rstrip().split(b"\n\n")
+    if len(paragraphs) < 2:
+        return []
+    entries: List[List[bytes]] = []
+    for line in paragraphs[-1].splitlines():
+        if line[:1] in (b" ", b"\t") and entries:
+            entries[-1][1] += b" " + line.strip()
+            continue
+        match = _TRAILER_LINE_RE.match(line)
+        if match is None:
+            return []
+        entries.append([match.group(1), match.group(2)])
+    return [
+        (TRAILER_KEYS[key.lower()], value)
+        for key, value in entries
+        if key.lower() in TRAILER_KEYS
+    ]
@@ -0,0 +1,208 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Compact columnar representation of parsed git history.
+
+Instead of a dict per commit and a dict per changed file, parsed commits are
+stored in parallel ``array.array`` columns (author epoch, author id, lines
+added, lines removed). Author identities are interned once per parser in an
+AuthorTable, so each commit only carries a small integer. Per-file numstat
+data and commit trailers are kept in flat CSR-style layouts and only when a
+consumer asks for them.
+
+This keeps allocation counts roughly constant per batch rather than
+proportional to the number of commits and files in the history.
+"""
+
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class AuthorTable:
+    """
+    Interns raw (name, email) pairs to dense integer ids.
+
+    Raw header bytes are used as the lookup key, so names and emails are only
+    decoded the first time an identity is seen.
+    """
+
+    __slots__ = ("_ids", "names", "emails")
+
+    def __init__(self) -> None:
+        self._ids: Dict[Tuple[bytes, bytes], int] = {}
+        self.names: List[str] = []
+        self.emails: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def intern(self, name_raw: bytes, email_raw: bytes) -> int:
+        """Return the id for a raw identity, registering it if new."""
+        key = (name_raw, email_raw)
+        author_id = self._ids.get(key)
+        if author_id is None:
+            author_id = len(self.names)
+            self._ids[key] = author_id
+            self.names.append(name_raw.decode("utf-8", errors="replace"))
+            self.emails.append(email_raw.decode("utf-8", errors="replace"))
+        return author_id
+
+
+class CommitBatch:
+    """
+    A batch of commits stored as parallel arrays.
+
+    Commit ``i`` is described by ``shas[i]``, ``timestamps[i]`` (author date,
+    epoch seconds), ``author_ids[i]`` (index into ``authors``), ``added[i]``
+    and ``removed[i]`` (numstat totals). When ``keep_files`` is set, the files
+    of commit ``i`` are ``file_paths[file_offsets[i]:file_offsets[i + 1]]``
+    with matching ``file_added``/``file_removed`` entries. When
+    ``keep_trailers`` is set, the trailer identities of commit ``i`` are
+    ``trailer_ids[trailer_offsets[i]:trailer_offsets[i + 1]]`` (indexes into
+    ``authors``) with matching ``trailer_kinds`` (see attribution.py). When
+    ``sources`` is given, ``source_ids[i]`` indexes the ref name commit ``i``
+    is credited to: the first walked ref it is reachable from, as derived by
+    git_log.RefSources from the parent links of a ``--date-order`` walk.
+    """
+
+    __slots__ = (
+        "authors",
+        "keep_files",
+        "shas",
+        "timestamps",
+        "author_ids",
+        "added",
+        "removed",
+        "file_offsets",
+        "file_paths",
+        "file_added",
+        "file_removed",
+        "keep_trailers",
+        "trailer_offsets",
+        "trailer_kinds",
+        "trailer_ids",
+        "sources",
+        "source_ids",
+    )
+
+    def __init__(
+        self,
+        authors: AuthorTable,
+        keep_files: bool = False,
+        keep_trailers: bool = False,
+        sources: Optional[List[str]] = None,
+    ) -> None:
+        self.authors = authors
+        self.keep_files = keep_files
+        self.keep_trailers = keep_trailers
+        self.shas: List[bytes] = []
+        self.timestamps = array("q")
+        self.author_ids = array("l")
+        self.added = array("q")
+        self.removed = array("q")
+        self.file_offsets = array("l", [0]) if keep_files else array("l")
+        self.file_paths: List[bytes] = []
+        self.file_added = array("q")
+        self.file_removed = array("q")
+        self.trailer_offsets = array("l", [0]) if keep_trailers else array("l")
+        self.trailer_kinds = array("b")
+        self.trailer_ids = array("l")
+        # Ref names shared with the parser, like ``authors``
+        self.sources = sources
+        self.source_ids = array("l")
+
+    def __len__(self) -> int:
+        return len(self.shas)
+
+    def append_commit(
+        self,
+        sha: bytes,
+        timestamp: int,
+        author_id: int,
+        added: int,
+        removed: int,
+        files: Optional[List[Tuple[bytes, int, int]]] = None,
+        trailers: Optional[List[Tuple[int, int]]] = None,
+        source_id: int = 0,
+    ) -> None:
+        """
+        Append a complete commit.
+
+        ``files`` is only stored with keep_files, ``trailers`` ((kind,
+        author id) pairs) only with keep_trailers and ``source_id`` only with
+        ``sources``.
+        """
+        self.shas.append(sha)
+        self.timestamps.append(timestamp)
+        self.author_ids.append(author_id)
+        self.added.append(added)
+        self.removed.append(removed)
+        if self.keep_files:
+            for path, file_added, file_removed in files or ():
+                self.file_paths.append(path)
+                self.file_added.append(file_added)
+                self.file_removed.append(file_removed)
+            self.file_offsets.append(len(self.file_paths))
+        if self.keep_trailers:
+            for kind, trailer_id in trailers or ():
+                self.trailer_kinds.append(kind)
+                self.trailer_ids.append(trailer_id)
+            self.trailer_offsets.append(len(self.trailer_ids))
+        if self.sources is not None:
+            self.source_ids.append(source_id)
+
+    def files(self, index: int) -> List[Tuple[bytes, int, int]]:
+        """Return ``(path, added, removed)`` for commit ``index``."""
+        if not self.keep_files:
+            return []
+        start, end = self.file_offsets[index], self.file_offsets[index + 1]
+        return list(
+            zip(
+                self.file_paths[start:end],
+                self.file_added[start:end],
+                self.file_removed[start:end],
+            )
+        )
+
+    def trailers(self, index: int) -> List[Tuple[int, int]]:
+        """Return ``(kind, author id)`` for the trailers of commit ``index``."""
+        if not self.keep_trailers:
+            return []
+        start, end = self.trailer_offsets[index], self.trailer_offsets[index + 1]
+        return list(zip(self.trailer_kinds[start:end], self.trailer_ids[start:end]))
+
+    def commit(self, index: int) -> Dict[str, Any]:
+        """Materialize commit ``index`` as a dict (for tests and debugging)."""
+        author_id = self.author_ids[index]
+        files: Optional[List[Dict[str, Any]]] = None
+        if self.keep_files:
+            files = [
+                {"filename": path, "added": added, "removed": removed}
+                for path, added, removed in self.files(index)
+            ]
+        trailers: Optional[List[Dict[str, Any]]] = None
+        if self.keep_trailers:
+            trailers = [
+                {
+                    "kind": kind,
+                    "name": self.authors.names[trailer_id],
+                    "email": self.authors.emails[trailer_id],
+                }
+                for kind, trailer_id in self.trailers(index)
+            ]
+        return {
+            "hash": self.shas[index].decode("ascii", errors="replace"),
+            "timestamp": self.timestamps[index],
+            "author_name": self.authors.names[author_id],
+            "author_email": self.authors.emails[author_id],
+            "added": self.added[index],
+            "removed": self.removed[index],
+            "files_changed": files,
+            "trailers": trailers,
+        }
+
+    def iter_commits(self) -> Iterator[Dict[str, Any]]:
+        """Materialize every commit of the batch as a dict."""
+        for index in range(len(self)):
+            yield self.commit(index)
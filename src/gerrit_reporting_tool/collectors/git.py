@@ -15,90 +15,38 @@ and extracting comprehensive metrics including:
 """
 
 import datetime
-import hashlib
-import json
 import logging
 import os
-import subprocess
 import tempfile
+import threading
+import time
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, cast
 
 from api.gerrit_client import GerritAPIClient
 from api.jenkins_client import JenkinsAPIClient
 from concurrency.jenkins_allocation import JenkinsAllocationContext
 
-
-def safe_git_command(
-    cmd: list[str], cwd: Path | None, logger: logging.Logger
-) -> tuple[bool, str]:
-    """
-    Execute a git command safely with error handling.
-
-    Returns:
-        (success: bool, output_or_error: str)
-    """
-    try:
-        git_result = subprocess.run(
-            cmd,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5 minute timeout
-        )
-        return (
-            git_result.returncode == 0,
-            git_result.stdout.strip() or git_result.stderr.strip(),
-        )
-    except subprocess.CalledProcessError as e:
-        logger.warning(f"Git command failed in {cwd}: {' '.join(cmd)} - {e.stderr}")
-        return False, e.stderr
-    except subprocess.TimeoutExpired:
-        logger.error(f"Git command timed out in {cwd}: {' '.join(cmd)}")
-        return False, "Command timed out"
-    except Exception as e:
-        logger.error(f"Unexpected error running git command in {cwd}: {e}")
-        return False, str(e)
-
-
-def parse_git_iso_date(date_str: str) -> datetime.datetime:
-    """
-    Parse git's --date=iso format into a datetime object.
-
-    Git ISO format: "2013-03-25 16:50:06 +0100"
-    Python fromisoformat expects: "2013-03-25T16:50:06+01:00"
-
-    Args:
-        date_str: Date string from git in ISO format
-
-    Returns:
-        datetime object with timezone information
-
-    Raises:
-        ValueError: If the date string cannot be parsed
-    """
-    # Replace first space with 'T' to separate date and time
-    date_str = date_str.replace(" ", "T", 1)
-
-    # Handle timezone offset: convert "+0100" to "+01:00"
-    if "+" in date_str or date_str.count("-") > 2:
-        # Split at the timezone offset
-        if "+" in date_str:
-            parts = date_str.rsplit("+", 1)
-            tz_sign = "+"
-        else:
-            # Find the last '-' which is the timezone indicator
-            # (date already has 2 dashes, so count > 2 means timezone)
-            parts = date_str.rsplit("-", 1)
-            tz_sign = "-"
-
-        if len(parts) == 2 and len(parts[1]) == 4:
-            # Format timezone: "0100" -> "01:00"
-            tz_offset = parts[1]
-            formatted_tz = f"{tz_offset[:2]}:{tz_offset[2:]}"
-            date_str = f"{parts[0]}{tz_sign}{formatted_tz}"
-
-    return datetime.datetime.fromisoformat(date_str)
+from .activity import DAY_SECONDS, RepoActivity, window_start_day
+from .attribution import AttributionPolicy
+from .git_backend import DEFAULT_GIT_TIMEOUT, GitLogWalk, TreeEntry, get_git_backend
+from .git_log import compile_exclude_paths
+from .git_refs import find_git_dir, list_refs, match_refs, read_head_commit, short_ref_name
+from .hotspots import DEFAULT_HOTSPOT_CAPACITY, DEFAULT_HOTSPOT_TOP_N, HotspotAccumulator
+from .identity import IdentityTable
+from .inventory import DEFAULT_INVENTORY_TOP_N, code_inventory
+from .metrics_store import BlameCounts, MetricsStore
+from .ownership import (
+    DEFAULT_OWNERSHIP_MAX_FILE_BYTES,
+    DEFAULT_OWNERSHIP_MAX_FILES,
+    OWNERSHIP_SAMPLES,
+    hottest_paths,
+    ownership_metrics,
+    select_ownership_sample,
+)
+from .releases import compile_tag_pattern, release_metrics
+from .repo_state import RepoState, SharedHistory
 
 
 class GitDataCollector:
@@ -107,6 +55,11 @@ class GitDataCollector:
     Thread Safety:
         This class is designed for concurrent use via ThreadPoolExecutor.
         Jenkins job allocation is protected by instance-level JenkinsAllocationContext.
+
+    Process Mode:
+        When ``walk_executor`` is set (e.g. to a ProcessPoolExecutor), git log
+        parsing and folding run on that executor while the calling thread
+        waits; only the compact GitLogWalk aggregates cross back.
     """
 
     def __init__(
@@ -121,14 +74,110 @@ class GitDataCollector:
         self.time_windows = time_windows
         self.logger = logger
         self.api_stats = api_stats
-        self.cache_enabled = config.get("performance", {}).get("cache", False)
-        self.cache_dir = None
+        self.cache_enabled = bool(config.get("performance", {}).get("cache", False))
+        # Resolved once per run instead of for every numstat line
+        self.skip_binary_changes = bool(
+            config.get("data_quality", {}).get("skip_binary_changes", True)
+        )
+        # Vendored/generated paths git leaves out of the numstat
+        self.exclude_paths = list(
+            compile_exclude_paths(config.get("data_quality", {}).get("exclude_paths"))
+        )
         self.repos_path: Optional[Path] = (
             None  # Will be set later for relative path calculation
         )
-        if self.cache_enabled:
-            self.cache_dir = Path(tempfile.gettempdir()) / "repo_reporting_cache"
-            self.cache_dir.mkdir(exist_ok=True)
+
+        # Metrics cache and incremental collection share one store of
+        # window-agnostic per-repository state (HEAD + daily aggregates)
+        performance_config = config.get("performance", {})
+        self.incremental_enabled = bool(performance_config.get("incremental", False))
+        self.state_store: Optional[MetricsStore] = None
+        if self.cache_enabled or self.incremental_enabled:
+            store_path = performance_config.get("store_path") or (
+                Path(tempfile.gettempdir()) / "repo_reporting" / "metrics.sqlite3"
+            )
+            self.state_store = MetricsStore(Path(store_path), logger)
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+        # Repositories with the same history (forks, mirrors) are walked once
+        # per run; later copies reuse the aggregates as aliases
+        self.deduplicate_histories = bool(
+            performance_config.get("deduplicate_histories", False)
+        )
+        self._shared_histories: Dict[str, SharedHistory] = {}
+        self._shared_lock = threading.Lock()
+
+        # Executor for the CPU-bound git log walk; None walks in the calling
+        # thread. Set by the reporter in process execution mode.
+        self.walk_executor: Optional[Executor] = None
+
+        # Git access (history walk, ref resolution, ancestry checks); the
+        # CLI backend by default, libgit2 via pygit2 when configured
+        self.git_backend = get_git_backend(performance_config.get("git_backend"), logger)
+
+        # Time budgets: each repository's git log walk is bounded by
+        # repo_timeout seconds and by the end of the analysis phase
+        # (time.time() value, set by the reporter from phase_timeout)
+        self.repo_timeout = float(
+            performance_config.get("repo_timeout") or DEFAULT_GIT_TIMEOUT
+        )
+        self.phase_deadline: Optional[float] = None
+
+        # Optional per-directory churn and hottest paths per time window
+        self.hotspot_config = config.get("hotspots", {})
+        self.hotspots_enabled = bool(self.hotspot_config.get("enabled", False))
+
+        # Optional release cadence from the repository tags
+        release_config = config.get("releases", {})
+        self.releases_enabled = bool(release_config.get("enabled", False))
+        self.release_tag_pattern = compile_tag_pattern(release_config.get("tag_pattern"))
+
+        # Optional code-size inventory of the HEAD tree
+        inventory_config = config.get("inventory", {})
+        self.inventory_enabled = bool(inventory_config.get("enabled", False))
+        self.inventory_top_n = int(inventory_config.get("top_n", DEFAULT_INVENTORY_TOP_N))
+
+        # Optional code ownership from blaming a sample of files per repository
+        ownership_config = config.get("ownership", {})
+        self.ownership_enabled = bool(ownership_config.get("enabled", False))
+        self.ownership_sample = ownership_config.get("sample") or OWNERSHIP_SAMPLES[0]
+        if self.ownership_sample not in OWNERSHIP_SAMPLES:
+            raise ValueError(
+                f"Invalid ownership.sample {self.ownership_sample!r}, "
+                f"expected one of {', '.join(OWNERSHIP_SAMPLES)}"
+            )
+        self.ownership_max_files = int(
+            ownership_config.get("max_files", DEFAULT_OWNERSHIP_MAX_FILES)
+        )
+        self.ownership_max_file_bytes = int(
+            ownership_config.get("max_file_bytes", DEFAULT_OWNERSHIP_MAX_FILE_BYTES)
+        )
+        if (
+            self.ownership_enabled
+            and self.ownership_sample == "churn"
+            and not self.hotspots_enabled
+        ):
+            self.logger.warning(
+                "ownership.sample is churn but hotspots are disabled; "
+                "sampling the largest files instead"
+            )
+
+        # Credit for identities named in Co-authored-by/Signed-off-by trailers
+        self.attribution = AttributionPolicy.from_config(config)
+
+        # Branches walked together with HEAD, and the optional per-branch
+        # activity breakdown
+        branch_config = config.get("branches", {})
+        self.ref_patterns: List[str] = list(branch_config.get("patterns") or [])
+        self.branch_breakdown = bool(
+            self.ref_patterns and branch_config.get("breakdown", False)
+        )
+
+        # Author identities are normalized once per distinct raw identity for
+        # the whole run; the table is shared by all workers and the aggregator
+        self.identities = IdentityTable.from_config(config, self._load_domain_config())
 
         # Initialize Gerrit API client if configured
         self.gerrit_client = None
@@ -404,19 +453,26 @@ class GitDataCollector:
             return "unknown-gerrit-host"
 
     def __del__(self):
-        """Cleanup Gerrit client when GitDataCollector is destroyed."""
+        """Cleanup Gerrit client and metrics store when GitDataCollector is destroyed."""
         if hasattr(self, "gerrit_client") and self.gerrit_client:
             try:
                 self.gerrit_client.close()
             except Exception:
                 pass  # Ignore cleanup errors
+        state_store = getattr(self, "state_store", None)
+        if state_store is not None:
+            try:
+                state_store.close()
+            except Exception:
+                pass  # Ignore cleanup errors
 
     def collect_repo_git_metrics(self, repo_path: Path) -> dict[str, Any]:
         """
         Extract Git metrics for a single repository across all time windows.
 
-        Uses git log --numstat --date=iso --pretty=format for unified traversal.
-        Single pass filtering commits into all time windows.
+        Uses a NUL-delimited git log --numstat stream for unified traversal.
+        Single pass folding commits into per-day histograms; every time window
+        is then answered from the histograms (day-aligned, see activity.py).
         Collects: timestamps, author name/email, added/removed lines.
         Returns structured metrics or error descriptor.
         """
@@ -444,12 +500,14 @@ class GitDataCollector:
                 "activity_status": "inactive",  # "current", "active", or "inactive"
                 "has_any_commits": False,  # Track if repo has ANY commits (regardless of time windows)
                 "total_commits_ever": 0,  # Total commits across all history
+                "partial": False,  # History walk stopped by a time budget
+                "history_cutoff": None,  # Oldest commit date covered when partial
                 "commit_counts": {window: 0 for window in self.time_windows},
                 "loc_stats": {
                     window: {"added": 0, "removed": 0, "net": 0}
                     for window in self.time_windows
                 },
-                "unique_contributors": {window: set() for window in self.time_windows},
+                "unique_contributors": {window: 0 for window in self.time_windows},
                 "features": {},
             },
             "authors": {},  # email -> author metrics
@@ -457,53 +515,208 @@ class GitDataCollector:
         }
 
         try:
-            # Check if this is actually a git repository
-            if not (repo_path / ".git").exists():
+            # Check if this is actually a git repository (checkout or bare clone)
+            if find_git_dir(repo_path) is None:
                 errors_list = metrics["errors"]
                 assert isinstance(errors_list, list)
                 errors_list.append(f"Not a git repository: {repo_path}")
                 return metrics
 
-            # Check cache if enabled
-            if self.cache_enabled:
-                cached_metrics = self._load_from_cache(repo_path)
-                if cached_metrics:
-                    self.logger.debug(f"Using cached metrics for {gerrit_project}")
-                    return cached_metrics
-
-            # Get git log with numstat in a single command
-            git_command = [
-                "git",
-                "log",
-                "--numstat",
-                "--date=iso",
-                "--pretty=format:%H|%ad|%an|%ae|%s",
-            ]
-
             # NOTE: Removed max_history_years filtering to ensure all commit data is captured
             # for accurate total_commits_ever, has_any_commits, and complete contributor data.
             # Time window filtering is applied separately during commit processing.
-
-            success, output = safe_git_command(git_command, repo_path, self.logger)
-            if not success:
-                metrics["errors"].append(f"Git command failed: {output}")
-                return metrics
-
-            # Parse git log output
-            commits_data = self._parse_git_log_output(output, gerrit_project)
+            commit_count = 0
+            activity = RepoActivity()
+            revision_range: Optional[str] = None
+            needs_walk = True
+            last_commit_epoch: Optional[int] = None
+            last_commit_offset: Optional[int] = None
+
+            # Stored state keyed by HEAD + collector settings: an unchanged
+            # repository costs one ref file read. With incremental collection,
+            # older states are extended with the commits in old_head..new_head.
+            # With branch patterns the matching branch tips are part of the
+            # key and changed branches force a full walk. Copies of a history
+            # already analysed in this run reuse its aggregates instead.
+            head = None
+            ref_tips: Dict[str, str] = {}
+            incremental = False
+            settings = self._collection_settings()
+            hotspots = self._new_hotspots()
+            hotspot_key = self._hotspot_key(hotspots) if hotspots is not None else None
+            cached_hotspots: Optional[Dict[str, Any]] = None
+            history_key = self.history_key(repo_path) if self.deduplicate_histories else None
+            with self._shared_lock:
+                shared = self._shared_histories.get(history_key) if history_key else None
+            if shared is not None:
+                activity = self._seed_from_state(shared.state, metrics)
+                commit_count = shared.state.total_commits
+                last_commit_epoch = shared.state.last_commit_timestamp
+                last_commit_offset = shared.state.last_commit_offset
+                needs_walk = False
+                metrics["repository"]["alias_of"] = shared.gerrit_project
+                self.logger.debug(
+                    f"{gerrit_project} has the history of {shared.gerrit_project}"
+                )
+            elif self.state_store:
+                head = self._get_head_commit(repo_path)
+                if head and self.ref_patterns:
+                    tips = self._get_ref_tips(repo_path)
+                    if tips is None:
+                        head = None
+                    else:
+                        ref_tips = tips
+                state = self.state_store.load(gerrit_project) if head else None
+                if state and head and state.matches(head, settings, ref_tips):
+                    self._record_cache_lookup(hit=True)
+                    activity = self._seed_from_state(state, metrics)
+                    commit_count = state.total_commits
+                    last_commit_epoch = state.last_commit_timestamp
+                    last_commit_offset = state.last_commit_offset
+                    if hotspot_key is not None and state.hotspot_key == hotspot_key:
+                        cached_hotspots = state.hotspots
+                    needs_walk = False
+                    self.logger.debug(f"Using cached metrics for {gerrit_project}")
+                elif (
+                    state
+                    and head
+                    and self.incremental_enabled
+                    and not self.ref_patterns
+                    and self._can_extend_state(repo_path, state, head)
+                ):
+                    self._record_cache_lookup(hit=False)
+                    activity = self._seed_from_state(state, metrics)
+                    commit_count = state.total_commits
+                    last_commit_epoch = state.last_commit_timestamp
+                    last_commit_offset = state.last_commit_offset
+                    revision_range = f"{state.head}..{head}"
+                    incremental = True
+                    self.logger.debug(
+                        f"Incremental collection for {gerrit_project}: {revision_range}"
+                    )
+                else:
+                    self._record_cache_lookup(hit=False)
+                    # Branch walks name HEAD as such in the per-branch breakdown
+                    revision_range = None if self.ref_patterns else head
+
+            # Hotspots are folded in the same pass when the full history is
+            # walked; incremental runs, and cached runs whose stored report
+            # was computed for other windows, walk the windows separately
+            walk = None
+            if needs_walk:
+                walk = self._walk_git_log(
+                    repo_path,
+                    revision_range,
+                    metrics,
+                    activity,
+                    self._repo_deadline(),
+                    hotspots=None if incremental else hotspots,
+                )
+                if walk.error is not None:
+                    metrics["errors"].append(f"Git command failed: {walk.error}")
+                    return metrics
+                commit_count += walk.commit_count
+                # git log emits the tip of the walked range first; with branch
+                # patterns that is the newest tip of HEAD and the branches
+                if walk.tip_epoch is not None:
+                    last_commit_epoch = walk.tip_epoch
+                    last_commit_offset = walk.tip_offset
+                if walk.partial:
+                    self._mark_partial(metrics, walk, gerrit_project)
 
             # Update total commit count regardless of time windows
-            metrics["repository"]["total_commits_ever"] = len(commits_data)
-            metrics["repository"]["has_any_commits"] = len(commits_data) > 0
+            metrics["repository"]["total_commits_ever"] = commit_count
+            metrics["repository"]["has_any_commits"] = commit_count > 0
+
+            # Answer the configured time windows from the histograms
+            self._apply_time_windows(metrics, activity)
+
+            if hotspots is not None and shared is not None:
+                if shared.hotspots is not None:
+                    metrics["repository"]["hotspots"] = shared.hotspots
+            elif cached_hotspots is not None:
+                metrics["repository"]["hotspots"] = cached_hotspots
+            elif hotspots is not None:
+                hotspot_walk = walk
+                if walk is None or walk.hotspots is None:
+                    hotspot_walk = self._walk_hotspots(repo_path, head, hotspots)
+                if hotspot_walk is not None and hotspot_walk.hotspots is not None:
+                    report = hotspot_walk.hotspots.report(
+                        int(self.hotspot_config.get("top_n", DEFAULT_HOTSPOT_TOP_N))
+                    )
+                    metrics["repository"]["hotspots"] = report
+                    # The stored totals are still valid, only the report is new
+                    if (
+                        walk is None
+                        and not hotspot_walk.partial
+                        and self.state_store
+                        and head
+                        and hotspot_key
+                    ):
+                        self.state_store.save_hotspots(gerrit_project, hotspot_key, report)
+
+            # Tags are listed on every run: they can change without HEAD
+            # moving, and the listing is a single command
+            if self.releases_enabled:
+                metrics["repository"]["releases"] = release_metrics(
+                    self.git_backend.list_tags(repo_path),
+                    self.time_windows,
+                    self.release_tag_pattern,
+                )
 
-            # Process commits into time windows
-            for commit_data in commits_data:
-                self._update_commit_metrics(commit_data, metrics)
+            # Sizes come from the HEAD tree listing, so bare clones work too;
+            # the ownership sample is chosen from the same listing
+            if self.inventory_enabled or self.ownership_enabled:
+                tree = self.git_backend.list_tree(repo_path, head or "HEAD")
+                if self.inventory_enabled:
+                    metrics["repository"]["inventory"] = code_inventory(
+                        tree, self.inventory_top_n
+                    )
+                if self.ownership_enabled:
+                    metrics["repository"]["ownership"] = self._collect_ownership(
+                        repo_path,
+                        gerrit_project,
+                        head or "HEAD",
+                        tree,
+                        metrics["repository"].get("hotspots"),
+                    )
 
             # Finalize repository metrics
-            self._finalize_repo_metrics(metrics, gerrit_project)
+            self._finalize_repo_metrics(
+                metrics, gerrit_project, last_commit_epoch, last_commit_offset
+            )
+
+            # Partial aggregates are reported but never stored or shared
+            complete = walk is None or not walk.partial
+            store = bool(self.state_store and head and walk is not None)
+            share = bool(history_key and shared is None)
+            if complete and (store or share):
+                state = RepoState(
+                    head=head or "",
+                    total_commits=commit_count,
+                    activity=activity,
+                    author_names={
+                        email: author["name"]
+                        for email, author in metrics["authors"].items()
+                    },
+                    settings=settings,
+                    last_commit_timestamp=last_commit_epoch,
+                    last_commit_offset=last_commit_offset,
+                    ref_tips=ref_tips,
+                    hotspots=metrics["repository"].get("hotspots"),
+                    hotspot_key=hotspot_key,
+                )
+                if store and self.state_store:
+                    self.state_store.save(gerrit_project, state)
+                if share and history_key is not None:
+                    with self._shared_lock:
+                        self._shared_histories.setdefault(
+                            history_key,
+                            SharedHistory(
+                                gerrit_project, state, metrics["repository"].get("hotspots")
+                            ),
+                        )
 
-            # Convert sets to counts for JSON serialization
             repo_data = metrics["repository"]
 
             # Add Jenkins job information if available
@@ -528,20 +741,10 @@ class GitDataCollector:
                     "job_count": len(enriched_jobs),
                     "has_jobs": len(enriched_jobs) > 0,
                 }
-            unique_contributors = repo_data["unique_contributors"]
-            for window in self.time_windows:
-                contributor_set = unique_contributors[window]
-                assert isinstance(contributor_set, set)
-                unique_contributors[window] = len(contributor_set)
-
             self.logger.debug(
-                f"Collected {len(commits_data)} commits for {gerrit_project}"
+                f"Collected {commit_count} commits for {gerrit_project}"
             )
 
-            # Save to cache if enabled
-            if self.cache_enabled:
-                self._save_cached_metrics(repo_path, repo_data)
-
             return metrics
 
         except Exception as e:
@@ -834,16 +1037,16 @@ class GitDataCollector:
 
     def bucket_commit_into_windows(
         self,
-        commit_datetime: datetime.datetime,
+        commit_timestamp: float,
         time_windows: dict[str, dict[str, Any]],
     ) -> List[str]:
         """
         Determine which time windows a commit falls into.
 
         A commit belongs to a window if it occurred after the window's start time.
+        ``commit_timestamp`` is the commit's Unix epoch (seconds).
         """
         matching_windows = []
-        commit_timestamp = commit_datetime.timestamp()
 
         for window_name, window_data in time_windows.items():
             if commit_timestamp >= window_data["start_timestamp"]:
@@ -853,42 +1056,22 @@ class GitDataCollector:
 
     def extract_organizational_domain(self, full_domain: str) -> str:
         """
-        Extract organizational domain from full domain by taking the last two parts.
-        Uses configuration file for exceptions where full domain should be preserved.
+        Extract organizational domain from full domain: its public suffix plus
+        one label. Uses configuration file for domains that should be preserved
+        in full, custom mappings and additional public suffixes.
 
         Examples:
         - users.noreply.github.com -> github.com
         - tnap-dev-vm-mangala.tnaplab.telekom.de -> telekom.de
         - contractor.linuxfoundation.org -> linuxfoundation.org
-        - zte.com.cn -> zte.com.cn (preserved due to configuration)
+        - zte.com.cn -> zte.com.cn (com.cn is a public suffix)
+        - lab.example.co.uk -> example.co.uk
         - simple.com -> simple.com (unchanged for 2-part domains)
         - localhost -> localhost (unchanged for single-part domains)
-        """
-        if not full_domain or full_domain in ["unknown", "localhost", ""]:
-            return full_domain
-
-        # Load domain configuration (with caching)
-        if not hasattr(self, "_domain_config"):
-            self._domain_config = self._load_domain_config()
-
-        # Check if domain should be preserved in full
-        if full_domain in self._domain_config.get("preserve_full_domain", []):
-            return full_domain
-
-        # Check for custom mappings
-        custom_mappings = self._domain_config.get("custom_mappings", {})
-        if full_domain in custom_mappings:
-            return str(custom_mappings[full_domain])
-
-        # Split domain into parts
-        parts = full_domain.split(".")
 
-        # If 2 or fewer parts, return as-is
-        if len(parts) <= 2:
-            return full_domain
-
-        # Return last two parts
-        return ".".join(parts[-2:])
+        Results are cached per domain in the run-wide identity table.
+        """
+        return self.identities.organization(full_domain)
 
     def _load_domain_config(self) -> dict:
         """Load organizational domain configuration from YAML file."""
@@ -918,258 +1101,488 @@ class GitDataCollector:
         """
         Normalize author identity with consistent format.
 
+        - Name trimmed, "Unknown" when missing
         - Email lowercase and trimmed
-        - Username heuristic from email local part
         - Handle malformed emails gracefully
-        - Domain extraction for organization analysis
+
+        Each distinct raw identity is normalized once per run (see identity.py).
         """
-        # Clean and normalize inputs
-        clean_name = name.strip() if name else "Unknown"
-        clean_email = email.lower().strip() if email else ""
+        identity = self.identities.resolve(name, email)
+        return (identity.name, identity.email)
+
+    def _get_author_metrics(
+        self, name: str, email: str, metrics: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Return the per-author metrics record for a raw identity, creating it if needed."""
+        identity = self.identities.resolve(name, email)
+        norm_name, norm_email = identity.name, identity.email
+
+        if norm_email not in metrics["authors"]:
+            metrics["authors"][norm_email] = {
+                "name": norm_name,
+                "email": norm_email,
+                "username": norm_name.split()[0] if norm_name else "",
+                "domain": identity.domain,
+                "commit_counts": {window: 0 for window in self.time_windows},
+                "loc_stats": {
+                    window: {"added": 0, "removed": 0, "net": 0}
+                    for window in self.time_windows
+                },
+                "repositories": {window: 0 for window in self.time_windows},
+            }
 
-        # Handle empty or malformed emails
-        if not clean_email or "@" not in clean_email:
-            unknown_placeholder = self.config.get("data_quality", {}).get(
+        return cast(Dict[str, Any], metrics["authors"][norm_email])
+
+    def _collection_settings(self) -> dict[str, Any]:
+        """Collector settings that change the window-agnostic aggregates."""
+        settings = {
+            "skip_binary_changes": self.skip_binary_changes,
+            "unknown_email_placeholder": self.config.get("data_quality", {}).get(
                 "unknown_email_placeholder", "unknown@unknown"
-            )
-            clean_email = unknown_placeholder
+            ),
+        }
+        # Only recorded when enabled, so states stored without them stay valid
+        if self.attribution.enabled:
+            settings["co_author_attribution"] = self.attribution.mode
+            settings["credit_sign_offs"] = self.attribution.credit_sign_offs
+        if self.ref_patterns:
+            settings["ref_patterns"] = self.ref_patterns
+            settings["branch_breakdown"] = self.branch_breakdown
+        if self.exclude_paths:
+            settings["exclude_paths"] = self.exclude_paths
+        return settings
+
+    def _record_cache_lookup(self, hit: bool) -> None:
+        with self._cache_lock:
+            if hit:
+                self._cache_hits += 1
+            else:
+                self._cache_misses += 1
 
-        normalized = {
-            "name": clean_name,
-            "email": clean_email,
-            "username": "",
-            "domain": "",
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Return hit/miss counters of the git metrics cache for this run."""
+        with self._cache_lock:
+            hits, misses = self._cache_hits, self._cache_misses
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups * 100, 1) if lookups else 0.0,
         }
 
-        # Extract username and domain from email
-        if "@" in clean_email:
-            # Always split on the LAST @ symbol to handle complex email addresses
-            parts = clean_email.split("@")
-            if len(parts) >= 2:
-                normalized["username"] = "@".join(parts[:-1])
-                normalized["domain"] = parts[-1].lower()
-            else:
-                # Shouldn't happen since we checked for @ above, but be safe
-                normalized["username"] = clean_email
-                normalized["domain"] = ""
+    def _get_head_commit(self, repo_path: Path) -> Optional[str]:
+        """
+        Return the SHA of HEAD, or None for empty/broken repositories.
 
-        return (normalized["name"], normalized["email"])
+        HEAD is read from the ref files (see git_refs.py); the git backend is
+        only used for layouts the reader does not handle, such as reftable.
+        """
+        return read_head_commit(repo_path) or self.git_backend.resolve_ref(
+            repo_path, "HEAD"
+        )
 
-    def _parse_git_log_output(
-        self, git_output: str, repo_name: str
-    ) -> List[Dict[str, Any]]:
+    def history_key(self, repo_path: Path) -> Optional[str]:
         """
-        Parse git log output into structured commit data.
+        Return a key identifying the analysed history of a repository.
 
-        Expected format from git log --numstat --date=iso --pretty=format:%H|%ad|%an|%ae|%s
+        The HEAD SHA already commits to the whole history behind it, so
+        repositories with equal keys yield identical git metrics. With
+        branch patterns the matching branch tips are part of the key. None
+        for empty repositories and unreadable refs.
         """
-        commits = []
-        lines = git_output.strip().split("\n")
-        current_commit = None
+        head = self._get_head_commit(repo_path)
+        if not head or not self.ref_patterns:
+            return head
+        tips = self._get_ref_tips(repo_path)
+        if tips is None:
+            return None
+        return " ".join([head] + [f"{name}={sha}" for name, sha in sorted(tips.items())])
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+    def _get_ref_tips(self, repo_path: Path) -> Optional[Dict[str, str]]:
+        """
+        Return refname -> SHA of the refs matching the branch patterns.
 
-            # Check if this is a commit header line (contains |)
-            if "|" in line and len(line.split("|")) >= 5:
-                # Save previous commit if exists
-                if current_commit:
-                    commits.append(current_commit)
+        Read from the ref files; None when they cannot be read (reftable),
+        in which case the repository is walked without stored state.
+        """
+        refs = list_refs(repo_path)
+        if refs is None:
+            return None
+        return match_refs(refs, self.ref_patterns)
 
-                # Parse commit header: hash|date|author_name|author_email|subject
-                parts = line.split("|", 4)
-                try:
-                    commit_date = parse_git_iso_date(parts[1])
-                    if commit_date.tzinfo is None:
-                        commit_date = commit_date.replace(tzinfo=datetime.timezone.utc)
-                except (ValueError, IndexError) as e:
-                    self.logger.warning(
-                        f"Invalid date format in {repo_name}: {parts[1] if len(parts) > 1 else 'unknown'} - {e}"
-                    )
+    def _can_extend_state(self, repo_path: Path, state: RepoState, head: str) -> bool:
+        """
+        Check whether stored aggregates can be extended to ``head``.
+
+        Requires identical collector settings and the stored HEAD to be an
+        ancestor of the current one; rewritten history forces a full walk.
+        """
+        if state.settings != self._collection_settings():
+            self.logger.debug(f"Collector settings changed since state of {repo_path.name}")
+            return False
+        is_ancestor = self.git_backend.is_ancestor(repo_path, state.head, head)
+        if not is_ancestor:
+            self.logger.info(
+                f"History of {repo_path.name} was rewritten since {state.head[:12]}, "
+                "falling back to a full walk"
+            )
+        return is_ancestor
+
+    def _seed_from_state(
+        self, state: RepoState, metrics: dict[str, Any]
+    ) -> RepoActivity:
+        """Recreate author records from stored state and return its activity."""
+        for email, name in state.author_names.items():
+            self._get_author_metrics(name, email, metrics)
+        return state.activity
+
+    def _collect_ownership(
+        self,
+        repo_path: Path,
+        gerrit_project: str,
+        revision: str,
+        tree: List[TreeEntry],
+        hotspots: Optional[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """
+        Blame the ownership sample of a repository and return its ownership.
+
+        Files whose (path, blob SHA) is in the blame cache are not blamed
+        again. Once the repository time budget is spent, uncached files are
+        skipped and the result is flagged as partial.
+        """
+        churned_paths: List[str] = []
+        if self.ownership_sample == "churn" and self.time_windows:
+            widest = max(
+                self.time_windows, key=lambda name: self.time_windows[name].get("days", 0)
+            )
+            churned_paths = hottest_paths(hotspots, widest)
+        sample = select_ownership_sample(
+            tree,
+            self.ownership_max_files,
+            self.ownership_max_file_bytes,
+            churned_paths,
+            self.exclude_paths,
+        )
+
+        cached = self.state_store.load_blames(gerrit_project) if self.state_store else {}
+        blames: Dict[tuple[str, str], BlameCounts] = {}
+        deadline = self._repo_deadline()
+        partial = False
+        for entry in sample:
+            key = (entry.path, entry.oid)
+            counts = cached.get(key)
+            if counts is None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    partial = True
+                    continue
+                counts = self.git_backend.blame(
+                    repo_path, entry.path, revision, timeout=remaining
+                )
+                if counts is None:
                     continue
+            blames[key] = counts
+        if self.state_store and blames.keys() != cached.keys():
+            self.state_store.save_blames(gerrit_project, blames)
+
+        ownership = {
+            "sample": self.ownership_sample,
+            "files": len(blames),
+            "blamed_files": sum(1 for key in blames if key not in cached),
+            **ownership_metrics(blames.values(), self.identities),
+        }
+        if partial:
+            ownership["partial"] = True
+        return ownership
+
+    def _repo_deadline(self) -> float:
+        """Return the time.time() by which the current repository walk must end."""
+        deadline = time.time() + self.repo_timeout
+        if self.phase_deadline is not None:
+            deadline = min(deadline, self.phase_deadline)
+        return deadline
+
+    def _walk_git_log(
+        self,
+        repo_path: Path,
+        revision_range: Optional[str],
+        metrics: dict[str, Any],
+        activity: RepoActivity,
+        deadline: Optional[float] = None,
+        hotspots: Optional[HotspotAccumulator] = None,
+    ) -> GitLogWalk:
+        """
+        Walk git log for ``revision_range`` and merge it into ``activity``.
 
-                current_commit = {
-                    "hash": parts[0],
-                    "date": commit_date,
-                    "author_name": parts[2],
-                    "author_email": parts[3],
-                    "subject": parts[4] if len(parts) > 4 else "",
-                    "files_changed": [],
-                }
-            else:
-                # Parse numstat lines (format: added<tab>removed<tab>filename)
-                parts = line.split("\t")
-                if len(parts) >= 3 and current_commit:
-                    try:
-                        # Handle binary files (marked with -)
-                        added = 0 if parts[0] == "-" else int(parts[0])
-                        removed = 0 if parts[1] == "-" else int(parts[1])
-                        filename = parts[2]
-
-                        # Skip binary files if configured
-                        if self.config.get("data_quality", {}).get(
-                            "skip_binary_changes", True
-                        ):
-                            if parts[0] == "-" or parts[1] == "-":
-                                continue
-
-                        files_changed = current_commit["files_changed"]
-                        assert isinstance(files_changed, list)
-                        files_changed.append(
-                            {
-                                "filename": filename,
-                                "added": added,
-                                "removed": removed,
-                            }
-                        )
-                    except (ValueError, IndexError):
-                        # Skip malformed lines
-                        continue
+        The walk is done by the configured git backend, on ``walk_executor``
+        when one is set, otherwise in the calling thread (see walk_git_log).
 
-        # Don't forget the last commit
-        if current_commit:
-            commits.append(current_commit)
+        Returns:
+            The walk, with its aggregates already merged; callers use its
+            commit count, tip date, error, partial flag and hotspots
+        """
+        walk = self._run_walk(
+            repo_path,
+            revision_range,
+            deadline,
+            hotspots=hotspots,
+            attribution=self.attribution,
+            ref_patterns=self.ref_patterns or None,
+            by_ref=self.branch_breakdown,
+        )
 
-        return commits
+        if walk.invalid_records:
+            self.logger.warning(
+                f"Skipped {walk.invalid_records} commits with invalid dates in {repo_path.name}"
+            )
 
-    def _update_commit_metrics(
-        self, commit: dict[str, Any], metrics: dict[str, Any]
-    ) -> None:
-        """Process a single commit into the metrics structure."""
-        applicable_windows = self.bucket_commit_into_windows(
-            commit["date"], self.time_windows
+        self._merge_walk(walk, metrics, activity)
+        return walk
+
+    def _run_walk(
+        self,
+        repo_path: Path,
+        revision_range: Optional[str],
+        deadline: Optional[float],
+        **options: Any,
+    ) -> GitLogWalk:
+        """Run a backend walk on ``walk_executor`` or in the calling thread."""
+        options.setdefault("exclude_paths", self.exclude_paths)
+        if self.walk_executor is not None:
+            return self.walk_executor.submit(
+                self.git_backend.walk_log,
+                repo_path,
+                revision_range,
+                self.skip_binary_changes,
+                deadline=deadline,
+                **options,
+            ).result()
+        return self.git_backend.walk_log(
+            repo_path,
+            revision_range,
+            self.skip_binary_changes,
+            deadline=deadline,
+            **options,
         )
 
-        # Normalize author identity
-        norm_name, norm_email = self.normalize_author_identity(
-            commit["author_name"], commit["author_email"]
+    def _new_hotspots(self) -> Optional[HotspotAccumulator]:
+        """Return an empty hotspot accumulator, or None when hotspots are disabled."""
+        if not self.hotspots_enabled:
+            return None
+        return HotspotAccumulator(
+            {
+                window: window_start_day(window_data)
+                for window, window_data in self.time_windows.items()
+            },
+            int(self.hotspot_config.get("capacity", DEFAULT_HOTSPOT_CAPACITY)),
         )
-        author_email = norm_email
-
-        # Create author info dict for compatibility
-        author_info = {
-            "name": norm_name,
-            "email": norm_email,
-            "username": norm_name.split()[0] if norm_name else "",
-            "domain": self.extract_organizational_domain(norm_email.split("@")[-1])
-            if "@" in norm_email
-            else "",
+
+    def _hotspot_key(self, hotspots: HotspotAccumulator) -> Dict[str, Any]:
+        """Return what a stored hotspots report must have been computed for."""
+        return {
+            "window_days": hotspots.window_days,
+            "capacity": hotspots.capacity,
+            "top_n": int(self.hotspot_config.get("top_n", DEFAULT_HOTSPOT_TOP_N)),
         }
 
-        # Calculate LOC changes for this commit
-        total_added = sum(f["added"] for f in commit["files_changed"])
-        total_removed = sum(f["removed"] for f in commit["files_changed"])
-        net_lines = total_added - total_removed
-
-        # Update repository metrics for each matching window
-        for window in applicable_windows:
-            metrics["repository"]["commit_counts"][window] += 1
-            metrics["repository"]["loc_stats"][window]["added"] += total_added
-            metrics["repository"]["loc_stats"][window]["removed"] += total_removed
-            metrics["repository"]["loc_stats"][window]["net"] += net_lines
-            metrics["repository"]["unique_contributors"][window].add(author_email)
-
-        # Update author metrics
-        if author_email not in metrics["authors"]:
-            metrics["authors"][author_email] = {
-                "name": author_info["name"],
-                "email": author_email,
-                "username": author_info["username"],
-                "domain": author_info["domain"],
-                "commit_counts": {window: 0 for window in self.time_windows},
-                "loc_stats": {
-                    window: {"added": 0, "removed": 0, "net": 0}
-                    for window in self.time_windows
-                },
-                "repositories": {window: set() for window in self.time_windows},
-            }
+    def _walk_hotspots(
+        self, repo_path: Path, head: Optional[str], hotspots: HotspotAccumulator
+    ) -> Optional[GitLogWalk]:
+        """
+        Fill ``hotspots`` with a walk limited to the widest time window.
 
-        # Update author metrics for each matching window
-        author_metrics = metrics["authors"][author_email]
-        for window in applicable_windows:
-            author_metrics["commit_counts"][window] += 1
-            author_metrics["loc_stats"][window]["added"] += total_added
-            author_metrics["loc_stats"][window]["removed"] += total_removed
-            author_metrics["loc_stats"][window]["net"] += net_lines
-            author_metrics["repositories"][window].add(
-                metrics["repository"]["gerrit_project"]
-            )
+        Used when the repository totals come from stored state without a
+        usable hotspots report, so only the commits inside the windows are
+        diffed again.
+        """
+        earliest_day = hotspots.earliest_day
+        walk = self._run_walk(
+            repo_path,
+            None if self.ref_patterns else head,
+            self._repo_deadline(),
+            hotspots=hotspots,
+            ref_patterns=self.ref_patterns or None,
+            since=earliest_day * DAY_SECONDS if earliest_day is not None else None,
+        )
+        if walk.error is not None:
+            self.logger.warning(f"Hotspot walk failed for {repo_path.name}: {walk.error}")
+            return None
+        return walk
 
-    def _finalize_repo_metrics(self, metrics: dict[str, Any], repo_name: str) -> None:
-        """Finalize repository metrics after processing all commits."""
-        repo_metrics = metrics["repository"]
+    def _mark_partial(
+        self, metrics: dict[str, Any], walk: GitLogWalk, repo_name: str
+    ) -> None:
+        """Flag a repository whose history walk was stopped by its time budget."""
+        cutoff = None
+        if walk.cutoff_epoch is not None:
+            cutoff = datetime.datetime.fromtimestamp(
+                walk.cutoff_epoch, datetime.timezone.utc
+            ).isoformat()
+        metrics["repository"]["partial"] = True
+        metrics["repository"]["history_cutoff"] = cutoff
+        self.logger.warning(
+            f"Time budget exceeded for {repo_name}: keeping {walk.commit_count} "
+            f"commits back to {cutoff or 'no commit'}"
+        )
 
-        # Check if repository has any commits at all
-        if repo_metrics.get("has_any_commits", False):
-            # Repository has commits - find last commit date
-            git_command = ["git", "log", "-1", "--date=iso", "--pretty=format:%ad"]
-            success, output = safe_git_command(
-                git_command, Path(repo_metrics["local_path"]), self.logger
-            )
+    def _merge_walk(
+        self, walk: GitLogWalk, metrics: dict[str, Any], activity: RepoActivity
+    ) -> None:
+        """
+        Merge the aggregates of a walk into ``activity``.
 
-            if success and output.strip():
-                try:
-                    last_commit_date = parse_git_iso_date(output.strip())
-                    if last_commit_date.tzinfo is None:
-                        last_commit_date = last_commit_date.replace(
-                            tzinfo=datetime.timezone.utc
-                        )
+        Raw identities are normalized once each; histograms of raw identities
+        sharing a normalized email are merged into one author histogram.
+        Identities that only appear in uncredited trailers have empty
+        histograms and are skipped. Per-ref histograms are merged by short
+        branch name.
+        """
+        if activity.repository:
+            activity.repository.merge(walk.repository)
+        else:
+            activity.repository = walk.repository
+        for name, email, histogram in zip(
+            walk.author_names, walk.author_emails, walk.author_histograms
+        ):
+            if not histogram:
+                continue
+            norm_email = self._get_author_metrics(name, email, metrics)["email"]
+            existing = activity.authors.get(norm_email)
+            if existing is None:
+                activity.authors[norm_email] = histogram
+            else:
+                existing.merge(histogram)
+        for ref_name, histogram in zip(walk.ref_names, walk.ref_histograms):
+            if histogram:
+                activity.branch(short_ref_name(ref_name)).merge(histogram)
 
-                    repo_metrics["last_commit_timestamp"] = last_commit_date.isoformat()
+    def _apply_time_windows(
+        self, metrics: dict[str, Any], activity: RepoActivity
+    ) -> None:
+        """
+        Answer every configured time window from the activity histograms.
 
-                    # Calculate days since last commit
-                    now = datetime.datetime.now(datetime.timezone.utc)
-                    days_since = (now - last_commit_date).days
-                    repo_metrics["days_since_last_commit"] = days_since
+        Windows are day-aligned (see activity.py); each window costs one
+        binary search per histogram.
+        """
+        repo_metrics = metrics["repository"]
+        window_days = {
+            window: window_start_day(window_data)
+            for window, window_data in self.time_windows.items()
+        }
 
-                    # Determine activity status using unified thresholds
-                    current_threshold = self.config.get("activity_thresholds", {}).get(
-                        "current_days", 365
-                    )
-                    active_threshold = self.config.get("activity_thresholds", {}).get(
-                        "active_days", 1095
-                    )
+        for window, start_day in window_days.items():
+            commits, added, removed = activity.repository.totals(start_day)
+            repo_metrics["commit_counts"][window] = commits
+            repo_metrics["loc_stats"][window] = {
+                "added": added,
+                "removed": removed,
+                "net": added - removed,
+            }
+            repo_metrics["unique_contributors"][window] = 0
+
+        for author_email, histogram in activity.authors.items():
+            author_metrics = metrics["authors"][author_email]
+            for window, start_day in window_days.items():
+                commits, added, removed = histogram.totals(start_day)
+                author_metrics["commit_counts"][window] = commits
+                author_metrics["loc_stats"][window] = {
+                    "added": added,
+                    "removed": removed,
+                    "net": added - removed,
+                }
+                author_metrics["repositories"][window] = 1 if commits else 0
+                if commits:
+                    repo_metrics["unique_contributors"][window] += 1
+
+        if self.branch_breakdown:
+            branches = {}
+            for name in sorted(activity.branches):
+                histogram = activity.branches[name]
+                commit_counts = {}
+                loc_stats = {}
+                for window, start_day in window_days.items():
+                    commits, added, removed = histogram.totals(start_day)
+                    commit_counts[window] = commits
+                    loc_stats[window] = {
+                        "added": added,
+                        "removed": removed,
+                        "net": added - removed,
+                    }
+                branches[name] = {"commit_counts": commit_counts, "loc_stats": loc_stats}
+            repo_metrics["branches"] = branches
+
+    def _finalize_repo_metrics(
+        self,
+        metrics: dict[str, Any],
+        repo_name: str,
+        last_commit_epoch: Optional[int] = None,
+        last_commit_offset: Optional[int] = None,
+    ) -> None:
+        """
+        Finalize repository metrics after processing all commits.
+
+        ``last_commit_epoch`` is the author date of HEAD, taken from the
+        parsed log or the stored repository state; with branch patterns it is
+        the newest tip of the walked branches, so activity on a maintenance
+        branch keeps the repository active. It is reported in the
+        author's UTC offset (``last_commit_offset``, minutes), as git shows
+        it; UTC when the offset is unknown.
+        """
+        repo_metrics = metrics["repository"]
 
-                    has_recent_commits = any(
-                        count > 0 for count in repo_metrics["commit_counts"].values()
-                    )
+        # Check if repository has any commits at all
+        if repo_metrics.get("has_any_commits", False):
+            # Repository has commits - report last commit date
+            if last_commit_epoch is not None:
+                # Report boundary: the only place a datetime is built
+                tz = datetime.timezone.utc
+                if last_commit_offset is not None:
+                    tz = datetime.timezone(datetime.timedelta(minutes=last_commit_offset))
+                repo_metrics["last_commit_timestamp"] = datetime.datetime.fromtimestamp(
+                    last_commit_epoch, tz
+                ).isoformat()
+
+                # Calculate days since last commit
+                days_since = (int(time.time()) - last_commit_epoch) // 86400
+                repo_metrics["days_since_last_commit"] = days_since
+
+                # Determine activity status using unified thresholds
+                current_threshold = self.config.get("activity_thresholds", {}).get(
+                    "current_days", 365
+                )
+                active_threshold = self.config.get("activity_thresholds", {}).get(
+                    "active_days", 1095
+                )
 
-                    if has_recent_commits and days_since <= current_threshold:
-                        repo_metrics["activity_status"] = "current"
-                    elif has_recent_commits and days_since <= active_threshold:
-                        repo_metrics["activity_status"] = "active"
-                    else:
-                        repo_metrics["activity_status"] = "inactive"
+                has_recent_commits = any(
+                    count > 0 for count in repo_metrics["commit_counts"].values()
+                )
 
-                    # Log appropriate message based on activity
-                    if any(
-                        count > 0 for count in repo_metrics["commit_counts"].values()
-                    ):
-                        self.logger.debug(
-                            f"Repository {repo_name} has {repo_metrics['total_commits_ever']} commits ({sum(repo_metrics['commit_counts'].values())} recent)"
-                        )
-                    else:
-                        self.logger.debug(
-                            f"Repository {repo_name} has {repo_metrics['total_commits_ever']} commits (all historical, none recent)"
-                        )
+                if has_recent_commits and days_since <= current_threshold:
+                    repo_metrics["activity_status"] = "current"
+                elif has_recent_commits and days_since <= active_threshold:
+                    repo_metrics["activity_status"] = "active"
+                else:
+                    repo_metrics["activity_status"] = "inactive"
 
-                except ValueError as e:
-                    self.logger.warning(
-                        f"Could not parse last commit date for {repo_name}: {e}"
+                # Log appropriate message based on activity
+                if any(
+                    count > 0 for count in repo_metrics["commit_counts"].values()
+                ):
+                    self.logger.debug(
+                        f"Repository {repo_name} has {repo_metrics['total_commits_ever']} commits ({sum(repo_metrics['commit_counts'].values())} recent)"
                     )
+                else:
+                    self.logger.debug(
+                        f"Repository {repo_name} has {repo_metrics['total_commits_ever']} commits (all historical, none recent)"
+                    )
+
         else:
             # Truly no commits - empty repository
             self.logger.info(f"Repository {repo_name} has no commits")
 
-        # Convert author repository sets to counts for JSON serialization
-        for author_email, author_data in metrics["authors"].items():
-            for window in self.time_windows:
-                author_data["repositories"][window] = len(
-                    author_data["repositories"][window]
-                )
-
         # Embed authors data in repository record for aggregation
         repo_authors = []
         for author_email, author_data in metrics["authors"].items():
@@ -1197,84 +1610,3 @@ class GitDataCollector:
             repo_authors.append(author_record)
 
         metrics["repository"]["authors"] = repo_authors
-
-    def _get_repo_cache_key(self, repo_path: Path) -> Optional[str]:
-        """Generate a cache key based on the repository's HEAD commit hash."""
-        git_command = ["git", "rev-parse", "HEAD"]
-        success, output = safe_git_command(git_command, repo_path, self.logger)
-
-        if success and output.strip():
-            head_hash = output.strip()
-            # Include time windows in cache key to invalidate when windows change
-            windows_key = hashlib.sha256(
-                json.dumps(self.time_windows, sort_keys=True).encode()
-            ).hexdigest()[:8]
-            project_name = self._extract_gerrit_project(repo_path)
-            # Replace path separators for cache key
-            safe_project_name = project_name.replace("/", "_")
-            return f"{safe_project_name}_{head_hash}_{windows_key}"
-
-        return None
-
-    def _get_cache_path(self, repo_path: Path) -> Optional[Path]:
-        """Get the cache file path for a repository."""
-        if not self.cache_dir:
-            return None
-
-        cache_key = self._get_repo_cache_key(repo_path)
-        if cache_key:
-            return self.cache_dir / f"{cache_key}.json"
-
-        return None
-
-    def _load_from_cache(self, repo_path: Path) -> Optional[Dict[str, Any]]:
-        """Load cached metrics for a repository if available and valid."""
-        try:
-            cache_path = self._get_cache_path(repo_path)
-            if not cache_path or not cache_path.exists():
-                return None
-
-            with open(cache_path, "r", encoding="utf-8") as f:
-                cached_data = json.load(f)
-
-            # Validate cache structure
-            if not isinstance(cached_data, dict) or "repository" not in cached_data:
-                project_name = self._extract_gerrit_project(repo_path)
-                self.logger.warning(f"Invalid cache structure for {project_name}")
-                return None
-
-            # Check if cache is compatible with current time windows
-            cached_windows = set(
-                cached_data.get("repository", {}).get("commit_counts", {}).keys()
-            )
-            current_windows = set(self.time_windows.keys())
-
-            if cached_windows != current_windows:
-                self.logger.debug(
-                    f"Cache invalidated for {repo_path.name}: time windows changed"
-                )
-                return None
-
-            return cached_data
-
-        except (json.JSONDecodeError, IOError, KeyError) as e:
-            self.logger.debug(f"Failed to load cache for {repo_path.name}: {e}")
-            return None
-
-    def _save_cached_metrics(self, repo_path: Path, metrics: dict[str, Any]) -> None:
-        """Save metrics to cache for future use."""
-        try:
-            cache_path = self._get_cache_path(repo_path)
-            if not cache_path:
-                return
-
-            # Create a cache-friendly copy (convert sets to lists if any remain)
-            cache_data = json.loads(json.dumps(metrics, default=str))
-
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, indent=2, default=str)
-
-            self.logger.debug(f"Saved cache for {repo_path.name}")
-
-        except (IOError, TypeError) as e:
-            self.logger.warning(f"Failed to save cache for {repo_path.name}: {e}")
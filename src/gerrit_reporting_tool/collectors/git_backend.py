@@ -0,0 +1,1103 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Git access backends.
+
+Everything the collectors need from a repository goes through a small
+GitBackend interface:
+
+- walk_log: the history walk with per-commit numstat totals, folded into
+  daily histograms (GitLogWalk)
+- resolve_ref / is_ancestor: ref resolution and ancestry checks
+- list_tree / blob_size: tree listing and object sizes
+- list_tags: every tag with its creation date, in one pass
+- blame: surviving lines of one file per author
+
+Two implementations are provided:
+
+- ``cli`` (default): spawns git and parses its machine-oriented output
+  (see git_log.py). Works wherever git is installed.
+- ``pygit2``: reads the object database in-process through libgit2. No
+  process is spawned per call, which matters for the many small calls made
+  per repository (ref resolution, ancestry checks, object sizes). Requires
+  the optional pygit2 package.
+
+The backend is selected with ``performance.git_backend``. Backends hold no
+per-repository state and can be pickled, so walks can run in a process pool.
+"""
+
+import io
+import logging
+import subprocess
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, cast
+
+from util.git import safe_git_command
+
+from .activity import DAY_SECONDS, DailyHistogram
+from .attribution import (
+    ATTRIBUTION_SPLIT,
+    AttributionPolicy,
+    parse_message_trailers,
+    parse_trailer_identity,
+)
+from .commit_batch import AuthorTable, CommitBatch
+from .git_log import GitLogParser, RefSources, build_git_log_command, is_excluded_path
+from .git_refs import match_refs
+from .hotspots import HotspotAccumulator
+from .releases import TagEntry
+
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None  # type: ignore[assignment]
+
+
+# Default limit for a single git command, in seconds
+DEFAULT_GIT_TIMEOUT = 300.0
+
+
+class GitCommandStream:
+    """
+    Stream the stdout of a git command line by line through a pipe.
+
+    Unlike safe_git_command, the output is never held in memory as a whole:
+    callers iterate over the stream and process each line as git produces it.
+    With text=False the stream yields bytes and iter_chunks() gives access to
+    raw blocks for parsers that do their own framing (e.g. NUL-delimited
+    output). stderr is spooled to a temporary file so a chatty command can
+    never block on a full stderr pipe while stdout is being consumed.
+
+    cancel() kills the command from the consumer side (e.g. when a time
+    budget runs out); the timeout watchdog kills it the same way, so a reader
+    blocked on a hung command sees end-of-file instead of waiting forever.
+
+    Usage:
+        with GitCommandStream(cmd, repo_path, logger) as stream:
+            for line in stream:
+                ...
+        if not stream.success:
+            handle(stream.error)
+    """
+
+    def __init__(
+        self,
+        cmd: list[str],
+        cwd: Path | None,
+        logger: logging.Logger,
+        timeout: float = DEFAULT_GIT_TIMEOUT,
+        text: bool = True,
+    ) -> None:
+        self.cmd = cmd
+        self.cwd = cwd
+        self.logger = logger
+        self.timeout = timeout
+        self.text = text
+        self.returncode: Optional[int] = None
+        self.error = ""
+        self.timed_out = False
+        self.cancelled = False
+        self._process: Optional[subprocess.Popen] = None
+        self._stderr: Optional[IO[bytes]] = None
+        self._timer: Optional[threading.Timer] = None
+
+    @property
+    def success(self) -> bool:
+        """True once the command has exited cleanly."""
+        return (
+            self.returncode == 0
+            and not self.timed_out
+            and not self.cancelled
+            and not self.error
+        )
+
+    @property
+    def interrupted(self) -> bool:
+        """True if the command was stopped by its timeout or by cancel()."""
+        return self.timed_out or self.cancelled
+
+    def cancel(self) -> None:
+        """Stop the command; output produced so far remains valid."""
+        if self._process is not None and self._process.poll() is None:
+            self.cancelled = True
+            self._process.kill()
+
+    def __enter__(self) -> "GitCommandStream":
+        self._stderr = tempfile.TemporaryFile()
+        text_options: dict[str, Any] = (
+            {"text": True, "encoding": "utf-8", "errors": "replace"} if self.text else {}
+        )
+        try:
+            self._process = subprocess.Popen(
+                self.cmd,
+                cwd=self.cwd,
+                stdout=subprocess.PIPE,
+                stderr=self._stderr,
+                stdin=subprocess.DEVNULL,
+                **text_options,
+            )
+        except Exception as e:
+            self.logger.error(f"Unexpected error running git command in {self.cwd}: {e}")
+            self.error = str(e)
+            return self
+
+        # The pipe is read incrementally, so the timeout is enforced by a
+        # watchdog that kills the process; the reader then sees end-of-file.
+        self._timer = threading.Timer(self.timeout, self._kill_on_timeout)
+        self._timer.daemon = True
+        self._timer.start()
+        return self
+
+    def __iter__(self) -> Iterator[str]:
+        if self._process is None or self._process.stdout is None:
+            return
+        for line in self._process.stdout:
+            yield line
+
+    def iter_chunks(self, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+        """Yield raw stdout blocks as they become available (text=False only)."""
+        if self.text:
+            raise ValueError("iter_chunks requires a stream opened with text=False")
+        if self._process is None or self._process.stdout is None:
+            return
+        read = cast(io.BufferedReader, self._process.stdout).read1
+        while True:
+            chunk = read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._timer:
+            self._timer.cancel()
+
+        process = self._process
+        if process is not None:
+            if process.poll() is None and exc_type is not None:
+                # Consumer bailed out early; do not wait for the full history
+                process.kill()
+            if process.stdout:
+                process.stdout.close()
+            self.returncode = process.wait()
+
+            if self.timed_out:
+                self.error = "Command timed out"
+                self.logger.error(
+                    f"Git command timed out in {self.cwd}: {' '.join(self.cmd)}"
+                )
+            elif self.cancelled:
+                self.error = "Command cancelled"
+                self.logger.debug(
+                    f"Git command cancelled in {self.cwd}: {' '.join(self.cmd)}"
+                )
+            elif self.returncode != 0:
+                self.error = self._read_stderr() or f"exit status {self.returncode}"
+                self.logger.debug(
+                    f"Git command failed in {self.cwd}: {' '.join(self.cmd)} - {self.error}"
+                )
+
+        if self._stderr:
+            self._stderr.close()
+
+    def _kill_on_timeout(self) -> None:
+        if self._process is not None and self._process.poll() is None:
+            self.timed_out = True
+            self._process.kill()
+
+    def _read_stderr(self) -> str:
+        if not self._stderr:
+            return ""
+        self._stderr.seek(0)
+        return self._stderr.read().decode("utf-8", errors="replace").strip()
+
+
+@dataclass
+class GitLogWalk:
+    """
+    Compact aggregates of one git log walk.
+
+    Authors are kept as raw identities, as interned by the parser; the caller
+    normalizes them with the run-wide identity table. Everything here is
+    plain data, so a walk can run in a worker process and be pickled back.
+
+    Attributes:
+        commit_count: Number of commits walked
+        tip_epoch: Author date of the first commit in the log, i.e. the tip
+            of the walked range. With ref patterns this is the newest tip of
+            all walked refs, not necessarily HEAD
+        tip_offset: UTC offset of that author date in minutes
+        error: Error message of a failed git command, or None
+        invalid_records: Commits skipped because of an unparseable date
+        partial: The walk was stopped by its deadline before reaching the
+            end of the range; the aggregates cover the newest commits only
+        cutoff_epoch: Author date of the last commit folded before the walk
+            was stopped (None when complete or when nothing was folded)
+        repository: Per-day histogram of the repository
+        author_names: Raw author name per parser author id
+        author_emails: Raw author email per parser author id
+        author_histograms: Per-day histogram per parser author id
+        hotspots: Per-window churn aggregates, when requested
+        attribution: Policy crediting trailer identities in the author
+            histograms; None credits the commit author only
+        co_authored_commits: Commits that credited at least one identity
+            besides the author
+        ref_names: Walked ref names in precedence order, when a per-ref
+            breakdown was requested (see RefSources)
+        ref_histograms: Per-day histogram per walked ref
+    """
+
+    commit_count: int = 0
+    tip_epoch: Optional[int] = None
+    tip_offset: Optional[int] = None
+    error: Optional[str] = None
+    invalid_records: int = 0
+    partial: bool = False
+    cutoff_epoch: Optional[int] = None
+    repository: DailyHistogram = field(default_factory=DailyHistogram)
+    author_names: List[str] = field(default_factory=list)
+    author_emails: List[str] = field(default_factory=list)
+    author_histograms: List[DailyHistogram] = field(default_factory=list)
+    hotspots: Optional[HotspotAccumulator] = None
+    attribution: Optional[AttributionPolicy] = None
+    co_authored_commits: int = 0
+    ref_names: List[str] = field(default_factory=list)
+    ref_histograms: List[DailyHistogram] = field(default_factory=list)
+    last_epoch: Optional[int] = None
+
+    def fold(self, batch: CommitBatch) -> None:
+        """
+        Fold a batch of parsed commits into the daily histograms.
+
+        Runs directly over the batch's parallel arrays. Per-commit work is
+        independent of the number of configured time windows.
+        """
+        if not len(batch):
+            return
+        if self.tip_epoch is None:
+            self.tip_epoch = batch.timestamps[0]
+        self.commit_count += len(batch)
+        self.last_epoch = batch.timestamps[-1]
+
+        authors = batch.authors
+        for author_id in range(len(self.author_histograms), len(authors)):
+            self.author_names.append(authors.names[author_id])
+            self.author_emails.append(authors.emails[author_id])
+            self.author_histograms.append(DailyHistogram())
+
+        repo_histogram = self.repository
+        author_histograms = self.author_histograms
+        for timestamp, author_id, added, removed in zip(
+            batch.timestamps, batch.author_ids, batch.added, batch.removed
+        ):
+            day = timestamp // DAY_SECONDS
+            repo_histogram.add(day, added, removed)
+            author_histograms[author_id].add(day, added, removed)
+
+        if batch.keep_trailers and self.attribution is not None:
+            self._credit_trailers(batch)
+
+        if batch.sources is not None:
+            for source_id in range(len(self.ref_histograms), len(batch.sources)):
+                self.ref_names.append(batch.sources[source_id])
+                self.ref_histograms.append(DailyHistogram())
+            ref_histograms = self.ref_histograms
+            for timestamp, source_id, added, removed in zip(
+                batch.timestamps, batch.source_ids, batch.added, batch.removed
+            ):
+                ref_histograms[source_id].add(timestamp // DAY_SECONDS, added, removed)
+
+        if self.hotspots is not None:
+            self.hotspots.fold(batch)
+
+    def _credit_trailers(self, batch: CommitBatch) -> None:
+        """
+        Credit the trailer identities of a batch under the attribution policy.
+
+        The author was already credited in full by fold; under the split
+        policy the author's share of the lines is taken back here.
+        """
+        policy = self.attribution
+        assert policy is not None
+        split = policy.mode == ATTRIBUTION_SPLIT
+        emails = batch.authors.emails
+        offsets = batch.trailer_offsets
+        histograms = self.author_histograms
+        for index in range(len(batch)):
+            start, end = offsets[index], offsets[index + 1]
+            if start == end:
+                continue
+            author_id = batch.author_ids[index]
+            seen = {emails[author_id].lower()}
+            credited = []
+            for position in range(start, end):
+                trailer_id = batch.trailer_ids[position]
+                email = emails[trailer_id].lower()
+                if email in seen or not policy.credits(batch.trailer_kinds[position]):
+                    continue
+                seen.add(email)
+                credited.append(trailer_id)
+            if not credited:
+                continue
+
+            self.co_authored_commits += 1
+            day = batch.timestamps[index] // DAY_SECONDS
+            added = batch.added[index]
+            removed = batch.removed[index]
+            if split:
+                shares = len(credited) + 1
+                share_added, share_removed = added // shares, removed // shares
+                # The author keeps the remainder of the even split
+                histograms[author_id].add(
+                    day,
+                    share_added + added % shares - added,
+                    share_removed + removed % shares - removed,
+                    commits=0,
+                )
+                added, removed = share_added, share_removed
+            for trailer_id in credited:
+                histograms[trailer_id].add(day, added, removed)
+
+
+def walk_git_log(
+    repo_path: Path,
+    revision_range: Optional[str],
+    skip_binary_changes: bool,
+    logger: Optional[logging.Logger] = None,
+    deadline: Optional[float] = None,
+    hotspots: Optional[HotspotAccumulator] = None,
+    since: Optional[int] = None,
+    attribution: Optional[AttributionPolicy] = None,
+    ref_patterns: Optional[Sequence[str]] = None,
+    by_ref: bool = False,
+    exclude_paths: Optional[Sequence[str]] = None,
+) -> GitLogWalk:
+    """
+    Stream git log for ``revision_range`` and fold it into daily histograms.
+
+    Each batch of commits is folded as soon as it has been parsed, so memory
+    is bounded by one batch plus the active days rather than by the size of
+    the repository history. This is the CPU-bound part of collection; it is a
+    module-level function so it can be submitted to a process pool.
+
+    ``deadline`` (a time.time() value) bounds the walk: the reader checks it
+    after every chunk and cancels git once it has passed, and the stream's
+    watchdog fires at the same moment in case git hangs without output.
+    Commits completed before that point are kept and the walk is flagged as
+    partial; git log emits newest commits first, so the aggregates cover the
+    history back to ``cutoff_epoch``.
+
+    With ``hotspots``, per-file numstat entries are kept and folded into the
+    accumulator, which is returned in the walk. ``since`` (epoch seconds)
+    limits the walk to recent commits. With an enabled ``attribution``
+    policy, Co-authored-by/Signed-off-by trailers are read in the same pass
+    and credited in the author histograms.
+
+    ``ref_patterns`` adds the matching refs to the walk (one git log for
+    all of them; shared commits are visited once). ``by_ref`` additionally
+    assigns every commit to the first ref it is reachable from, with
+    ``revision_range`` (HEAD by default) first and the matching refs in name
+    order; resolving the tips costs one ``git for-each-ref``.
+
+    Files matching ``exclude_paths`` (see git_log.compile_exclude_paths) are
+    left out of the numstat by git itself; every commit is still counted.
+    """
+    logger = logger or logging.getLogger(__name__)
+    trailers = attribution is not None and attribution.enabled
+    walk = GitLogWalk(hotspots=hotspots, attribution=attribution if trailers else None)
+    timeout = DEFAULT_GIT_TIMEOUT
+    if deadline is not None:
+        timeout = deadline - time.time()
+        if timeout <= 0:
+            walk.partial = True
+            return walk
+
+    ref_sources = None
+    if by_ref:
+        ref_sources = RefSources(
+            resolve_walk_tips(repo_path, revision_range, ref_patterns or (), logger)
+        )
+    parser = GitLogParser(
+        skip_binary_changes=skip_binary_changes,
+        keep_files=hotspots is not None,
+        parse_trailers=trailers,
+        ref_sources=ref_sources,
+    )
+    with GitCommandStream(
+        build_git_log_command(
+            revision_range, since, trailers, ref_patterns, by_ref, exclude_paths
+        ),
+        repo_path,
+        logger,
+        timeout=timeout,
+        text=False,
+    ) as stream:
+        stopped = False
+        for chunk in stream.iter_chunks():
+            for batch in parser.feed(chunk):
+                walk.fold(batch)
+            if deadline is not None and time.time() >= deadline:
+                stream.cancel()
+                stopped = True
+                break
+        stopped = stopped or stream.interrupted
+        # A truncated stream ends inside a commit whose numstat is incomplete
+        for batch in parser.abort() if stopped else parser.close():
+            walk.fold(batch)
+
+    walk.invalid_records = parser.invalid_records
+    walk.tip_offset = parser.tip_offset
+    if stopped:
+        walk.partial = True
+        walk.cutoff_epoch = walk.last_epoch
+    elif not stream.success:
+        walk.error = stream.error
+    return walk
+
+
+def resolve_walk_tips(
+    repo_path: Path,
+    revision_range: Optional[str],
+    ref_patterns: Sequence[str],
+    logger: logging.Logger,
+) -> List[tuple[str, bytes]]:
+    """
+    Return the (name, commit hash) tips of a multi-ref walk in precedence order.
+
+    The walked revision (HEAD by default, the new end of ``old..new``) comes
+    first, then the refs matching ``ref_patterns`` by name. Tags are peeled
+    to their commits.
+    """
+    name = (revision_range or "HEAD").split("..")[-1] or "HEAD"
+    tips: List[tuple[str, bytes]] = []
+    success, output = safe_git_command(
+        ["git", "rev-parse", "--verify", "-q", f"{name}^{{commit}}"], repo_path, logger
+    )
+    if success and output.strip():
+        tips.append((name, output.strip().encode("ascii")))
+
+    success, output = safe_git_command(
+        ["git", "for-each-ref", "--format=%(objectname) %(*objectname) %(refname)"],
+        repo_path,
+        logger,
+    )
+    if not success:
+        return tips
+    refs: Dict[str, str] = {}
+    for line in output.splitlines():
+        objectname, peeled, refname = line.split(" ", 2)
+        refs[refname] = peeled or objectname
+    for refname, sha in sorted(match_refs(refs, ref_patterns).items()):
+        tips.append((refname, sha.encode("ascii")))
+    return tips
+
+
+@dataclass(frozen=True)
+class TreeEntry:
+    """
+    One entry of a recursive tree listing.
+
+    Attributes:
+        path: Path relative to the repository root
+        mode: File mode (e.g. 0o100644, 0o120000 for symlinks, 0o160000 for
+            submodules)
+        type: Object type ("blob", or "commit" for submodules)
+        oid: Object name
+        size: Blob size in bytes (None for submodules)
+    """
+
+    path: str
+    mode: int
+    type: str
+    oid: str
+    size: Optional[int]
+
+
+class GitBackend(ABC):
+    """
+    Interface to the git operations used by the collectors.
+
+    Implementations must stay picklable (no open repository handles kept
+    between calls) so that walk_log can be submitted to a process pool.
+    """
+
+    name = ""
+
+    def __init__(self, logger: Optional[logging.Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(__name__)
+
+    @abstractmethod
+    def walk_log(
+        self,
+        repo_path: Path,
+        revision_range: Optional[str],
+        skip_binary_changes: bool,
+        deadline: Optional[float] = None,
+        hotspots: Optional[HotspotAccumulator] = None,
+        since: Optional[int] = None,
+        attribution: Optional[AttributionPolicy] = None,
+        ref_patterns: Optional[Sequence[str]] = None,
+        by_ref: bool = False,
+        exclude_paths: Optional[Sequence[str]] = None,
+    ) -> GitLogWalk:
+        """
+        Walk the history of ``revision_range`` (HEAD when None) with numstat.
+
+        ``revision_range`` is a single revision or ``old..new``. Merge
+        commits count as commits without line changes, like git log without
+        -m. See walk_git_log for the meaning of ``deadline``, ``hotspots``,
+        ``since``, ``attribution``, ``ref_patterns``, ``by_ref`` and
+        ``exclude_paths``.
+        """
+
+    @abstractmethod
+    def resolve_ref(self, repo_path: Path, ref: str) -> Optional[str]:
+        """Return the commit SHA ``ref`` resolves to, or None."""
+
+    @abstractmethod
+    def is_ancestor(self, repo_path: Path, ancestor: str, descendant: str) -> bool:
+        """Return True if ``ancestor`` is reachable from (or equal to) ``descendant``."""
+
+    @abstractmethod
+    def list_tree(self, repo_path: Path, revision: str = "HEAD") -> List[TreeEntry]:
+        """Return every non-tree entry of ``revision``'s tree, recursively."""
+
+    @abstractmethod
+    def blob_size(self, repo_path: Path, oid: str) -> Optional[int]:
+        """Return the size of object ``oid`` in bytes, or None if it is missing."""
+
+    @abstractmethod
+    def list_tags(self, repo_path: Path) -> List[TagEntry]:
+        """
+        Return every tag with its creation date.
+
+        The date is the tagger date of annotated tags and the committer date
+        of lightweight tags. Tags without a date (for example tags of trees)
+        are left out.
+        """
+
+    @abstractmethod
+    def blame(
+        self,
+        repo_path: Path,
+        path: str,
+        revision: str = "HEAD",
+        timeout: float = DEFAULT_GIT_TIMEOUT,
+    ) -> Optional[Dict[Tuple[str, str], int]]:
+        """
+        Return the lines of ``path`` at ``revision`` per raw (author name, email).
+
+        Each line is credited to the author of the commit that last changed
+        it. None if the file cannot be blamed or ``timeout`` expires.
+        """
+
+
+class CliGitBackend(GitBackend):
+    """Backend running the git command line."""
+
+    name = "cli"
+
+    def walk_log(
+        self,
+        repo_path: Path,
+        revision_range: Optional[str],
+        skip_binary_changes: bool,
+        deadline: Optional[float] = None,
+        hotspots: Optional[HotspotAccumulator] = None,
+        since: Optional[int] = None,
+        attribution: Optional[AttributionPolicy] = None,
+        ref_patterns: Optional[Sequence[str]] = None,
+        by_ref: bool = False,
+        exclude_paths: Optional[Sequence[str]] = None,
+    ) -> GitLogWalk:
+        return walk_git_log(
+            repo_path,
+            revision_range,
+            skip_binary_changes,
+            self.logger,
+            deadline=deadline,
+            hotspots=hotspots,
+            since=since,
+            attribution=attribution,
+            ref_patterns=ref_patterns,
+            by_ref=by_ref,
+            exclude_paths=exclude_paths,
+        )
+
+    def resolve_ref(self, repo_path: Path, ref: str) -> Optional[str]:
+        success, output = safe_git_command(
+            ["git", "rev-parse", "--verify", "-q", f"{ref}^{{commit}}"],
+            repo_path,
+            self.logger,
+        )
+        return output.strip() if success and output.strip() else None
+
+    def is_ancestor(self, repo_path: Path, ancestor: str, descendant: str) -> bool:
+        success, _ = safe_git_command(
+            ["git", "merge-base", "--is-ancestor", ancestor, descendant],
+            repo_path,
+            self.logger,
+        )
+        return success
+
+    def list_tree(self, repo_path: Path, revision: str = "HEAD") -> List[TreeEntry]:
+        entries: List[TreeEntry] = []
+        pending = b""
+        with GitCommandStream(
+            ["git", "ls-tree", "-r", "-l", "-z", revision],
+            repo_path,
+            self.logger,
+            text=False,
+        ) as stream:
+            for chunk in stream.iter_chunks():
+                records = (pending + chunk).split(b"\0")
+                pending = records.pop()
+                entries.extend(_parse_ls_tree_record(record) for record in records)
+        if not stream.success:
+            self.logger.debug(f"Cannot list tree {revision} of {repo_path}: {stream.error}")
+            return []
+        return entries
+
+    def blob_size(self, repo_path: Path, oid: str) -> Optional[int]:
+        success, output = safe_git_command(
+            ["git", "cat-file", "-s", oid], repo_path, self.logger
+        )
+        if not success:
+            return None
+        try:
+            return int(output)
+        except ValueError:
+            return None
+
+    def list_tags(self, repo_path: Path) -> List[TagEntry]:
+        # One process for all tags; ref names cannot contain control
+        # characters, so NUL and newline are safe separators
+        success, output = safe_git_command(
+            [
+                "git",
+                "for-each-ref",
+                "--format=%(refname:strip=2)%00%(creatordate:unix)",
+                "refs/tags",
+            ],
+            repo_path,
+            self.logger,
+        )
+        if not success:
+            self.logger.debug(f"Cannot list tags of {repo_path}: {output}")
+            return []
+        tags: List[TagEntry] = []
+        for line in output.splitlines():
+            name, _, epoch = line.partition("\0")
+            if epoch.isdigit():
+                tags.append(TagEntry(name, int(epoch)))
+        return tags
+
+    def blame(
+        self,
+        repo_path: Path,
+        path: str,
+        revision: str = "HEAD",
+        timeout: float = DEFAULT_GIT_TIMEOUT,
+    ) -> Optional[Dict[Tuple[str, str], int]]:
+        with GitCommandStream(
+            ["git", "blame", "--porcelain", revision, "--", path],
+            repo_path,
+            self.logger,
+            timeout=timeout,
+            text=False,
+        ) as stream:
+            output = b"".join(stream.iter_chunks())
+        if not stream.success:
+            self.logger.debug(f"Cannot blame {path} in {repo_path}: {stream.error}")
+            return None
+        return _parse_blame_porcelain(output.split(b"\n"))
+
+
+def _parse_blame_porcelain(lines: Iterable[bytes]) -> Dict[Tuple[str, str], int]:
+    """
+    Count the lines of ``git blame --porcelain`` output per author.
+
+    Every blamed line is a ``<sha> <orig> <final> [<count>]`` header followed
+    by the TAB-prefixed content; the author fields follow the header only
+    the first time a commit appears.
+    """
+    line_counts: Dict[bytes, int] = {}
+    names: Dict[bytes, bytes] = {}
+    emails: Dict[bytes, bytes] = {}
+    commit = b""
+    for line in lines:
+        if line.startswith(b"\t"):
+            line_counts[commit] = line_counts.get(commit, 0) + 1
+        elif line.startswith(b"author "):
+            names[commit] = line[7:]
+        elif line.startswith(b"author-mail "):
+            emails[commit] = line[12:].strip(b"<>")
+        else:
+            token = line.split(b" ", 1)[0]
+            if len(token) in (40, 64):
+                commit = token
+    authors: Dict[Tuple[str, str], int] = {}
+    for commit, count in line_counts.items():
+        key = (
+            names.get(commit, b"").decode("utf-8", errors="replace"),
+            emails.get(commit, b"").decode("utf-8", errors="replace"),
+        )
+        authors[key] = authors.get(key, 0) + count
+    return authors
+
+
+def _parse_ls_tree_record(record: bytes) -> TreeEntry:
+    """Parse ``<mode> SP <type> SP <object> SP+ <size> TAB <path>``."""
+    meta, _, path = record.partition(b"\t")
+    mode, object_type, oid, size = meta.split(None, 3)
+    return TreeEntry(
+        path=path.decode("utf-8", errors="replace"),
+        mode=int(mode, 8),
+        type=object_type.decode("ascii"),
+        oid=oid.decode("ascii"),
+        size=None if size == b"-" else int(size),
+    )
+
+
+class Pygit2GitBackend(GitBackend):
+    """
+    Backend reading repositories in-process with libgit2 (pygit2).
+
+    Commits are walked in commit-date order like git log. Each non-merge
+    commit is diffed against its first parent (root commits against the
+    empty tree) with rename detection, as git log --numstat does. Binary
+    files contribute no line counts in either backend, so
+    ``skip_binary_changes`` does not change the totals. libgit2 diffs take
+    no pathspec, so ``exclude_paths`` is matched against each delta with
+    git's pathspec rules (git_log.is_excluded_path).
+    """
+
+    name = "pygit2"
+
+    # Commits walked between two checks of the deadline
+    DEADLINE_CHECK_INTERVAL = 256
+
+    def __init__(self, logger: Optional[logging.Logger] = None) -> None:
+        if pygit2 is None:
+            raise ImportError(
+                "pygit2 is required for the pygit2 git backend. "
+                "Install it with: pip install pygit2"
+            )
+        super().__init__(logger)
+
+    def walk_log(
+        self,
+        repo_path: Path,
+        revision_range: Optional[str],
+        skip_binary_changes: bool,
+        deadline: Optional[float] = None,
+        hotspots: Optional[HotspotAccumulator] = None,
+        since: Optional[int] = None,
+        attribution: Optional[AttributionPolicy] = None,
+        ref_patterns: Optional[Sequence[str]] = None,
+        by_ref: bool = False,
+        exclude_paths: Optional[Sequence[str]] = None,
+    ) -> GitLogWalk:
+        trailers = attribution is not None and attribution.enabled
+        walk = GitLogWalk(
+            hotspots=hotspots, attribution=attribution if trailers else None
+        )
+        if deadline is not None and time.time() >= deadline:
+            walk.partial = True
+            return walk
+
+        keep_files = hotspots is not None
+        try:
+            repo = pygit2.Repository(str(repo_path))
+            authors = AuthorTable()
+            walker, tips = self._walker(repo, revision_range, ref_patterns, by_ref)
+            ref_sources = RefSources(tips) if by_ref else None
+            sources = ref_sources.names if ref_sources is not None else None
+            batch = CommitBatch(authors, keep_files, trailers, sources)
+            for count, commit in enumerate(walker, 1):
+                if since is not None and commit.commit_time < since:
+                    break
+                source_id = 0
+                if ref_sources is not None:
+                    source_id = ref_sources.visit(
+                        str(commit.id).encode("ascii"),
+                        [str(parent).encode("ascii") for parent in commit.parent_ids],
+                    )
+                files = None
+                if keep_files or exclude_paths:
+                    files = self._file_stats(commit, skip_binary_changes, exclude_paths)
+                if files is None:
+                    added, removed = self._line_totals(commit)
+                else:
+                    added = sum(entry[1] for entry in files)
+                    removed = sum(entry[2] for entry in files)
+                author = commit.author
+                if count == 1:
+                    walk.tip_offset = author.offset
+                batch.append_commit(
+                    str(commit.id).encode("ascii"),
+                    author.time,
+                    authors.intern(author.raw_name, author.raw_email),
+                    added,
+                    removed,
+                    files if keep_files else None,
+                    self._trailers(commit, authors) if trailers else None,
+                    source_id,
+                )
+                if len(batch) >= GitLogParser.DEFAULT_BATCH_SIZE:
+                    walk.fold(batch)
+                    batch = CommitBatch(authors, keep_files, trailers, sources)
+                if (
+                    deadline is not None
+                    and count % self.DEADLINE_CHECK_INTERVAL == 0
+                    and time.time() >= deadline
+                ):
+                    walk.partial = True
+                    break
+            walk.fold(batch)
+        except (pygit2.GitError, KeyError, ValueError) as e:
+            self.logger.debug(f"pygit2 walk failed in {repo_path}: {e}")
+            return GitLogWalk(error=str(e))
+
+        if walk.partial:
+            walk.cutoff_epoch = walk.last_epoch
+        return walk
+
+    def resolve_ref(self, repo_path: Path, ref: str) -> Optional[str]:
+        try:
+            repo = pygit2.Repository(str(repo_path))
+            return str(repo.revparse_single(ref).peel(pygit2.Commit).id)
+        except (pygit2.GitError, KeyError, ValueError):
+            return None
+
+    def is_ancestor(self, repo_path: Path, ancestor: str, descendant: str) -> bool:
+        try:
+            repo = pygit2.Repository(str(repo_path))
+            ancestor_id = repo.revparse_single(ancestor).peel(pygit2.Commit).id
+            descendant_id = repo.revparse_single(descendant).peel(pygit2.Commit).id
+            return ancestor_id == descendant_id or repo.descendant_of(
+                descendant_id, ancestor_id
+            )
+        except (pygit2.GitError, KeyError, ValueError):
+            return False
+
+    def list_tree(self, repo_path: Path, revision: str = "HEAD") -> List[TreeEntry]:
+        try:
+            repo = pygit2.Repository(str(repo_path))
+            tree = repo.revparse_single(revision).peel(pygit2.Tree)
+        except (pygit2.GitError, KeyError, ValueError) as e:
+            self.logger.debug(f"Cannot list tree {revision} of {repo_path}: {e}")
+            return []
+        entries: List[TreeEntry] = []
+        self._list_tree(repo, tree, "", entries)
+        return entries
+
+    def blob_size(self, repo_path: Path, oid: str) -> Optional[int]:
+        try:
+            repo = pygit2.Repository(str(repo_path))
+            return int(repo.odb.read_header(oid)[1])
+        except (pygit2.GitError, KeyError, ValueError):
+            return None
+
+    def list_tags(self, repo_path: Path) -> List[TagEntry]:
+        try:
+            repo = pygit2.Repository(str(repo_path))
+            names = [name for name in repo.references if name.startswith("refs/tags/")]
+        except pygit2.GitError as e:
+            self.logger.debug(f"Cannot list tags of {repo_path}: {e}")
+            return []
+        tags: List[TagEntry] = []
+        for name in names:
+            try:
+                reference = repo.references[name]
+                target = repo[reference.target]
+                if isinstance(target, pygit2.Tag):
+                    # Old tags may have no tagger, which the pygit2 stubs do not allow for
+                    tagger = cast(Optional[pygit2.Signature], target.tagger)
+                    if tagger is None:
+                        continue
+                    epoch = tagger.time
+                else:
+                    # Lightweight tags of trees or blobs fail to peel and are skipped
+                    epoch = reference.peel(pygit2.Commit).commit_time
+            except (pygit2.GitError, KeyError, ValueError):
+                continue
+            tags.append(TagEntry(name[len("refs/tags/"):], int(epoch)))
+        return tags
+
+    def blame(
+        self,
+        repo_path: Path,
+        path: str,
+        revision: str = "HEAD",
+        timeout: float = DEFAULT_GIT_TIMEOUT,
+    ) -> Optional[Dict[Tuple[str, str], int]]:
+        # libgit2 blames in-process and cannot be interrupted, so the
+        # timeout is not enforced here
+        try:
+            repo = pygit2.Repository(str(repo_path))
+            newest = repo.revparse_single(revision).peel(pygit2.Commit).id
+            hunks = repo.blame(path, newest_commit=newest)
+            authors: Dict[Tuple[str, str], int] = {}
+            for hunk in hunks:
+                # final_committer is the author signature of the final commit
+                signature = hunk.final_committer
+                key = (signature.name, signature.email) if signature else ("", "")
+                authors[key] = authors.get(key, 0) + hunk.lines_in_hunk
+        except (pygit2.GitError, KeyError, ValueError) as e:
+            self.logger.debug(f"Cannot blame {path} in {repo_path}: {e}")
+            return None
+        return authors
+
+    @staticmethod
+    def _walker(
+        repo: Any,
+        revision_range: Optional[str],
+        ref_patterns: Optional[Sequence[str]],
+        topological: bool = False,
+    ) -> tuple[Any, List[tuple[str, bytes]]]:
+        """
+        Return a commit-date ordered walker for a revision or ``old..new``.
+
+        Refs matching ``ref_patterns`` are pushed as further tips. Also
+        returns the (name, commit hash) tips in precedence order, as
+        resolve_walk_tips does. ``topological`` never yields a parent
+        before its children, like git log --date-order.
+        """
+        sort = pygit2.enums.SortMode.TIME
+        if topological:
+            sort |= pygit2.enums.SortMode.TOPOLOGICAL
+        if revision_range and ".." in revision_range:
+            old, new = revision_range.split("..", 1)
+            tip_name = new or "HEAD"
+            walker = repo.walk(repo.revparse_single(tip_name).peel(pygit2.Commit).id, sort)
+            walker.hide(repo.revparse_single(old or "HEAD").peel(pygit2.Commit).id)
+        else:
+            tip_name = revision_range or "HEAD"
+            walker = repo.walk(repo.revparse_single(tip_name).peel(pygit2.Commit).id, sort)
+        tip = repo.revparse_single(tip_name).peel(pygit2.Commit).id
+        tips = [(tip_name, str(tip).encode("ascii"))]
+
+        if ref_patterns:
+            names = {name: name for name in repo.references}
+            for name in sorted(match_refs(names, ref_patterns)):
+                try:
+                    tip = repo.references[name].peel(pygit2.Commit).id
+                except (pygit2.GitError, KeyError, ValueError):
+                    continue
+                walker.push(tip)
+                tips.append((name, str(tip).encode("ascii")))
+        return walker, tips
+
+    @staticmethod
+    def _diff(commit: Any) -> Any:
+        """Return the rename-aware diff against the first parent, None for merges."""
+        parent_ids = commit.parent_ids
+        if len(parent_ids) > 1:
+            return None
+        if parent_ids:
+            diff = commit.parents[0].tree.diff_to_tree(commit.tree)
+        else:
+            diff = commit.tree.diff_to_tree(swap=True)
+        diff.find_similar(pygit2.enums.DiffFind.FIND_RENAMES)
+        return diff
+
+    def _line_totals(self, commit: Any) -> tuple[int, int]:
+        """Return (added, removed) of a commit against its first parent."""
+        diff = self._diff(commit)
+        if diff is None:
+            return 0, 0
+        stats = diff.stats
+        return stats.insertions, stats.deletions
+
+    def _file_stats(
+        self,
+        commit: Any,
+        skip_binary_changes: bool,
+        exclude_paths: Optional[Sequence[str]] = None,
+    ) -> List[tuple[bytes, int, int]]:
+        """
+        Return numstat-like (path, added, removed) entries of a commit.
+
+        Excluded deltas are dropped before their patch is generated, so
+        their blobs are never diffed.
+        """
+        diff = self._diff(commit)
+        if diff is None:
+            return []
+        files = []
+        for index, delta in enumerate(diff.deltas):
+            if exclude_paths and is_excluded_path(delta.new_file.path, exclude_paths):
+                continue
+            patch = diff[index]
+            if patch.delta.is_binary and skip_binary_changes:
+                continue
+            _, added, removed = patch.line_stats
+            files.append((delta.new_file.raw_path, added, removed))
+        return files
+
+    @staticmethod
+    def _trailers(commit: Any, authors: AuthorTable) -> List[tuple[int, int]]:
+        """Return the (kind, author id) trailer identities of a commit."""
+        trailers = []
+        for kind, value in parse_message_trailers(commit.raw_message):
+            identity = parse_trailer_identity(value)
+            if identity is not None:
+                trailers.append((kind, authors.intern(*identity)))
+        return trailers
+
+    def _list_tree(
+        self, repo: Any, tree: Any, prefix: str, entries: List[TreeEntry]
+    ) -> None:
+        odb = repo.odb
+        for entry in tree:
+            path = prefix + entry.name
+            if entry.type_str == "tree":
+                self._list_tree(repo, repo[entry.id], path + "/", entries)
+                continue
+            size = None
+            if entry.type_str == "blob":
+                size = int(odb.read_header(entry.id)[1])
+            entries.append(
+                TreeEntry(path, entry.filemode, entry.type_str, str(entry.id), size)
+            )
+
+
+# Backends selectable with performance.git_backend
+GIT_BACKENDS: Dict[str, Type[GitBackend]] = {
+    CliGitBackend.name: CliGitBackend,
+    Pygit2GitBackend.name: Pygit2GitBackend,
+}
+
+DEFAULT_GIT_BACKEND = CliGitBackend.name
+
+
+def get_git_backend(
+    name: Optional[str] = None, logger: Optional[logging.Logger] = None
+) -> GitBackend:
+    """
+    Create the git backend called ``name``.
+
+    Falls back to the CLI backend, with a warning, when the requested backend
+    needs an optional package that is not installed.
+
+    Raises:
+        ValueError: If ``name`` is not a known backend
+    """
+    logger = logger or logging.getLogger(__name__)
+    backend_class = GIT_BACKENDS.get(name or DEFAULT_GIT_BACKEND)
+    if backend_class is None:
+        raise ValueError(
+            f"Unknown git backend '{name}' (expected one of: {', '.join(GIT_BACKENDS)})"
+        )
+    try:
+        return backend_class(logger)
+    except ImportError as e:
+        logger.warning(f"{e}; falling back to the {DEFAULT_GIT_BACKEND} git backend")
+        return CliGitBackend(logger)
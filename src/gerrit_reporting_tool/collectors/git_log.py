@@ -0,0 +1,465 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+NUL-delimited git log format and bytes-level incremental parser.
+
+The collector asks git for a machine-oriented log: every field is terminated
+by a NUL byte and every commit record starts with an ASCII record separator
+(0x1e). Combined with ``-z``, numstat entries and file names are NUL
+terminated as well, so no field value (author names, file names containing
+tabs or "|", etc.) can ever be confused with a delimiter.
+
+The parser works on raw bytes as they arrive from the pipe and only decodes
+the few fields the metrics actually need (author name and email). The
+author date is requested in git's raw format (``<epoch> <+hhmm>``) and carried
+as a plain int; only the UTC offset of the first commit, the tip, is kept for
+the report. datetime objects are only built at the report boundary. File names are kept
+as raw bytes: git paths are not guaranteed to be UTF-8 and no metric looks at
+them.
+
+Co-authored-by and Signed-off-by trailers can be requested as one extra
+header field (GIT_LOG_TRAILERS_FORMAT). git does the trailer detection and
+unfolding itself; entries are separated by 0x1f, which cannot occur in a
+trailer. Commits without trailers cost one empty field.
+
+Several branches can be walked in one invocation (``ref_patterns``). git's
+revision walk visits every commit once however many tips reach it, so
+shared history is counted once. For a per-branch breakdown the parents are
+added as another header field and the walk is put in ``--date-order`` (no
+parent before all of its children); RefSources then derives the branch of
+every commit while streaming.
+
+Vendored or generated files can be left out of the line counts with
+exclude pathspecs (``data_quality.exclude_paths``), passed to git log as
+``:(exclude)<pattern>`` so git never diffs those files. A pathspec normally
+also hides the commits that only touch excluded files and, at merges,
+whole side branches that do not change the included files;
+``--full-history --sparse`` keeps the walk identical to an unfiltered one,
+those commits are reported with no numstat entries.
+
+Parsed commits are accumulated into columnar CommitBatch objects (see
+commit_batch.py) rather than materialized as dicts.
+"""
+
+from fnmatch import fnmatchcase
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .attribution import parse_trailer_field, parse_trailer_identity
+from .commit_batch import AuthorTable, CommitBatch
+from .git_refs import expand_ref_pattern
+
+
+# Record separator placed in front of every commit header
+RECORD_START = b"\x1e"
+
+# hash, author date (raw: epoch seconds and UTC offset), author name, author
+# email - each NUL terminated
+GIT_LOG_FORMAT = "%x1e%H%x00%ad%x00%an%x00%ae%x00"
+
+# Separator between the entries of the trailers field
+TRAILER_SEPARATOR = b"\x1f"
+
+# Extra header field: "Key: value" trailers joined by TRAILER_SEPARATOR
+GIT_LOG_TRAILERS_FORMAT = (
+    "%(trailers:key=Co-authored-by,key=Signed-off-by,unfold,separator=%x1f)%x00"
+)
+
+# Extra header field: space-separated parent hashes
+GIT_LOG_PARENTS_FORMAT = "%P%x00"
+
+# Pathspec magic of an exclude pattern; the long form and both short forms
+EXCLUDE_MAGIC = (":(exclude)", ":!", ":^")
+
+# Number of NUL-terminated fields in a commit header (including the hash)
+_HEADER_FIELDS = 4
+
+
+def parse_utc_offset(raw: bytes) -> Optional[int]:
+    """Return a ``+hhmm``/``-hhmm`` offset in minutes east of UTC, or None."""
+    if len(raw) != 5 or raw[:1] not in (b"+", b"-") or not raw[1:].isdigit():
+        return None
+    minutes = int(raw[1:3]) * 60 + int(raw[3:5])
+    return -minutes if raw[:1] == b"-" else minutes
+
+
+def compile_exclude_paths(patterns: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """
+    Normalize ``data_quality.exclude_paths`` to plain pathspec patterns.
+
+    Patterns may be written with their exclude magic (``:(exclude)vendor``,
+    ``:!vendor``), which is stripped; build_git_log_command adds it back.
+
+    Raises:
+        ValueError: If a pattern is empty or uses other pathspec magic
+    """
+    compiled = []
+    for pattern in patterns or ():
+        for magic in EXCLUDE_MAGIC:
+            if pattern.startswith(magic):
+                pattern = pattern[len(magic):]
+                break
+        if not pattern or pattern.startswith(":"):
+            raise ValueError(f"Invalid data_quality.exclude_paths pattern {pattern!r}")
+        compiled.append(pattern)
+    return tuple(compiled)
+
+
+def is_excluded_path(path: str, patterns: Sequence[str]) -> bool:
+    """
+    Return True if ``path`` matches one of the exclude ``patterns``.
+
+    Follows git's pathspec rules without magic: a pattern matches the path
+    itself and everything below it as a directory, and wildcards match
+    across ``/`` (``*.pb.go`` excludes generated files at any depth).
+    """
+    for pattern in patterns:
+        prefix = pattern.rstrip("/")
+        if path == prefix or path.startswith(prefix + "/") or fnmatchcase(path, pattern):
+            return True
+    return False
+
+
+def build_git_log_command(
+    revision_range: Optional[str] = None,
+    since: Optional[int] = None,
+    trailers: bool = False,
+    ref_patterns: Optional[Sequence[str]] = None,
+    parents: bool = False,
+    exclude_paths: Optional[Sequence[str]] = None,
+) -> list[str]:
+    """
+    Return the git log invocation understood by GitLogParser.
+
+    Args:
+        revision_range: Revision or range to walk (e.g. ``old..new``);
+            defaults to HEAD
+        since: Stop at commits committed before this epoch
+        trailers: Add the trailers field (parse with ``parse_trailers``)
+        ref_patterns: Also walk the refs matching these patterns (see
+            git_refs.expand_ref_pattern)
+        parents: Add the parents field in date order (parse with
+            ``ref_sources``)
+        exclude_paths: Leave files matching these patterns (see
+            compile_exclude_paths) out of the numstat entries
+    """
+    log_format = GIT_LOG_FORMAT
+    if parents:
+        log_format += GIT_LOG_PARENTS_FORMAT
+    if trailers:
+        log_format += GIT_LOG_TRAILERS_FORMAT
+    command = [
+        "git",
+        "log",
+        "-z",
+        "--numstat",
+        "--date=raw",
+        f"--pretty=format:{log_format}",
+    ]
+    if parents:
+        command.append("--date-order")
+    if since is not None:
+        command.append(f"--since=@{since}")
+    if revision_range:
+        command.append(revision_range)
+    if ref_patterns:
+        if not revision_range:
+            command.append("HEAD")
+        command.extend(f"--glob={expand_ref_pattern(p)}" for p in ref_patterns)
+    if exclude_paths:
+        command.extend(["--full-history", "--sparse", "--"])
+        command.extend(f"{EXCLUDE_MAGIC[0]}{p}" for p in exclude_paths)
+    return command
+
+
+class RefSources:
+    """
+    Assigns every commit of a multi-ref walk to one of the walked refs.
+
+    Refs are given in precedence order (HEAD first). A commit belongs to the
+    first ref it is reachable from: the ref's id is propagated from each
+    commit to its parents, keeping the smallest id. Commits must be visited
+    children first (``git log --date-order``); then a commit's id is final
+    when it is visited, and only the not yet visited parents of visited
+    commits are held in memory.
+
+    Args:
+        tips: (ref name, tip commit hash) in precedence order
+    """
+
+    __slots__ = ("names", "_pending")
+
+    def __init__(self, tips: Sequence[Tuple[str, bytes]]) -> None:
+        self.names: List[str] = [name for name, _ in tips]
+        # Hash of a commit not visited yet -> smallest ref id reaching it
+        self._pending: Dict[bytes, int] = {}
+        for ref_id, (_, sha) in enumerate(tips):
+            self._pending.setdefault(sha, ref_id)
+
+    def visit(self, sha: bytes, parents: Sequence[bytes]) -> int:
+        """Return the ref id of a commit and propagate it to its parents."""
+        pending = self._pending
+        ref_id = pending.pop(sha, 0)
+        for parent in parents:
+            current = pending.get(parent)
+            if current is None or ref_id < current:
+                pending[parent] = ref_id
+        return ref_id
+
+
+class GitLogParser:
+    """
+    Incremental parser for ``git log -z --numstat`` output in GIT_LOG_FORMAT.
+
+    Feed it arbitrary byte chunks (they do not need to be aligned with record
+    boundaries). Commits are appended to a CommitBatch, and a batch is yielded
+    once it holds ``batch_size`` complete commits; the final, partial batch is
+    yielded by close(). Configuration-driven decisions are made once when the
+    parser is created rather than for every numstat line.
+
+    Author identities are interned in ``self.authors``, which is shared by all
+    batches produced by the parser. With ``parse_trailers`` the identities
+    named in Co-authored-by/Signed-off-by trailers are interned there too and
+    stored per commit (see CommitBatch.trailers). With ``ref_sources`` the
+    parents field is parsed and the branch of every commit is stored (see
+    CommitBatch.source_ids). ``tip_offset`` is the UTC offset in minutes of
+    the first commit's author date, once it has been parsed.
+    """
+
+    DEFAULT_BATCH_SIZE = 4096
+
+    def __init__(
+        self,
+        skip_binary_changes: bool = True,
+        keep_files: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        parse_trailers: bool = False,
+        ref_sources: Optional[RefSources] = None,
+    ) -> None:
+        self.skip_binary_changes = skip_binary_changes
+        self.keep_files = keep_files
+        self.parse_trailers = parse_trailers
+        self.batch_size = max(1, batch_size)
+        self.authors = AuthorTable()
+        self.ref_sources = ref_sources
+        self.sources = ref_sources.names if ref_sources is not None else None
+        self.invalid_records = 0
+        self.tip_offset: Optional[int] = None
+        self._tip_parsed = False
+
+        self._pending = b""
+        self._header: List[bytes] = []
+        parse_parents = ref_sources is not None
+        self._parents_index = _HEADER_FIELDS if parse_parents else None
+        self._trailer_index = (
+            _HEADER_FIELDS + int(parse_parents) if parse_trailers else None
+        )
+        self._header_fields = _HEADER_FIELDS + int(parse_parents) + int(parse_trailers)
+        # Raw trailers field -> interned (kind, author id) pairs
+        self._trailer_fields: Dict[bytes, List[Tuple[int, int]]] = {}
+        self._batch = self._new_batch()
+        # (sha, timestamp, author id, trailers, source id) of the commit being
+        # parsed; None while skipping the numstat entries of an invalid record
+        self._current: Optional[
+            Tuple[bytes, int, int, Optional[List[Tuple[int, int]]], int]
+        ] = None
+        self._added = 0
+        self._removed = 0
+        self._files: List[Tuple[bytes, int, int]] = []
+        self._rename: Optional[List[bytes]] = None
+
+    def parse(self, chunks: Iterable[bytes]) -> Iterator[CommitBatch]:
+        """Parse a complete stream of chunks, yielding batches as they fill up."""
+        for chunk in chunks:
+            yield from self.feed(chunk)
+        yield from self.close()
+
+    def feed(self, chunk: bytes) -> Iterator[CommitBatch]:
+        """Consume a chunk of raw git output and yield full batches."""
+        if not chunk:
+            return
+        tokens = (self._pending + chunk).split(b"\0")
+        # The last token is incomplete until its terminating NUL arrives
+        self._pending = tokens.pop()
+        yield from self._consume(tokens)
+
+    def close(self) -> Iterator[CommitBatch]:
+        """Flush the final (unterminated) token and the last batch."""
+        if self._pending:
+            pending, self._pending = self._pending, b""
+            yield from self._consume([pending])
+        self._finish_commit()
+        if len(self._batch):
+            batch, self._batch = self._batch, self._new_batch()
+            yield batch
+
+    def abort(self) -> Iterator[CommitBatch]:
+        """
+        Yield the commits completed so far of a truncated stream.
+
+        The commit in progress (and any partial token) is dropped, since its
+        numstat entries may be incomplete.
+        """
+        self._pending = b""
+        self._header.clear()
+        self._rename = None
+        self._current = None
+        self._added = 0
+        self._removed = 0
+        self._files = []
+        if len(self._batch):
+            batch, self._batch = self._batch, self._new_batch()
+            yield batch
+
+    def _consume(self, tokens: List[bytes]) -> Iterator[CommitBatch]:
+        header = self._header
+        header_fields = self._header_fields
+        skip_binary = self.skip_binary_changes
+        keep_files = self.keep_files
+
+        for token in tokens:
+            if header:
+                # Inside a commit header: collect the fixed number of fields
+                header.append(token)
+                if len(header) == header_fields:
+                    self._start_commit(header)
+                    header.clear()
+                continue
+
+            if self._rename is not None:
+                # Rename/copy entry: "added\tremoved\t" NUL source NUL destination NUL
+                self._rename.append(token)
+                if len(self._rename) < 4:
+                    continue
+                added_raw, removed_raw, _source, destination = self._rename
+                self._rename = None
+                self._add_file(added_raw, removed_raw, destination, skip_binary)
+                continue
+
+            if not token:
+                # Separator between commits / after the last numstat entry
+                continue
+
+            if token[:1] == RECORD_START:
+                # The previous commit is complete; hand over a full batch
+                # before the next commit is appended to it.
+                self._finish_commit()
+                if len(self._batch) >= self.batch_size:
+                    batch, self._batch = self._batch, self._new_batch()
+                    yield batch
+                header.append(token[1:])
+                continue
+
+            if self._current is None:
+                continue
+
+            # Numstat entry; the first one of a commit follows a newline
+            if token[:1] == b"\n":
+                token = token[1:]
+            parts = token.split(b"\t", 2)
+            if len(parts) != 3:
+                continue
+            added_raw, removed_raw, path = parts
+            if not path:
+                self._rename = [added_raw, removed_raw]
+                continue
+
+            # Same as _add_file, inlined for the common case
+            try:
+                added = int(added_raw)
+                removed = int(removed_raw)
+            except ValueError:
+                self._add_file(added_raw, removed_raw, path, skip_binary)
+                continue
+            self._added += added
+            self._removed += removed
+            if keep_files:
+                self._files.append((path, added, removed))
+
+    def _new_batch(self) -> CommitBatch:
+        return CommitBatch(
+            self.authors, self.keep_files, self.parse_trailers, self.sources
+        )
+
+    def _start_commit(self, header: List[bytes]) -> None:
+        sha, date_raw, name_raw, email_raw = header[:_HEADER_FIELDS]
+        epoch_raw, _, offset_raw = date_raw.partition(b" ")
+        try:
+            timestamp = int(epoch_raw)
+        except ValueError:
+            # Drop the commit, numstat entries that follow are ignored
+            self.invalid_records += 1
+            self._current = None
+            return
+        if not self._tip_parsed:
+            self.tip_offset = parse_utc_offset(offset_raw)
+            self._tip_parsed = True
+
+        source_id = 0
+        if self.ref_sources is not None and self._parents_index is not None:
+            source_id = self.ref_sources.visit(sha, header[self._parents_index].split())
+        trailers = None
+        if self._trailer_index is not None and header[self._trailer_index]:
+            field = header[self._trailer_index]
+            # The same sign-off/co-author lines repeat across a history
+            trailers = self._trailer_fields.get(field)
+            if trailers is None:
+                trailers = self._intern_trailers(field)
+                self._trailer_fields[field] = trailers
+        self._current = (
+            sha,
+            timestamp,
+            self.authors.intern(name_raw, email_raw),
+            trailers,
+            source_id,
+        )
+
+    def _intern_trailers(self, field: bytes) -> List[Tuple[int, int]]:
+        trailers = []
+        for kind, value in parse_trailer_field(field, TRAILER_SEPARATOR):
+            identity = parse_trailer_identity(value)
+            if identity is not None:
+                trailers.append((kind, self.authors.intern(*identity)))
+        return trailers
+
+    def _finish_commit(self) -> None:
+        if self._current is None:
+            return
+        sha, timestamp, author_id, trailers, source_id = self._current
+        self._batch.append_commit(
+            sha,
+            timestamp,
+            author_id,
+            self._added,
+            self._removed,
+            self._files,
+            trailers,
+            source_id,
+        )
+        self._current = None
+        self._added = 0
+        self._removed = 0
+        if self._files:
+            self._files = []
+
+    def _add_file(
+        self, added_raw: bytes, removed_raw: bytes, path: bytes, skip_binary: bool
+    ) -> None:
+        if self._current is None:
+            return
+        # Binary files are reported as "-\t-"
+        if added_raw == b"-" or removed_raw == b"-":
+            if skip_binary:
+                return
+            added = 0 if added_raw == b"-" else int(added_raw)
+            removed = 0 if removed_raw == b"-" else int(removed_raw)
+        else:
+            try:
+                added = int(added_raw)
+                removed = int(removed_raw)
+            except ValueError:
+                return
+        self._added += added
+        self._removed += removed
+        if self.keep_files:
+            self._files.append((path, added, removed))
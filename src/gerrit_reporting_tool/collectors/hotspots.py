@@ -0,0 +1,228 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Per-directory churn and hotspot paths from git numstat data.
+
+Churn is the number of lines added plus removed. For every configured time
+window two aggregates are kept:
+
+- exact churn per top-level directory (commits, added, removed); the number
+  of top-level directories is small
+- the hottest paths, tracked with a weighted Space-Saving sketch
+
+A repository can touch millions of distinct paths over its history, so paths
+are never counted exactly. Space-Saving keeps at most ``capacity`` counters:
+a path that is not tracked replaces the one with the smallest count and
+inherits that count as its overestimation error. Any path whose true churn
+exceeds total_churn / capacity is guaranteed to be tracked, and every
+reported count is within ``error`` of the true count.
+
+Windows are day-aligned like the activity histograms (see activity.py).
+Everything here is plain data so accumulators can cross process boundaries
+with a GitLogWalk.
+"""
+
+from heapq import heapify, heappop, heappush
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .activity import DAY_SECONDS
+from .commit_batch import CommitBatch
+
+
+# Counters kept per window for the hottest paths
+DEFAULT_HOTSPOT_CAPACITY = 500
+
+# Paths reported per window
+DEFAULT_HOTSPOT_TOP_N = 10
+
+# Directory label for files at the repository root
+ROOT_DIRECTORY = "/"
+
+
+class SpaceSaving:
+    """
+    Weighted Space-Saving heavy-hitters sketch over at most ``capacity`` keys.
+
+    The minimum counter is found through a heap with lazy invalidation:
+    increments push a new entry and stale entries are skipped when popped.
+    The heap is rebuilt once stale entries dominate, so memory stays
+    proportional to ``capacity``.
+    """
+
+    __slots__ = ("capacity", "total", "_counts", "_errors", "_heap")
+
+    def __init__(self, capacity: int = DEFAULT_HOTSPOT_CAPACITY) -> None:
+        self.capacity = max(1, capacity)
+        self.total = 0
+        self._counts: Dict[bytes, int] = {}
+        self._errors: Dict[bytes, int] = {}
+        self._heap: List[Tuple[int, bytes]] = []
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def offer(self, key: bytes, weight: int = 1) -> None:
+        """Add ``weight`` occurrences of ``key``."""
+        if weight <= 0:
+            return
+        self.total += weight
+        counts = self._counts
+        count = counts.get(key)
+        if count is not None:
+            counts[key] = count + weight
+            heappush(self._heap, (count + weight, key))
+        elif len(counts) < self.capacity:
+            counts[key] = weight
+            self._errors[key] = 0
+            heappush(self._heap, (weight, key))
+        else:
+            heap = self._heap
+            while True:
+                minimum, victim = heappop(heap)
+                if counts.get(victim) == minimum:
+                    break
+            del counts[victim]
+            del self._errors[victim]
+            counts[key] = minimum + weight
+            self._errors[key] = minimum
+            heappush(heap, (minimum + weight, key))
+
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, k) for k, c in counts.items()]
+            heapify(self._heap)
+
+    def top(self, n: int) -> List[Tuple[bytes, int, int]]:
+        """Return up to ``n`` (key, estimated count, error) by descending count."""
+        ranked = sorted(self._counts.items(), key=lambda item: (-item[1], item[0]))
+        return [(key, count, self._errors[key]) for key, count in ranked[:n]]
+
+
+def top_level_directory(path: bytes) -> bytes:
+    """Return the top-level directory of a path, b"" for files at the root."""
+    head, sep, _ = path.partition(b"/")
+    return head if sep else b""
+
+
+class WindowChurn:
+    """Churn aggregates of one time window."""
+
+    __slots__ = ("commits", "added", "removed", "directories", "paths")
+
+    def __init__(self, capacity: int) -> None:
+        self.commits = 0
+        self.added = 0
+        self.removed = 0
+        # top-level directory -> [commits, added, removed]
+        self.directories: Dict[bytes, List[int]] = {}
+        self.paths = SpaceSaving(capacity)
+
+    def report(self, top_n: int) -> Dict[str, Any]:
+        """Return the JSON-ready aggregates of the window."""
+        directories = sorted(
+            self.directories.items(), key=lambda item: (-(item[1][1] + item[1][2]), item[0])
+        )
+        return {
+            "commits": self.commits,
+            "churn": self.added + self.removed,
+            "directories": [
+                {
+                    "directory": _decode(name) if name else ROOT_DIRECTORY,
+                    "commits": commits,
+                    "added": added,
+                    "removed": removed,
+                    "churn": added + removed,
+                }
+                for name, (commits, added, removed) in directories
+            ],
+            "hottest_paths": [
+                {"path": _decode(path), "churn": churn, "error": error}
+                for path, churn, error in self.paths.top(top_n)
+            ],
+        }
+
+
+class HotspotAccumulator:
+    """
+    Folds per-file numstat data into per-window churn aggregates.
+
+    Args:
+        window_days: Window name -> first day covered (see window_start_day)
+        capacity: Space-Saving counters per window
+    """
+
+    def __init__(
+        self, window_days: Mapping[str, int], capacity: int = DEFAULT_HOTSPOT_CAPACITY
+    ) -> None:
+        self.capacity = capacity
+        self.window_days = dict(window_days)
+        self.windows = {name: WindowChurn(capacity) for name in self.window_days}
+        # Widest window first; a commit belongs to a prefix of this list
+        self._by_start = sorted(
+            ((day, self.windows[name]) for name, day in self.window_days.items()),
+            key=lambda item: item[0],
+        )
+
+    @property
+    def earliest_day(self) -> Optional[int]:
+        """First day covered by any window, or None without windows."""
+        return self._by_start[0][0] if self._by_start else None
+
+    def fold(self, batch: CommitBatch) -> None:
+        """Fold a batch parsed with keep_files into the window aggregates."""
+        if not batch.keep_files or not self._by_start:
+            return
+        by_start = self._by_start
+        offsets = batch.file_offsets
+        file_paths = batch.file_paths
+        file_added = batch.file_added
+        file_removed = batch.file_removed
+
+        for index, timestamp in enumerate(batch.timestamps):
+            day = timestamp // DAY_SECONDS
+            windows = [churn for start, churn in by_start if day >= start]
+            if not windows:
+                continue
+
+            touched: Dict[bytes, List[int]] = {}
+            files = []
+            for position in range(offsets[index], offsets[index + 1]):
+                path = file_paths[position]
+                added = file_added[position]
+                removed = file_removed[position]
+                files.append((path, added + removed))
+                directory = touched.setdefault(top_level_directory(path), [0, 0])
+                directory[0] += added
+                directory[1] += removed
+
+            commit_added = batch.added[index]
+            commit_removed = batch.removed[index]
+            for churn in windows:
+                churn.commits += 1
+                churn.added += commit_added
+                churn.removed += commit_removed
+                directories = churn.directories
+                for name, (added, removed) in touched.items():
+                    totals = directories.get(name)
+                    if totals is None:
+                        directories[name] = [1, added, removed]
+                    else:
+                        totals[0] += 1
+                        totals[1] += added
+                        totals[2] += removed
+                offer = churn.paths.offer
+                for path, weight in files:
+                    offer(path, weight)
+
+    def report(self, top_n: int = DEFAULT_HOTSPOT_TOP_N) -> Dict[str, Any]:
+        """Return the JSON-ready hotspot section of a repository."""
+        return {
+            "capacity": self.capacity,
+            "windows": {
+                name: churn.report(top_n) for name, churn in self.windows.items()
+            },
+        }
+
+
+def _decode(path: bytes) -> str:
+    return path.decode("utf-8", errors="replace")
@@ -0,0 +1,209 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Run-wide interned author identities.
+
+The same raw (name, email) pairs show up in hundreds of repositories of a
+fleet. IdentityTable normalizes each distinct raw identity exactly once per
+run and hands out a shared, immutable AuthorIdentity carrying:
+
+- a small integer ``author_id``, shared by every raw identity that
+  normalizes to the same email address
+- the normalized name and email
+- the organizational domain derived from the email domain: its registrable
+  domain under the public suffix list (see public_suffix.py), unless
+  overridden in organizational_domains.yaml. Results sit in an LRU cache
+  keyed by email domain.
+
+One table is shared by all collector worker threads and by DataAggregator,
+so author and organization rollups use exactly the same attribution as the
+per-repository metrics. Lookups are guarded by a single lock; they happen
+once per distinct identity per repository, not per commit.
+"""
+
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from .public_suffix import PublicSuffixTrie, bundled_suffix_rules
+
+
+DEFAULT_UNKNOWN_EMAIL = "unknown@unknown"
+
+# Email domains that are never reduced to an organization
+_UNREDUCED_DOMAINS = frozenset(["unknown", "localhost", ""])
+
+# Distinct email domains whose organization is kept in the LRU cache
+DEFAULT_DOMAIN_CACHE_SIZE = 65536
+
+
+@dataclass(frozen=True)
+class AuthorIdentity:
+    """
+    A normalized author identity.
+
+    Attributes:
+        author_id: Dense id, identical for all raw identities sharing ``email``
+        name: Trimmed display name ("Unknown" when missing)
+        email: Lowercased email, or the unknown-email placeholder
+        domain: Organizational domain of the email ("" without one)
+    """
+
+    author_id: int
+    name: str
+    email: str
+    domain: str
+
+
+def normalize_identity(
+    name: str, email: str, unknown_email: str = DEFAULT_UNKNOWN_EMAIL
+) -> Tuple[str, str]:
+    """
+    Normalize a raw author name and email.
+
+    - Name trimmed, "Unknown" when empty
+    - Email lowercased and trimmed
+    - Empty or malformed emails (no "@") replaced by ``unknown_email``
+    """
+    clean_name = name.strip() if name else "Unknown"
+    clean_email = email.lower().strip() if email else ""
+    if not clean_email or "@" not in clean_email:
+        clean_email = unknown_email
+    return clean_name, clean_email
+
+
+def email_domain(email: str) -> str:
+    """Return the part after the last "@" of an email, or ""."""
+    if "@" not in email:
+        return ""
+    return email.rsplit("@", 1)[1].lower()
+
+
+class IdentityTable:
+    """
+    Thread-safe, run-wide table of normalized author identities.
+
+    Args:
+        unknown_email: Placeholder for empty or malformed emails
+        preserve_full_domain: Email domains reported in full
+        custom_mappings: Email domain -> organizational domain overrides
+        public_suffixes: Suffix rules added to the bundled public suffix list
+        domain_cache_size: Maximum number of email domains in the LRU cache
+    """
+
+    def __init__(
+        self,
+        unknown_email: str = DEFAULT_UNKNOWN_EMAIL,
+        preserve_full_domain: Iterable[str] = (),
+        custom_mappings: Optional[Mapping[str, Any]] = None,
+        public_suffixes: Iterable[str] = (),
+        domain_cache_size: int = DEFAULT_DOMAIN_CACHE_SIZE,
+    ) -> None:
+        self.unknown_email = unknown_email
+        self._preserve_full_domain = frozenset(preserve_full_domain or ())
+        self._custom_mappings = {
+            str(domain): str(organization)
+            for domain, organization in (custom_mappings or {}).items()
+        }
+        self._suffixes = PublicSuffixTrie(bundled_suffix_rules())
+        for rule in public_suffixes or ():
+            self._suffixes.add(rule)
+        self._organization_cached = lru_cache(maxsize=domain_cache_size)(
+            self._compute_organization
+        )
+
+        self._lock = threading.Lock()
+        self._identities: Dict[Tuple[str, str], AuthorIdentity] = {}
+        self._by_email: Dict[str, AuthorIdentity] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def from_config(
+        cls, config: Mapping[str, Any], domain_config: Mapping[str, Any]
+    ) -> "IdentityTable":
+        """
+        Build a table from the tool configuration and domain configuration.
+
+        Args:
+            config: Tool configuration (``data_quality.unknown_email_placeholder``)
+            domain_config: Parsed organizational_domains.yaml (``preserve_full_domain``,
+                ``custom_mappings`` and ``public_suffixes``)
+        """
+        return cls(
+            unknown_email=config.get("data_quality", {}).get(
+                "unknown_email_placeholder", DEFAULT_UNKNOWN_EMAIL
+            ),
+            preserve_full_domain=domain_config.get("preserve_full_domain") or (),
+            custom_mappings=domain_config.get("custom_mappings") or {},
+            public_suffixes=domain_config.get("public_suffixes") or (),
+        )
+
+    def __len__(self) -> int:
+        return len(self._identities)
+
+    def resolve(self, name: str, email: str) -> AuthorIdentity:
+        """Return the identity for a raw (name, email) pair, interning it if new."""
+        key = (name, email)
+        with self._lock:
+            identity = self._identities.get(key)
+            if identity is not None:
+                self._hits += 1
+                return identity
+
+            self._misses += 1
+            norm_name, norm_email = normalize_identity(name, email, self.unknown_email)
+            known = self._by_email.get(norm_email)
+            identity = AuthorIdentity(
+                author_id=known.author_id if known else len(self._by_email),
+                name=norm_name,
+                email=norm_email,
+                domain=self._organization_cached(email_domain(norm_email)),
+            )
+            self._identities[key] = identity
+            if known is None:
+                self._by_email[norm_email] = identity
+            return identity
+
+    def by_email(self, email: str) -> Optional[AuthorIdentity]:
+        """Return the first identity registered for a normalized email."""
+        with self._lock:
+            return self._by_email.get(email)
+
+    def organization(self, full_domain: str) -> str:
+        """
+        Return the organizational domain for an email domain.
+
+        This is the registrable domain (public suffix plus one label) unless
+        the domain is configured to be preserved in full or has a custom
+        mapping.
+        """
+        return self._organization_cached(full_domain)
+
+    def _compute_organization(self, full_domain: str) -> str:
+        if full_domain in _UNREDUCED_DOMAINS:
+            return full_domain
+        if full_domain in self._preserve_full_domain:
+            return full_domain
+        if full_domain in self._custom_mappings:
+            return self._custom_mappings[full_domain]
+        return self._suffixes.registrable_domain(full_domain)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return lookup counters and table sizes."""
+        domain_cache = self._organization_cached.cache_info()
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "lookups": lookups,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups * 100, 1) if lookups else 0.0,
+                "identities": len(self._identities),
+                "authors": len(self._by_email),
+                "domains": domain_cache.currsize,
+                "domain_hits": domain_cache.hits,
+                "domain_misses": domain_cache.misses,
+            }
@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Current code-size inventory of a repository.
+
+How big a repository is today is read from the object database alone: the
+HEAD tree is listed recursively with blob sizes (GitBackend.list_tree, a
+single ``git ls-tree -r -l`` for the CLI backend), so no working tree is
+walked and bare clones work the same as checkouts. Per repository this
+reports:
+
+- ``total_bytes`` and ``total_files`` of the regular files at HEAD
+- ``submodules``: submodule entries, which have no size of their own
+- ``extensions`` and ``directories``: files and bytes per file extension and
+  per top-level directory, largest first
+
+Symlinks are left out. Extensions are lowercased; files without one (and
+dotfiles such as ``.gitignore``) are grouped under ``NO_EXTENSION``. Only the
+``top_n`` largest groups are listed, the rest are summed into one
+``OTHER_GROUP`` row so the totals still add up.
+"""
+
+import posixpath
+from typing import Any, Dict, Iterable, List
+
+from .git_backend import TreeEntry
+from .hotspots import ROOT_DIRECTORY
+
+
+# Extension and directory groups listed per repository
+DEFAULT_INVENTORY_TOP_N = 10
+
+# Group label for files without an extension
+NO_EXTENSION = "(none)"
+
+# Group label for the groups beyond top_n
+OTHER_GROUP = "(other)"
+
+# Tree entry modes of regular files
+REGULAR_FILE_MODES = (0o100644, 0o100755)
+
+# Tree entry mode of submodules (gitlinks)
+SUBMODULE_MODE = 0o160000
+
+
+def file_extension(path: str) -> str:
+    """Return the lowercased extension of ``path``, or NO_EXTENSION."""
+    _, extension = posixpath.splitext(posixpath.basename(path))
+    return extension.lower() if extension else NO_EXTENSION
+
+
+def code_inventory(
+    entries: Iterable[TreeEntry], top_n: int = DEFAULT_INVENTORY_TOP_N
+) -> Dict[str, Any]:
+    """Return the JSON-ready inventory of one tree listing."""
+    extensions: Dict[str, List[int]] = {}
+    directories: Dict[str, List[int]] = {}
+    total_files = 0
+    total_bytes = 0
+    submodules = 0
+
+    for entry in entries:
+        if entry.mode == SUBMODULE_MODE:
+            submodules += 1
+            continue
+        if entry.mode not in REGULAR_FILE_MODES:
+            continue
+        size = entry.size or 0
+        total_files += 1
+        total_bytes += size
+        head, sep, _ = entry.path.partition("/")
+        for groups, name in (
+            (extensions, file_extension(entry.path)),
+            (directories, head if sep else ROOT_DIRECTORY),
+        ):
+            totals = groups.get(name)
+            if totals is None:
+                groups[name] = [1, size]
+            else:
+                totals[0] += 1
+                totals[1] += size
+
+    return {
+        "total_files": total_files,
+        "total_bytes": total_bytes,
+        "submodules": submodules,
+        "extensions": _ranked_groups(extensions, "extension", top_n),
+        "directories": _ranked_groups(directories, "directory", top_n),
+    }
+
+
+def _ranked_groups(
+    groups: Dict[str, List[int]], label: str, top_n: int
+) -> List[Dict[str, Any]]:
+    """Largest groups first; groups beyond ``top_n`` are summed into OTHER_GROUP."""
+    ranked = sorted(groups.items(), key=lambda item: (-item[1][1], item[0]))
+    rows = [
+        {label: name, "files": files, "bytes": size}
+        for name, (files, size) in ranked[:top_n]
+    ]
+    rest = ranked[top_n:]
+    if rest:
+        rows.append(
+            {
+                label: OTHER_GROUP,
+                "files": sum(files for _, (files, _size) in rest),
+                "bytes": sum(size for _, (_files, size) in rest),
+            }
+        )
+    return rows
@@ -0,0 +1,528 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+SQLite-backed durable store for window-agnostic git metrics.
+
+A single database file holds, per Gerrit project:
+
+- the RepoState used by the metrics cache and incremental collection: HEAD,
+  further branch tips, settings, totals, the per-day histograms of the
+  repository, each author and each branch, and the hotspots report
+- the analysis time of the repository in its latest run, used for scheduling
+- the blame results of the files sampled for code ownership
+
+plus metadata for every reporting run. Compared with one JSON document per
+repository it offers:
+
+- WAL journaling, so concurrent readers never block the writer and a crashed
+  run never leaves a half-written entry behind
+- Atomic per-repository upserts (one transaction per save)
+- Indexed lookups by gerrit_project and by HEAD SHA
+- Plain SQL access for other tooling, without parsing JSON
+
+Connections are opened per thread; SQLite serializes writers and the busy
+timeout absorbs short lock contention between worker threads and processes.
+
+The schema version is kept in ``PRAGMA user_version``. Everything except the
+run metadata can be recomputed from the repositories, so a store written with
+another version has those tables dropped and recreated on open instead of
+being migrated; the ``runs`` table is kept.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .activity import DailyHistogram, RepoActivity
+from .repo_state import RepoState
+
+
+SCHEMA_VERSION = 6
+
+# Tables dropped when a store with another schema version is opened
+_CACHE_TABLES = (
+    "repositories",
+    "repository_days",
+    "authors",
+    "author_days",
+    "repository_refs",
+    "branch_days",
+    "repository_hotspots",
+    "repository_timings",
+    "blame_cache",
+)
+
+# Surviving lines per raw (author name, email) of one blamed file
+BlameCounts = Dict[Tuple[str, str], int]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS repositories (
+    gerrit_project TEXT PRIMARY KEY,
+    head TEXT NOT NULL,
+    settings TEXT NOT NULL,
+    total_commits INTEGER NOT NULL,
+    last_commit_timestamp INTEGER,
+    last_commit_offset INTEGER,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_repositories_head ON repositories (head);
+
+CREATE TABLE IF NOT EXISTS repository_days (
+    gerrit_project TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    commits INTEGER NOT NULL,
+    lines_added INTEGER NOT NULL,
+    lines_removed INTEGER NOT NULL,
+    PRIMARY KEY (gerrit_project, day)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS authors (
+    gerrit_project TEXT NOT NULL,
+    email TEXT NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (gerrit_project, email)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS author_days (
+    gerrit_project TEXT NOT NULL,
+    email TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    commits INTEGER NOT NULL,
+    lines_added INTEGER NOT NULL,
+    lines_removed INTEGER NOT NULL,
+    PRIMARY KEY (gerrit_project, email, day)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS repository_refs (
+    gerrit_project TEXT NOT NULL,
+    refname TEXT NOT NULL,
+    sha TEXT NOT NULL,
+    PRIMARY KEY (gerrit_project, refname)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS branch_days (
+    gerrit_project TEXT NOT NULL,
+    branch TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    commits INTEGER NOT NULL,
+    lines_added INTEGER NOT NULL,
+    lines_removed INTEGER NOT NULL,
+    PRIMARY KEY (gerrit_project, branch, day)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS repository_hotspots (
+    gerrit_project TEXT PRIMARY KEY,
+    hotspot_key TEXT NOT NULL,
+    report TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS repository_timings (
+    gerrit_project TEXT PRIMARY KEY,
+    seconds REAL NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    recorded_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS blame_cache (
+    gerrit_project TEXT NOT NULL,
+    path TEXT NOT NULL,
+    blob TEXT NOT NULL,
+    authors TEXT NOT NULL,
+    PRIMARY KEY (gerrit_project, path)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    tool_version TEXT,
+    config_digest TEXT,
+    repositories INTEGER,
+    errors INTEGER,
+    details TEXT
+);
+"""
+
+
+class MetricsStore:
+    """
+    Single-file SQLite store of RepoState objects and run metadata.
+
+    load() and save() operate on RepoState, keyed by Gerrit project.
+    """
+
+    def __init__(self, path: Path, logger: logging.Logger, timeout: float = 30.0) -> None:
+        self.path = Path(path)
+        self.logger = logger
+        self.timeout = timeout
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        connection = self._connection()
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        script = _SCHEMA
+        # A new file reports version 0
+        if version not in (0, SCHEMA_VERSION):
+            self.logger.info(
+                f"Rebuilding metrics store {self.path}: schema version {version}, "
+                f"expected {SCHEMA_VERSION}"
+            )
+            script = "".join(f"DROP TABLE IF EXISTS {table};\n" for table in _CACHE_TABLES)
+            script += _SCHEMA
+        connection.executescript(
+            f"BEGIN IMMEDIATE;\n{script}\nPRAGMA user_version = {SCHEMA_VERSION};\nCOMMIT;"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                str(self.path), timeout=self.timeout, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def close(self) -> None:
+        """Close all connections opened by this store."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            try:
+                connection.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+    # ------------------------------------------------------------------
+    # Repository state
+    # ------------------------------------------------------------------
+
+    def load(self, project: str) -> Optional[RepoState]:
+        """Load the stored state of a project, or None if absent or unreadable."""
+        try:
+            connection = self._connection()
+            row = connection.execute(
+                "SELECT head, settings, total_commits, last_commit_timestamp, "
+                "last_commit_offset FROM repositories WHERE gerrit_project = ?",
+                (project,),
+            ).fetchone()
+            if row is None:
+                return None
+            head, settings, total_commits, last_commit_timestamp, last_commit_offset = row
+
+            activity = RepoActivity()
+            activity.repository = DailyHistogram.from_items(
+                connection.execute(
+                    "SELECT day, commits, lines_added, lines_removed "
+                    "FROM repository_days WHERE gerrit_project = ?",
+                    (project,),
+                )
+            )
+            author_names = dict(
+                connection.execute(
+                    "SELECT email, name FROM authors WHERE gerrit_project = ?",
+                    (project,),
+                )
+            )
+            for email, day, commits, added, removed in connection.execute(
+                "SELECT email, day, commits, lines_added, lines_removed "
+                "FROM author_days WHERE gerrit_project = ?",
+                (project,),
+            ):
+                activity.author(email).add(day, added, removed, commits)
+            for branch, day, commits, added, removed in connection.execute(
+                "SELECT branch, day, commits, lines_added, lines_removed "
+                "FROM branch_days WHERE gerrit_project = ?",
+                (project,),
+            ):
+                activity.branch(branch).add(day, added, removed, commits)
+            ref_tips = dict(
+                connection.execute(
+                    "SELECT refname, sha FROM repository_refs WHERE gerrit_project = ?",
+                    (project,),
+                )
+            )
+            hotspot_row = connection.execute(
+                "SELECT hotspot_key, report FROM repository_hotspots "
+                "WHERE gerrit_project = ?",
+                (project,),
+            ).fetchone()
+
+            return RepoState(
+                head=head,
+                total_commits=total_commits,
+                activity=activity,
+                author_names=author_names,
+                settings=json.loads(settings),
+                last_commit_timestamp=last_commit_timestamp,
+                last_commit_offset=last_commit_offset,
+                ref_tips=ref_tips,
+                hotspots=json.loads(hotspot_row[1]) if hotspot_row else None,
+                hotspot_key=json.loads(hotspot_row[0]) if hotspot_row else None,
+            )
+        except (sqlite3.Error, ValueError) as e:
+            self.logger.debug(f"Ignoring unreadable state for {project}: {e}")
+            return None
+
+    def save(self, project: str, state: RepoState) -> None:
+        """Atomically replace the stored state of a project."""
+        try:
+            connection = self._connection()
+            with connection:
+                connection.execute(
+                    "INSERT INTO repositories (gerrit_project, head, settings, "
+                    "total_commits, last_commit_timestamp, last_commit_offset, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (gerrit_project) DO UPDATE SET "
+                    "head = excluded.head, settings = excluded.settings, "
+                    "total_commits = excluded.total_commits, "
+                    "last_commit_timestamp = excluded.last_commit_timestamp, "
+                    "last_commit_offset = excluded.last_commit_offset, "
+                    "updated_at = excluded.updated_at",
+                    (
+                        project,
+                        state.head,
+                        json.dumps(state.settings, sort_keys=True),
+                        state.total_commits,
+                        state.last_commit_timestamp,
+                        state.last_commit_offset,
+                        time.time(),
+                    ),
+                )
+                for table in (
+                    "repository_days",
+                    "authors",
+                    "author_days",
+                    "repository_refs",
+                    "branch_days",
+                    "repository_hotspots",
+                ):
+                    connection.execute(
+                        f"DELETE FROM {table} WHERE gerrit_project = ?", (project,)
+                    )
+                connection.executemany(
+                    "INSERT INTO repository_days VALUES (?, ?, ?, ?, ?)",
+                    (
+                        (project, day, commits, added, removed)
+                        for day, commits, added, removed in state.activity.repository.items()
+                    ),
+                )
+                connection.executemany(
+                    "INSERT INTO authors VALUES (?, ?, ?)",
+                    (
+                        (project, email, state.author_names.get(email, ""))
+                        for email in state.activity.authors
+                    ),
+                )
+                connection.executemany(
+                    "INSERT INTO author_days VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        (project, email, day, commits, added, removed)
+                        for email, histogram in state.activity.authors.items()
+                        for day, commits, added, removed in histogram.items()
+                    ),
+                )
+                connection.executemany(
+                    "INSERT INTO repository_refs VALUES (?, ?, ?)",
+                    ((project, refname, sha) for refname, sha in state.ref_tips.items()),
+                )
+                connection.executemany(
+                    "INSERT INTO branch_days VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        (project, branch, day, commits, added, removed)
+                        for branch, histogram in state.activity.branches.items()
+                        for day, commits, added, removed in histogram.items()
+                    ),
+                )
+                if state.hotspots is not None and state.hotspot_key is not None:
+                    self._insert_hotspots(
+                        connection, project, state.hotspot_key, state.hotspots
+                    )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to save state for {project}: {e}")
+
+    def save_hotspots(
+        self, project: str, hotspot_key: Dict[str, Any], report: Dict[str, Any]
+    ) -> None:
+        """
+        Replace the hotspots report of the stored state of a project.
+
+        Used when the rest of the state is unchanged but the time windows
+        have moved since the report was computed.
+        """
+        try:
+            connection = self._connection()
+            with connection:
+                self._insert_hotspots(connection, project, hotspot_key, report)
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to save hotspots for {project}: {e}")
+
+    @staticmethod
+    def _insert_hotspots(
+        connection: sqlite3.Connection,
+        project: str,
+        hotspot_key: Dict[str, Any],
+        report: Dict[str, Any],
+    ) -> None:
+        connection.execute(
+            "INSERT OR REPLACE INTO repository_hotspots VALUES (?, ?, ?)",
+            (project, json.dumps(hotspot_key, sort_keys=True), json.dumps(report)),
+        )
+
+    def projects_with_head(self, head: str) -> List[str]:
+        """Return the Gerrit projects whose stored state is at ``head``."""
+        rows = self._connection().execute(
+            "SELECT gerrit_project FROM repositories WHERE head = ? ORDER BY gerrit_project",
+            (head,),
+        )
+        return [project for (project,) in rows]
+
+    # ------------------------------------------------------------------
+    # Repository timings
+    # ------------------------------------------------------------------
+
+    def save_timings(self, timings: Iterable[Tuple[str, float, int]]) -> None:
+        """Replace the recorded (project, seconds, size_bytes) analysis timings."""
+        try:
+            connection = self._connection()
+            now = time.time()
+            with connection:
+                connection.executemany(
+                    "INSERT INTO repository_timings VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (gerrit_project) DO UPDATE SET "
+                    "seconds = excluded.seconds, size_bytes = excluded.size_bytes, "
+                    "recorded_at = excluded.recorded_at",
+                    (
+                        (project, seconds, size_bytes, now)
+                        for project, seconds, size_bytes in timings
+                    ),
+                )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to save repository timings: {e}")
+
+    def load_timings(self) -> Dict[str, Tuple[float, int]]:
+        """Return project -> (seconds, size_bytes) of the latest recorded analyses."""
+        try:
+            rows = self._connection().execute(
+                "SELECT gerrit_project, seconds, size_bytes FROM repository_timings"
+            )
+            return {project: (seconds, size_bytes) for project, seconds, size_bytes in rows}
+        except sqlite3.Error as e:
+            self.logger.debug(f"Ignoring unreadable repository timings: {e}")
+            return {}
+
+    # ------------------------------------------------------------------
+    # Blame cache
+    # ------------------------------------------------------------------
+
+    def load_blames(self, project: str) -> Dict[Tuple[str, str], BlameCounts]:
+        """Return (path, blob SHA) -> lines per (name, email) of a project's sample."""
+        try:
+            rows = self._connection().execute(
+                "SELECT path, blob, authors FROM blame_cache WHERE gerrit_project = ?",
+                (project,),
+            )
+            return {
+                (path, blob): {
+                    (name, email): lines for name, email, lines in json.loads(authors)
+                }
+                for path, blob, authors in rows
+            }
+        except (sqlite3.Error, ValueError) as e:
+            self.logger.debug(f"Ignoring unreadable blame cache for {project}: {e}")
+            return {}
+
+    def save_blames(
+        self, project: str, blames: Mapping[Tuple[str, str], BlameCounts]
+    ) -> None:
+        """Replace the cached blames of a project with those of its current sample."""
+        try:
+            connection = self._connection()
+            with connection:
+                connection.execute(
+                    "DELETE FROM blame_cache WHERE gerrit_project = ?", (project,)
+                )
+                connection.executemany(
+                    "INSERT INTO blame_cache VALUES (?, ?, ?, ?)",
+                    (
+                        (
+                            project,
+                            path,
+                            blob,
+                            json.dumps(
+                                [[name, email, lines] for (name, email), lines in counts.items()]
+                            ),
+                        )
+                        for (path, blob), counts in blames.items()
+                    ),
+                )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to save blame cache for {project}: {e}")
+
+    # ------------------------------------------------------------------
+    # Run metadata
+    # ------------------------------------------------------------------
+
+    def start_run(
+        self,
+        project: str,
+        tool_version: Optional[str] = None,
+        config_digest: Optional[str] = None,
+    ) -> int:
+        """Record the start of a reporting run and return its id."""
+        connection = self._connection()
+        with connection:
+            cursor = connection.execute(
+                "INSERT INTO runs (project, started_at, tool_version, config_digest) "
+                "VALUES (?, ?, ?, ?)",
+                (project, time.time(), tool_version, config_digest),
+            )
+        run_id = cursor.lastrowid
+        assert run_id is not None
+        return run_id
+
+    def finish_run(
+        self,
+        run_id: int,
+        repositories: int,
+        errors: int,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record the outcome of a reporting run."""
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "UPDATE runs SET finished_at = ?, repositories = ?, errors = ?, "
+                "details = ? WHERE run_id = ?",
+                (
+                    time.time(),
+                    repositories,
+                    errors,
+                    json.dumps(details or {}, sort_keys=True, default=str),
+                    run_id,
+                ),
+            )
+
+    def get_run(self, run_id: int) -> Optional[Dict[str, Any]]:
+        """Return the metadata of a run."""
+        connection = self._connection()
+        cursor = connection.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        run = dict(zip([column[0] for column in cursor.description], row))
+        run["details"] = json.loads(run["details"]) if run["details"] else {}
+        return run
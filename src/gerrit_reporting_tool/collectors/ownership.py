@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Sampled code ownership from git blame.
+
+Ownership is the share of the lines surviving at HEAD that each author (and
+each organization) last changed. Blaming every file of a large fleet is far
+too expensive, so each repository blames a sample of at most
+``ownership.max_files`` files, chosen from the HEAD tree listing:
+
+- ``largest``: the largest files by blob size
+- ``churn``: the hottest paths of the widest hotspot window (hotspots must be
+  enabled), topped up with the largest files
+
+Files above ``ownership.max_file_bytes`` (typically generated or data files)
+and files matching ``data_quality.exclude_paths`` are never sampled.
+
+Blame results are cached per repository by (path, blob SHA): a file whose
+blob has not changed since the previous run is not blamed again, so a
+repository with an unchanged sample costs no blame at all. The cache lives in
+the metrics store when one is configured (see metrics_store.py).
+
+Authors are normalized through the run-wide identity table, so ownership
+uses the same identities and organizations as the activity metrics.
+Percentages are of the sampled lines, not of the whole repository.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .git_backend import TreeEntry
+from .git_log import is_excluded_path
+from .identity import IdentityTable
+from .inventory import REGULAR_FILE_MODES
+
+
+# Files blamed per repository
+DEFAULT_OWNERSHIP_MAX_FILES = 20
+
+# Larger files are never blamed
+DEFAULT_OWNERSHIP_MAX_FILE_BYTES = 1_000_000
+
+# Sample strategies for ownership.sample
+OWNERSHIP_SAMPLES = ("largest", "churn")
+
+
+def select_ownership_sample(
+    entries: Iterable[TreeEntry],
+    max_files: int = DEFAULT_OWNERSHIP_MAX_FILES,
+    max_file_bytes: int = DEFAULT_OWNERSHIP_MAX_FILE_BYTES,
+    churned_paths: Sequence[str] = (),
+    exclude_paths: Sequence[str] = (),
+) -> List[TreeEntry]:
+    """
+    Return the files to blame: ``churned_paths`` first, then the largest.
+
+    Only non-empty regular files up to ``max_file_bytes`` are eligible.
+    """
+    eligible = {
+        entry.path: entry
+        for entry in entries
+        if entry.mode in REGULAR_FILE_MODES
+        and 0 < (entry.size or 0) <= max_file_bytes
+        and not (exclude_paths and is_excluded_path(entry.path, exclude_paths))
+    }
+    sample = [eligible.pop(path) for path in churned_paths if path in eligible]
+    largest = sorted(eligible.values(), key=lambda entry: (-(entry.size or 0), entry.path))
+    sample.extend(largest[: max(0, max_files - len(sample))])
+    return sample[:max_files]
+
+
+def hottest_paths(hotspots: Optional[Mapping[str, Any]], window: str) -> List[str]:
+    """Return the hottest paths of ``window`` in a repository's hotspot report."""
+    churn = (hotspots or {}).get("windows", {}).get(window, {})
+    return [row["path"] for row in churn.get("hottest_paths", [])]
+
+
+def ownership_metrics(
+    blames: Iterable[Mapping[Tuple[str, str], int]], identities: IdentityTable
+) -> Dict[str, Any]:
+    """Return the JSON-ready ownership of one repository's blamed files."""
+    authors: Dict[str, Dict[str, Any]] = {}
+    organizations: Dict[str, int] = {}
+    total_lines = 0
+    for counts in blames:
+        for (name, email), lines in counts.items():
+            identity = identities.resolve(name, email)
+            author = authors.setdefault(
+                identity.email,
+                {
+                    "name": identity.name,
+                    "email": identity.email,
+                    "domain": identity.domain,
+                    "lines": 0,
+                },
+            )
+            author["lines"] += lines
+            if identity.domain:
+                organizations[identity.domain] = organizations.get(identity.domain, 0) + lines
+            total_lines += lines
+
+    return {
+        "lines": total_lines,
+        "authors": _with_percent(
+            sorted(authors.values(), key=lambda row: (-row["lines"], row["email"])),
+            total_lines,
+        ),
+        "organizations": _with_percent(
+            [
+                {"domain": domain, "lines": lines}
+                for domain, lines in sorted(
+                    organizations.items(), key=lambda item: (-item[1], item[0])
+                )
+            ],
+            total_lines,
+        ),
+    }
+
+
+def _with_percent(rows: List[Dict[str, Any]], total_lines: int) -> List[Dict[str, Any]]:
+    for row in rows:
+        row["percent"] = round(row["lines"] / total_lines * 100, 1) if total_lines else 0.0
+    return rows
@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Public-suffix-aware organizational domains.
+
+Taking the last two labels of an email domain is wrong for every registry
+that sells names below a second-level suffix: ``dev.example.co.uk`` belongs
+to ``example.co.uk``, not ``co.uk``. The registrable domain is the public
+suffix plus one more label.
+
+Suffix rules use the Public Suffix List format and are compiled into a trie
+keyed by reversed labels, so a lookup walks at most one node per label of
+the domain:
+
+- ``co.uk``: ``co.uk`` is a public suffix
+- ``*.ck``: every label below ``ck`` is a public suffix
+- ``!www.ck``: exception to a wildcard; ``www.ck`` is registrable
+
+Every top-level domain is implicitly a public suffix. The package ships an
+unmodified copy of the Public Suffix List (https://publicsuffix.org/list/,
+MPL-2.0) as ``public_suffix_list.dat`` next to this module, so no network
+access is needed; scripts/update_public_suffix_list.py refreshes it. Only its
+ICANN section is used: the private section lists hosting platforms such as
+``compute.amazonaws.com``, and machine hostnames from unconfigured git
+clients would each become an organization of their own.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator
+
+
+BUNDLED_SUFFIX_FILE = Path(__file__).with_name("public_suffix_list.dat")
+
+# Marker line ending the ICANN section of the Public Suffix List
+ICANN_SECTION_END = "===END ICANN DOMAINS==="
+
+# Trie node markers; neither can collide with a DNS label
+_RULE = ""
+_EXCEPTION = "!"
+_WILDCARD = "*"
+
+
+def parse_suffix_rules(lines: Iterable[str]) -> Iterable[str]:
+    """Yield the rules of Public Suffix List formatted lines, skipping comments."""
+    for line in lines:
+        rule = line.split("//", 1)[0].strip()
+        if rule:
+            # Anything after the first whitespace is ignored by the format
+            yield rule.split()[0].lower()
+
+
+class PublicSuffixTrie:
+    """
+    Reversed-label trie of public suffix rules.
+
+    Args:
+        rules: Suffix rules in Public Suffix List format
+    """
+
+    def __init__(self, rules: Iterable[str] = ()) -> None:
+        self._root: Dict[str, Any] = {}
+        self._size = 0
+        for rule in rules:
+            self.add(rule)
+
+    @classmethod
+    def from_file(cls, path: Path) -> "PublicSuffixTrie":
+        """Compile a trie from a Public Suffix List formatted file."""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(parse_suffix_rules(f))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, rule: str) -> None:
+        """Add a single rule (``co.uk``, ``*.ck`` or ``!www.ck``)."""
+        rule = rule.strip().lower().strip(".")
+        exception = rule.startswith("!")
+        if exception:
+            rule = rule[1:]
+        if not rule:
+            return
+
+        node = self._root
+        for label in reversed(rule.split(".")):
+            node = node.setdefault(label, {})
+        node[_EXCEPTION if exception else _RULE] = True
+        self._size += 1
+
+    def suffix_label_count(self, domain: str) -> int:
+        """
+        Return the number of trailing labels of ``domain`` forming its public suffix.
+
+        Unlisted top-level domains match the implicit ``*`` rule, so the result
+        is at least 1 for any non-empty domain.
+        """
+        labels = domain.split(".")
+        count = 1
+        node = self._root
+        for depth, label in enumerate(reversed(labels), 1):
+            wildcard = node.get(_WILDCARD)
+            if wildcard is not None and _RULE in wildcard:
+                count = depth
+            child = node.get(label)
+            if child is None:
+                break
+            if _EXCEPTION in child:
+                return depth - 1
+            if _RULE in child:
+                count = depth
+            node = child
+        return count
+
+    def registrable_domain(self, domain: str) -> str:
+        """
+        Return the public suffix of ``domain`` plus one label.
+
+        Domains that are themselves public suffixes are returned unchanged.
+        """
+        labels = domain.split(".")
+        count = self.suffix_label_count(domain)
+        if len(labels) <= count:
+            return domain
+        return ".".join(labels[-(count + 1):])
+
+
+def icann_section(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the lines of a Public Suffix List file up to the end of its ICANN section."""
+    for line in lines:
+        if ICANN_SECTION_END in line:
+            return
+        yield line
+
+
+@lru_cache(maxsize=1)
+def bundled_suffix_rules() -> tuple:
+    """Return the ICANN rules of the bundled suffix list, read once per process."""
+    with open(BUNDLED_SUFFIX_FILE, "r", encoding="utf-8") as f:
+        return tuple(parse_suffix_rules(icann_section(f)))
@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Release and tag cadence metrics.
+
+Tags are listed once per repository with their creation date (the tagger
+date of annotated tags, the commit date of lightweight tags); see
+GitBackend.list_tags. The CLI backend gets them from a single
+``git for-each-ref refs/tags``, whatever the number of tags. ``packed-refs``
+alone is not enough: it names the tags but carries no dates.
+
+Every tag matching ``releases.tag_pattern`` (a regular expression searched in
+the tag name; all tags when unset) counts as a release, except that tags
+created on the same day form one release, so ``1.0`` and ``v1.0`` pushed
+together do not halve the median interval. Per repository this reports:
+
+- ``tag_count`` and ``tag_counts`` per time window (day-aligned like the
+  activity histograms, see activity.py)
+- ``last_release``: name and date of the most recent release
+- ``days_since_last_release``
+- ``median_release_interval_days``: median gap between consecutive release
+  days, None with fewer than two releases
+"""
+
+import datetime
+import re
+import time
+from dataclasses import dataclass
+from statistics import median
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from .activity import DAY_SECONDS, timestamp_to_day, window_start_day
+
+
+@dataclass(frozen=True)
+class TagEntry:
+    """
+    One tag of a repository.
+
+    Attributes:
+        name: Tag name without ``refs/tags/``
+        epoch: Creation time as a Unix timestamp
+    """
+
+    name: str
+    epoch: int
+
+
+def compile_tag_pattern(pattern: Optional[str]) -> Optional["re.Pattern[str]"]:
+    """
+    Compile ``releases.tag_pattern``; None or an empty pattern matches all tags.
+
+    Raises:
+        ValueError: If the pattern is not a valid regular expression
+    """
+    if not pattern:
+        return None
+    try:
+        return re.compile(pattern)
+    except re.error as e:
+        raise ValueError(f"Invalid releases.tag_pattern {pattern!r}: {e}") from e
+
+
+def release_metrics(
+    tags: Iterable[TagEntry],
+    time_windows: Mapping[str, Dict[str, Any]],
+    tag_pattern: Optional["re.Pattern[str]"] = None,
+    now: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Return the release metrics of one repository's tags."""
+    if tag_pattern is not None:
+        tags = [tag for tag in tags if tag_pattern.search(tag.name)]
+    # Newest first; the name breaks ties so the result is deterministic
+    tags = sorted(tags, key=lambda tag: (-tag.epoch, tag.name))
+    now = int(time.time()) if now is None else now
+
+    tag_days = [timestamp_to_day(tag.epoch) for tag in tags]
+    tag_counts = {}
+    for window, window_data in time_windows.items():
+        start_day = window_start_day(window_data)
+        tag_counts[window] = sum(1 for day in tag_days if day >= start_day)
+
+    release_days = sorted(set(tag_days))
+    intervals = [later - earlier for earlier, later in zip(release_days, release_days[1:])]
+
+    last_release = None
+    days_since_last_release = None
+    if tags:
+        newest = tags[0]
+        last_release = {
+            "tag": newest.name,
+            "date": datetime.datetime.fromtimestamp(
+                newest.epoch, datetime.timezone.utc
+            ).isoformat(),
+        }
+        days_since_last_release = max(0, (now - newest.epoch) // DAY_SECONDS)
+
+    return {
+        "tag_count": len(tags),
+        "tag_counts": tag_counts,
+        "last_release": last_release,
+        "days_since_last_release": days_since_last_release,
+        "median_release_interval_days": median(intervals) if intervals else None,
+    }
@@ -0,0 +1,90 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Persistent per-repository collection state for git metrics.
+
+After a repository has been walked, the collector stores the processed HEAD
+together with the window-agnostic aggregates (per-day histograms for the
+repository and every author, author display names, the total commit count
+and the author date of HEAD). The same state serves two purposes:
+
+- Metrics cache: a state whose HEAD and collector settings match the current
+  ones is a cache hit. Time windows are recomputed from the histograms, so an
+  entry stays valid across runs on different days.
+- Incremental collection: a state whose HEAD is an ancestor of the current
+  one is extended by walking only ``old_head..new_head``.
+
+When further branches are walked (``branches.patterns``), the tips of the
+matching refs are stored as well and must match too.
+
+Only the most recent state of each project is retained. States are
+persisted by MetricsStore (see metrics_store.py). Within a run, the state of
+a repository is also handed to copies with the same history (SharedHistory).
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from .activity import RepoActivity
+
+
+@dataclass
+class RepoState:
+    """
+    Window-agnostic aggregates of a repository at a given HEAD.
+
+    Attributes:
+        head: Commit SHA the aggregates were computed for
+        total_commits: Number of commits reachable from ``head``
+        activity: Per-day histograms for the repository and its authors
+        author_names: Normalized author email -> display name
+        settings: Collector settings that influence the aggregates
+        last_commit_timestamp: Author date of ``head`` (epoch seconds)
+        last_commit_offset: UTC offset of that author date in minutes
+        ref_tips: Refname -> SHA of the further branches walked with ``head``
+        hotspots: Hotspots report of ``head``, when hotspots are enabled
+        hotspot_key: Time windows and sketch settings ``hotspots`` was
+            computed for; windows move with the reporting date, so the report
+            is only reused while they are unchanged
+    """
+
+    head: str
+    total_commits: int
+    activity: RepoActivity
+    author_names: Dict[str, str] = field(default_factory=dict)
+    settings: Dict[str, Any] = field(default_factory=dict)
+    last_commit_timestamp: Optional[int] = None
+    last_commit_offset: Optional[int] = None
+    ref_tips: Dict[str, str] = field(default_factory=dict)
+    hotspots: Optional[Dict[str, Any]] = None
+    hotspot_key: Optional[Dict[str, Any]] = None
+
+    def matches(
+        self,
+        head: str,
+        settings: Dict[str, Any],
+        ref_tips: Optional[Dict[str, str]] = None,
+    ) -> bool:
+        """True if this state was computed for ``head`` and ``ref_tips`` with ``settings``."""
+        return (
+            self.head == head
+            and self.settings == settings
+            and self.ref_tips == (ref_tips or {})
+        )
+
+
+@dataclass
+class SharedHistory:
+    """
+    Aggregates of a history analysed once and reused for identical copies.
+
+    Attributes:
+        gerrit_project: Project that was analysed
+        state: Its window-agnostic aggregates
+        hotspots: Its hotspots report, when hotspots are enabled
+    """
+
+    gerrit_project: str
+    state: RepoState
+    hotspots: Optional[Dict[str, Any]] = None
@@ -379,6 +379,10 @@ def main(args=None) -> int:
         elif hasattr(args, 'verbose') and args.verbose:
             config.setdefault("logging", {})["level"] = "DEBUG"
 
+        # Command line performance switches override the configuration
+        if getattr(args, "cache", False):
+            config.setdefault("performance", {})["cache"] = True
+
         # Setup logging
         log_config = config.get("logging", {})
         logger = setup_logging(
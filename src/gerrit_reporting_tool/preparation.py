@@ -0,0 +1,224 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Repository preparation stage run before analysis.
+
+Mirrored clones that never run ``git gc`` have no commit-graph file, so every
+history walk parses commit objects from the packs one by one. Writing the
+commit-graph once (with changed-path Bloom filters, which speed up
+path-limited log) makes the traversal part of ``git log`` markedly faster
+for the analysis and for every later run.
+
+For each repository without a commit-graph the stage:
+
+1. times a commit traversal (``git log --format=%H``)
+2. writes the commit-graph (``git commit-graph write --reachable
+   --changed-paths``) and, optionally, a multi-pack-index bitmap
+3. times the same traversal again
+
+Repositories are prepared in parallel. The before/after timings are kept per
+repository and summed up in the run summary, so the benefit is visible.
+"""
+
+import concurrent.futures
+import logging
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from util.git import safe_git_command
+
+from gerrit_reporting_tool.collectors.git_backend import GitCommandStream
+from gerrit_reporting_tool.collectors.git_refs import find_common_dir, find_git_dir
+
+
+# Limit for writing the commit-graph or bitmap of one repository, in seconds
+DEFAULT_PREPARE_TIMEOUT = 900.0
+
+
+def _objects_dir(repo_path: Path) -> Optional[Path]:
+    git_dir = find_git_dir(repo_path)
+    if git_dir is None:
+        return None
+    return find_common_dir(git_dir) / "objects"
+
+
+def has_commit_graph(repo_path: Path) -> bool:
+    """Return True if the repository has a commit-graph file or chain."""
+    objects_dir = _objects_dir(repo_path)
+    if objects_dir is None:
+        return False
+    info = objects_dir / "info"
+    return (info / "commit-graph").is_file() or (
+        info / "commit-graphs" / "commit-graph-chain"
+    ).is_file()
+
+
+def has_bitmap(repo_path: Path) -> bool:
+    """Return True if any pack or the multi-pack-index has a reachability bitmap."""
+    objects_dir = _objects_dir(repo_path)
+    if objects_dir is None:
+        return False
+    pack_dir = objects_dir / "pack"
+    try:
+        return any(pack_dir.glob("*.bitmap"))
+    except OSError:
+        return False
+
+
+def time_commit_walk(repo_path: Path, logger: logging.Logger) -> Optional[float]:
+    """
+    Return the wall time of a full commit traversal of HEAD, or None on failure.
+
+    The output is read and discarded chunk by chunk.
+    """
+    start = time.perf_counter()
+    with GitCommandStream(
+        ["git", "log", "--format=%H"], repo_path, logger, text=False
+    ) as stream:
+        for _ in stream.iter_chunks():
+            pass
+    if not stream.success:
+        return None
+    return time.perf_counter() - start
+
+
+@dataclass
+class PreparationResult:
+    """
+    Outcome of preparing one repository.
+
+    Attributes:
+        project: Gerrit project name
+        commit_graph: "present" (already there), "written" or "failed"
+        bitmap: "present", "written", "failed", or None when not requested
+        log_seconds_before: Commit traversal time before writing the graph
+        log_seconds_after: Commit traversal time after writing the graph
+        write_seconds: Time spent writing the commit-graph and bitmap
+        error: Error message of a failed write, or None
+    """
+
+    project: str
+    commit_graph: str
+    bitmap: Optional[str] = None
+    log_seconds_before: Optional[float] = None
+    log_seconds_after: Optional[float] = None
+    write_seconds: float = 0.0
+    error: Optional[str] = None
+
+
+class RepositoryPreparer:
+    """
+    Writes missing commit-graph (and optionally bitmap) indexes in parallel.
+
+    Args:
+        max_workers: Number of repositories prepared concurrently
+        write_bitmaps: Also write a multi-pack-index bitmap where none exists
+        logger: Logger instance
+        timeout: Limit for each write command, in seconds
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        write_bitmaps: bool = False,
+        logger: Optional[logging.Logger] = None,
+        timeout: float = DEFAULT_PREPARE_TIMEOUT,
+    ) -> None:
+        self.max_workers = max(1, max_workers)
+        self.write_bitmaps = write_bitmaps
+        self.logger = logger or logging.getLogger(__name__)
+        self.timeout = timeout
+
+    def prepare(self, repo_path: Path, project: str) -> PreparationResult:
+        """Prepare one repository; never raises for git failures."""
+        needs_graph = not has_commit_graph(repo_path)
+        needs_bitmap = self.write_bitmaps and not has_bitmap(repo_path)
+        result = PreparationResult(
+            project=project,
+            commit_graph="written" if needs_graph else "present",
+            bitmap=("written" if needs_bitmap else "present") if self.write_bitmaps else None,
+        )
+        if not needs_graph and not needs_bitmap:
+            return result
+
+        if needs_graph:
+            result.log_seconds_before = time_commit_walk(repo_path, self.logger)
+
+        start = time.perf_counter()
+        if needs_graph:
+            success, output = safe_git_command(
+                ["git", "commit-graph", "write", "--reachable", "--changed-paths"],
+                repo_path,
+                self.logger,
+                timeout=self.timeout,
+            )
+            if not success:
+                result.commit_graph = "failed"
+                result.error = output
+        if needs_bitmap:
+            success, output = safe_git_command(
+                ["git", "multi-pack-index", "write", "--bitmap"],
+                repo_path,
+                self.logger,
+                timeout=self.timeout,
+            )
+            if not success:
+                result.bitmap = "failed"
+                result.error = result.error or output
+        result.write_seconds = time.perf_counter() - start
+
+        if result.commit_graph == "written":
+            result.log_seconds_after = time_commit_walk(repo_path, self.logger)
+        if result.error:
+            self.logger.warning(f"Could not prepare {project}: {result.error}")
+        return result
+
+    def prepare_all(
+        self, repo_dirs: Sequence[Path], projects: Sequence[str]
+    ) -> List[PreparationResult]:
+        """Prepare all repositories on a thread pool, in input order."""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self.prepare, repo_dirs, projects))
+
+    @staticmethod
+    def summary(
+        results: Sequence[PreparationResult], wall_seconds: float
+    ) -> Dict[str, Any]:
+        """
+        Summarize a preparation stage for the run summary.
+
+        The log timings are summed over the repositories whose commit-graph
+        was written and measured both before and after.
+        """
+        measured = [
+            r
+            for r in results
+            if r.log_seconds_before is not None and r.log_seconds_after is not None
+        ]
+        before = sum(r.log_seconds_before or 0.0 for r in measured)
+        after = sum(r.log_seconds_after or 0.0 for r in measured)
+        return {
+            "repositories": len(results),
+            "commit_graphs_written": sum(1 for r in results if r.commit_graph == "written"),
+            "commit_graphs_present": sum(1 for r in results if r.commit_graph == "present"),
+            "bitmaps_written": sum(1 for r in results if r.bitmap == "written"),
+            "failed": sum(
+                1 for r in results if "failed" in (r.commit_graph, r.bitmap)
+            ),
+            "log_seconds_before": round(before, 3),
+            "log_seconds_after": round(after, 3),
+            "log_speedup": round(before / after, 2) if after > 0 else None,
+            "write_seconds": round(sum(r.write_seconds for r in results), 3),
+            "wall_seconds": round(wall_seconds, 3),
+            "details": [
+                {
+                    key: round(value, 3) if isinstance(value, float) else value
+                    for key, value in asdict(r).items()
+                }
+                for r in results
+                if r.commit_graph != "present" or r.bitmap not in (None, "present")
+            ],
+        }
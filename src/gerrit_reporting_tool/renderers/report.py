@@ -20,6 +20,7 @@ from typing import Any, Union, List
 from domain.info_yaml import ProjectInfo
 from util.formatting import format_number, format_age, UNKNOWN_AGE
 from util.zip_bundle import create_report_bundle
+from rendering.formatters import format_bytes
 from rendering.info_yaml_renderer import InfoYamlRenderer
 
 
@@ -115,6 +116,22 @@ class ReportRenderer:
         if include_sections.get("repo_feature_matrix", True):
             sections.append(self._generate_feature_matrix_section(data))
 
+        # Churn hotspots (only when collected)
+        if include_sections.get("hotspots", True):
+            sections.append(self._generate_hotspots_section(data))
+
+        # Release cadence and stale releases (only when collected)
+        if include_sections.get("releases", True):
+            sections.append(self._generate_releases_section(data))
+
+        # Current code size per repository and extension (only when collected)
+        if include_sections.get("inventory", True):
+            sections.append(self._generate_inventory_section(data))
+
+        # Who last changed the surviving lines (only when collected)
+        if include_sections.get("ownership", True):
+            sections.append(self._generate_ownership_section(data))
+
         # Deployed CI/CD jobs telemetry
         sections.append(self._generate_deployed_workflows_section(data))
 
@@ -1214,6 +1231,163 @@ class ReportRenderer:
 
         return "\n".join(lines)
 
+    def _generate_hotspots_section(self, data: dict[str, Any], limit: int = 20) -> str:
+        """Generate churn hotspots section for the primary reporting window."""
+        window = self.config.get("primary_reporting_window", "last_365")
+        rows = []
+        for repo in data.get("repositories", []):
+            window_data = repo.get("hotspots", {}).get("windows", {}).get(window)
+            if window_data and window_data.get("churn", 0) > 0:
+                rows.append((repo.get("gerrit_project", "Unknown"), window_data))
+
+        if not rows:
+            return ""  # Don't show section if hotspots were not collected
+
+        rows.sort(key=lambda row: row[1]["churn"], reverse=True)
+        period_days = self.config.get("time_windows", {}).get(window, {}).get("days")
+        period = f"the past {period_days:,} days" if period_days else window
+
+        lines = [
+            "## 🔥 Churn Hotspots",
+            "",
+            f"Lines added plus removed over {period}, by top-level directory and path.",
+            "",
+            "| Gerrit Project | Churn | Top Directories | Hottest Paths |",
+            "|----------------|-------|-----------------|---------------|",
+        ]
+        for name, window_data in rows[:limit]:
+            directories = ", ".join(
+                f"{d['directory']} ({self._format_number(d['churn'])})"
+                for d in window_data.get("directories", [])[:3]
+            )
+            paths = ", ".join(
+                f"`{p['path']}` ({self._format_number(p['churn'])})"
+                for p in window_data.get("hottest_paths", [])[:3]
+            )
+            lines.append(
+                f"| {name} | {self._format_number(window_data['churn'])} | {directories} | {paths} |"
+            )
+
+        if len(rows) > limit:
+            lines.extend(["", f"Showing the {limit} repositories with the most churn."])
+        return "\n".join(lines)
+
+    def _generate_releases_section(self, data: dict[str, Any], limit: int = 20) -> str:
+        """Generate the stale releases leaderboard."""
+        rows = data.get("summaries", {}).get("stale_releases", [])
+        if not rows:
+            return ""  # Don't show section if releases were not collected
+
+        lines = [
+            "## 🏷️ Release Cadence",
+            "",
+            "Repositories with tags, longest time since the last release first.",
+            "",
+            "| Gerrit Project | Last Release | Date | Days Since | Median Interval (days) | Tags |",
+            "|----------------|--------------|------|------------|------------------------|------|",
+        ]
+        for row in rows[:limit]:
+            last_release = row.get("last_release") or {}
+            median = row.get("median_release_interval_days")
+            lines.append(
+                f"| {row.get('gerrit_project', 'Unknown')} "
+                f"| `{last_release.get('tag', '')}` "
+                f"| {(last_release.get('date') or '')[:10]} "
+                f"| {row.get('days_since_last_release') or 0:,} "
+                f"| {'-' if median is None else f'{median:g}'} "
+                f"| {self._format_number(row.get('tag_count', 0))} |"
+            )
+
+        if len(rows) > limit:
+            lines.extend(["", f"Showing the {limit} repositories with the stalest releases."])
+        return "\n".join(lines)
+
+    def _generate_inventory_section(self, data: dict[str, Any], limit: int = 20) -> str:
+        """Generate the code-size section: largest repositories and extensions."""
+        summaries = data.get("summaries", {})
+        rows = summaries.get("largest_repositories", [])
+        if not rows:
+            return ""  # Don't show section if the inventory was not collected
+
+        lines = [
+            "## 📦 Code Size",
+            "",
+            "Size of the files at HEAD, largest repositories first.",
+            "",
+            "| Gerrit Project | Size | Files | Largest Extension |",
+            "|----------------|------|-------|-------------------|",
+        ]
+        for row in rows[:limit]:
+            extensions = row.get("extensions") or [{}]
+            lines.append(
+                f"| {row.get('gerrit_project', 'Unknown')} "
+                f"| {format_bytes(row.get('total_bytes', 0))} "
+                f"| {self._format_number(row.get('total_files', 0))} "
+                f"| `{extensions[0].get('extension', '')}` |"
+            )
+        if len(rows) > limit:
+            lines.extend(["", f"Showing the {limit} largest repositories."])
+
+        inventory = summaries.get("code_inventory", {})
+        extensions = inventory.get("extensions", [])
+        if extensions:
+            lines.extend(
+                [
+                    "",
+                    f"### All Repositories ({format_bytes(inventory.get('total_bytes', 0))})",
+                    "",
+                    "| Extension | Size | Files | Repositories |",
+                    "|-----------|------|-------|--------------|",
+                ]
+            )
+            for row in extensions[:limit]:
+                lines.append(
+                    f"| `{row['extension']}` "
+                    f"| {format_bytes(row['bytes'])} "
+                    f"| {self._format_number(row['files'])} "
+                    f"| {row['repositories']:,} |"
+                )
+        return "\n".join(lines)
+
+    def _generate_ownership_section(self, data: dict[str, Any], limit: int = 20) -> str:
+        """Generate the code ownership section: top organizations and authors."""
+        ownership = data.get("summaries", {}).get("code_ownership", {})
+        if not ownership.get("lines"):
+            return ""  # Don't show section if ownership was not collected
+
+        lines = [
+            "## 🧭 Code Ownership",
+            "",
+            f"Authors of the lines surviving at HEAD, from blaming "
+            f"{self._format_number(ownership.get('files', 0))} sampled files in "
+            f"{ownership.get('repositories', 0):,} repositories "
+            f"({self._format_number(ownership['lines'])} lines).",
+            "",
+            "| Organization | Lines | Ownership |",
+            "|--------------|-------|-----------|",
+        ]
+        for row in ownership.get("organizations", [])[:limit]:
+            lines.append(
+                f"| {row['domain']} "
+                f"| {self._format_number(row['lines'])} "
+                f"| {row['percent']:.1f}% |"
+            )
+        lines.extend(
+            [
+                "",
+                "| Author | Email | Lines | Ownership |",
+                "|--------|-------|-------|-----------|",
+            ]
+        )
+        for row in ownership.get("authors", [])[:limit]:
+            lines.append(
+                f"| {row['name']} "
+                f"| {row['email']} "
+                f"| {self._format_number(row['lines'])} "
+                f"| {row['percent']:.1f}% |"
+            )
+        return "\n".join(lines)
+
     def _generate_orphaned_jobs_section(self, data: dict[str, Any]) -> str:
         """Generate section for Jenkins jobs matched to archived/read-only Gerrit projects."""
         orphaned_data = data.get("orphaned_jenkins_jobs", {})
@@ -22,16 +22,26 @@ import atexit
 import concurrent.futures
 import datetime
 import logging
+import multiprocessing
 import os
 import shutil
 import tempfile
+import time
 from pathlib import Path
 from typing import Any, Optional, cast
 
 from gerrit_reporting_tool.aggregators import DataAggregator
 from gerrit_reporting_tool.collectors import GitDataCollector, INFOYamlCollector
 from gerrit_reporting_tool.features import FeatureRegistry
+from gerrit_reporting_tool.preparation import RepositoryPreparer
 from gerrit_reporting_tool.renderers import ReportRenderer
+from gerrit_reporting_tool.scheduling import RepositoryScheduler
+from gerrit_reporting_tool.sync import (
+    DEFAULT_SYNC_WORKERS,
+    RepositorySyncer,
+    gerrit_sync_projects,
+    list_local_projects,
+)
 from util.git import safe_git_command
 from util.zip_bundle import create_report_bundle
 from gerrit_reporting_tool.config import save_resolved_config
@@ -57,10 +67,21 @@ class RepositoryReporter:
         self.api_stats = api_stats
         self.git_collector = GitDataCollector(config, {}, logger, api_stats=api_stats)
         self.feature_registry = FeatureRegistry(config, logger, api_stats=api_stats)
-        self.aggregator = DataAggregator(config, logger)
+        self.aggregator = DataAggregator(
+            config, logger, identities=self.git_collector.identities
+        )
         self.renderer = ReportRenderer(config, logger)
         self.info_yaml_collector = INFOYamlCollector(config)
         self.info_master_temp_dir: Optional[str] = None
+        # Measured analysis time per repository path, and the schedule summary
+        # of the latest analysis (predicted vs actual makespan)
+        self._repo_durations: dict[Path, float] = {}
+        self.schedule_report: Optional[dict[str, Any]] = None
+        # Summary of the repository preparation stage (commit-graph writes and
+        # before/after log timings), when enabled
+        self.preparation_report: Optional[dict[str, Any]] = None
+        # Summary of the sync stage (clones, updates, failures), when enabled
+        self.sync_report: Optional[dict[str, Any]] = None
 
     def _cleanup_info_master_repo(self) -> None:
         """Clean up the temporary info-master repository directory."""
@@ -120,10 +141,12 @@ class RepositoryReporter:
         Coordinates all phases of repository analysis:
         1. Clone info-master for additional context
         2. Initialize report data structure
-        3. Discover all repositories
-        4. Analyze repositories in parallel
-        5. Aggregate data across repositories
-        6. Generate Jenkins allocation summary
+        3. Optionally clone or update the Gerrit projects (sync)
+        4. Discover all repositories
+        5. Optionally prepare repositories (commit-graph, bitmaps)
+        6. Analyze repositories in parallel
+        7. Aggregate data across repositories
+        8. Generate Jenkins allocation summary
 
         Args:
             repos_path: Path to directory containing repositories to analyze
@@ -169,6 +192,16 @@ class RepositoryReporter:
             "errors": [],
         }
 
+        # Record run metadata in the durable metrics store, if enabled
+        metrics_store = self.git_collector.state_store
+        run_id = None
+        if metrics_store:
+            run_id = metrics_store.start_run(
+                project=str(report_data["project"]),
+                tool_version=str(report_data["script_version"]),
+                config_digest=str(report_data["config_digest"]),
+            )
+
         # Update git collector with time windows
         self.git_collector.time_windows = cast(
             dict[str, dict[str, Any]], report_data["time_windows"]
@@ -177,12 +210,24 @@ class RepositoryReporter:
         # Update git collector with repos_path for relative path calculation
         self.git_collector.repos_path = repos_path_abs
 
+        # Clone missing projects and update existing ones before discovery
+        if self.config.get("sync", {}).get("enabled", False):
+            self._sync_repositories(repos_path_abs)
+
         # Find all repository directories
         repo_dirs = self._discover_repositories(repos_path_abs)
         self.logger.info(f"Found {len(repo_dirs)} repositories to analyze")
 
-        # Analyze repositories (with concurrency)
-        repo_metrics = self._analyze_repositories_parallel(repo_dirs)
+        # Write missing commit-graph files before the history walks
+        if self.config.get("performance", {}).get("prepare_repositories", False):
+            self._prepare_repositories(repo_dirs)
+
+        # Analyze repositories (with concurrency). Copies of a history that
+        # another repository shares run afterwards and reuse its aggregates.
+        alias_dirs: list[Path] = []
+        if self.git_collector.deduplicate_histories:
+            repo_dirs, alias_dirs = self._split_history_aliases(repo_dirs)
+        repo_metrics = self._analyze_repositories_parallel(repo_dirs, alias_dirs)
 
         # Extract successful metrics and errors
         successful_repos = []
@@ -193,6 +238,7 @@ class RepositoryReporter:
                 # Extract the repository record with embedded author data
                 successful_repos.append(metrics["repository"])
 
+        self._link_history_aliases(successful_repos)
         report_data["repositories"] = successful_repos
 
         # Aggregate data (pass repository records directly)
@@ -298,6 +344,42 @@ class RepositoryReporter:
                 for state, count in orphaned_summary["by_state"].items():
                     self.logger.info(f"  - {count} jobs for {state} projects")
 
+        if self.schedule_report:
+            report_data["schedule"] = self.schedule_report
+        if self.sync_report:
+            report_data["sync"] = self.sync_report
+        if self.preparation_report:
+            report_data["preparation"] = self.preparation_report
+
+        identity_stats = self.git_collector.identities.get_stats()
+        self.logger.info(
+            f"Author identities: {identity_stats['identities']} raw, "
+            f"{identity_stats['authors']} distinct authors "
+            f"({identity_stats['hit_rate']}% lookup hit rate)"
+        )
+        report_data["identity_table"] = identity_stats
+
+        if metrics_store and run_id is not None:
+            cache_stats = self.git_collector.get_cache_stats()
+            self.logger.info(
+                f"Git metrics cache: {cache_stats['hits']} hits, "
+                f"{cache_stats['misses']} misses ({cache_stats['hit_rate']}% hit rate)"
+            )
+            report_data["git_cache"] = cache_stats
+            metrics_store.finish_run(
+                run_id,
+                repositories=len(report_data["repositories"]),
+                errors=len(report_data["errors"]),
+                details={
+                    "cache": cache_stats,
+                    "identities": identity_stats,
+                    "schedule": self.schedule_report,
+                    "preparation": self.preparation_report,
+                    "sync": self.sync_report,
+                    "time_windows": sorted(report_data["time_windows"]),
+                },
+            )
+
         self.logger.info(
             f"Analysis complete: {len(report_data['repositories'])} repositories, {len(report_data['errors'])} errors"
         )
@@ -476,20 +558,250 @@ class RepositoryReporter:
 
         return unique_repos
 
-    def _analyze_repositories_parallel(
+    def _split_history_aliases(
         self, repo_dirs: list[Path]
+    ) -> tuple[list[Path], list[Path]]:
+        """
+        Split repositories into distinct histories and copies of them.
+
+        Repositories are grouped by GitDataCollector.history_key (HEAD and
+        branch tips, read from the ref files). The project that sorts first
+        in each group is analysed; the others are returned as aliases, to be
+        analysed after it. Discovery order is kept within both lists.
+        """
+        groups: dict[str, list[Path]] = {}
+        for repo_dir in repo_dirs:
+            key = self.git_collector.history_key(repo_dir)
+            if key is not None:
+                groups.setdefault(key, []).append(repo_dir)
+
+        aliases = {
+            repo_dir
+            for members in groups.values()
+            for repo_dir in sorted(members, key=self._project_name)[1:]
+        }
+        if aliases:
+            self.logger.info(
+                f"{len(aliases)} repositories share their history with another "
+                "repository and reuse its analysis"
+            )
+        return (
+            [repo_dir for repo_dir in repo_dirs if repo_dir not in aliases],
+            [repo_dir for repo_dir in repo_dirs if repo_dir in aliases],
+        )
+
+    @staticmethod
+    def _link_history_aliases(repositories: list[dict[str, Any]]) -> None:
+        """List the aliases (``alias_of`` records) on the repository they copy."""
+        aliases: dict[str, list[str]] = {}
+        for repo in repositories:
+            if repo.get("alias_of"):
+                aliases.setdefault(repo["alias_of"], []).append(repo["gerrit_project"])
+        for repo in repositories:
+            if repo.get("gerrit_project") in aliases:
+                repo["aliases"] = sorted(aliases[repo["gerrit_project"]])
+
+    def _sync_projects(self, url_template: str) -> list[str]:
+        """
+        Return the projects to sync.
+
+        ``sync.projects`` when set, otherwise the Gerrit project list, or the
+        repositories served by a ``file://`` URL template.
+        """
+        projects = self.config.get("sync", {}).get("projects") or []
+        if projects:
+            return list(projects)
+        if self.git_collector.gerrit_projects_cache:
+            return gerrit_sync_projects(self.git_collector.gerrit_projects_cache)
+        return list_local_projects(url_template) or []
+
+    def _sync_repositories(self, repos_path: Path) -> None:
+        """Clone or update the projects under ``repos_path`` in parallel."""
+        sync_config = self.config.get("sync", {})
+        url_template = sync_config.get("url_template")
+        gerrit_client = self.git_collector.gerrit_client
+        if not url_template and gerrit_client is not None:
+            url_template = gerrit_client.base_url
+        if not url_template:
+            self.logger.error("Sync enabled but no sync.url_template or Gerrit host configured")
+            return
+
+        projects = self._sync_projects(url_template)
+        if not projects:
+            self.logger.warning("Sync enabled but no projects to sync")
+            return
+
+        reference_dir = sync_config.get("reference_dir")
+        syncer = RepositorySyncer(
+            repos_path,
+            url_template,
+            max_workers=sync_config.get("max_workers") or DEFAULT_SYNC_WORKERS,
+            reference_dir=Path(reference_dir) if reference_dir else None,
+            partial_filter=sync_config.get("filter"),
+            logger=self.logger,
+        )
+        start = time.perf_counter()
+        results = syncer.sync_all(projects)
+        self.sync_report = syncer.summary(results, time.perf_counter() - start)
+
+        report = self.sync_report
+        self.logger.info(
+            f"Repository sync: {report['cloned']} cloned, {report['updated']} updated, "
+            f"{report['failed']} failed in {report['wall_seconds']}s"
+        )
+
+    def _prepare_repositories(self, repo_dirs: list[Path]) -> None:
+        """
+        Write missing commit-graph (and optionally bitmap) indexes in parallel.
+
+        The summary, including the commit traversal time before and after
+        writing each commit-graph, is kept in preparation_report.
+        """
+        performance_config = self.config.get("performance", {})
+        preparer = RepositoryPreparer(
+            performance_config.get("max_workers", 8),
+            write_bitmaps=bool(performance_config.get("prepare_bitmaps", False)),
+            logger=self.logger,
+        )
+        start = time.perf_counter()
+        results = preparer.prepare_all(repo_dirs, [self._project_name(p) for p in repo_dirs])
+        self.preparation_report = preparer.summary(results, time.perf_counter() - start)
+
+        report = self.preparation_report
+        self.logger.info(
+            f"Repository preparation: {report['commit_graphs_written']} commit-graphs "
+            f"written, {report['commit_graphs_present']} present, {report['failed']} "
+            f"failed in {report['wall_seconds']}s; commit walk "
+            f"{report['log_seconds_before']}s -> {report['log_seconds_after']}s"
+        )
+
+    def _analyze_repositories_parallel(
+        self, repo_dirs: list[Path], alias_dirs: Optional[list[Path]] = None
     ) -> list[dict[str, Any]]:
         """
         Analyze repositories with optional concurrency.
 
+        Git history walks are bounded by ``performance.repo_timeout`` per
+        repository and ``performance.phase_timeout`` for the whole phase.
+
+        ``alias_dirs`` (see _split_history_aliases) are analysed within the
+        same phase budget, but only once all of ``repo_dirs`` are done: an
+        alias reuses the aggregates of the repository it copies, which must
+        have been collected first.
+
+        Repositories are dispatched longest-predicted-first (see
+        scheduling.py) unless ``performance.scheduling`` is ``discovery``; the
+        predicted and actual makespan are logged and kept in schedule_report.
+
+        With ``performance.execution_mode: process``, repositories are still
+        orchestrated by threads, but git log parsing and metric folding run in
+        a process pool so they are not serialized by the GIL.
+
         Args:
             repo_dirs: List of repository paths to analyze
+            alias_dirs: Repository paths sharing a history with one of
+                ``repo_dirs``
 
         Returns:
-            List of analysis results (metrics or error records)
+            List of analysis results (metrics or error records), aliases last
         """
-        max_workers = self.config.get("performance", {}).get("max_workers", 8)
+        performance_config = self.config.get("performance", {})
+        max_workers = performance_config.get("max_workers", 8)
+
+        # Repositories still walking when the phase budget runs out keep the
+        # history folded so far and are flagged as partial
+        phase_timeout = performance_config.get("phase_timeout")
+        if phase_timeout:
+            self.git_collector.phase_deadline = time.time() + float(phase_timeout)
+        try:
+            if performance_config.get("scheduling", "cost") == "cost":
+                results = self._analyze_repositories_scheduled(repo_dirs, max_workers)
+            else:
+                results = self._analyze_repositories_in_mode(repo_dirs, max_workers)
+            if alias_dirs:
+                results += self._analyze_repositories(alias_dirs, max_workers)
+        finally:
+            self.git_collector.phase_deadline = None
+
+        partial = [
+            r["repository"]["gerrit_project"]
+            for r in results
+            if r.get("repository", {}).get("partial")
+        ]
+        if partial:
+            self.logger.warning(
+                f"{len(partial)} repositories exceeded their time budget and have "
+                f"partial history: {', '.join(sorted(partial)[:10])}"
+            )
+        return results
 
+    def _analyze_repositories_scheduled(
+        self, repo_dirs: list[Path], max_workers: int
+    ) -> list[dict[str, Any]]:
+        """Analyze repositories in cost order and record the schedule outcome."""
+        metrics_store = self.git_collector.state_store
+        scheduler = RepositoryScheduler(
+            max_workers,
+            metrics_store.load_timings() if metrics_store else None,
+            self.logger,
+        )
+        plan = scheduler.plan(repo_dirs, [self._project_name(p) for p in repo_dirs])
+
+        self._repo_durations = {}
+        start = time.perf_counter()
+        results = self._analyze_repositories_in_mode([cost.path for cost in plan], max_workers)
+        wall_seconds = time.perf_counter() - start
+
+        self.schedule_report = scheduler.report(plan, self._repo_durations, wall_seconds)
+        self.logger.info(
+            f"Repository schedule: predicted makespan "
+            f"{self.schedule_report['predicted_makespan']}s, actual "
+            f"{self.schedule_report['actual_makespan']}s with {max_workers} workers "
+            f"({self.schedule_report['from_history']}/{len(plan)} estimates from history)"
+        )
+        if metrics_store:
+            metrics_store.save_timings(
+                (cost.project, self._repo_durations[cost.path], cost.size_bytes)
+                for cost in plan
+                if cost.path in self._repo_durations
+            )
+        return results
+
+    def _project_name(self, repo_path: Path) -> str:
+        """Return the Gerrit project name the git collector uses for a repository."""
+        repos_path = self.git_collector.repos_path
+        if repos_path:
+            try:
+                return str(repo_path.relative_to(repos_path))
+            except ValueError:
+                pass
+        return repo_path.name
+
+    def _analyze_repositories_in_mode(
+        self, repo_dirs: list[Path], max_workers: int
+    ) -> list[dict[str, Any]]:
+        """Analyze repositories in order, in the configured execution mode."""
+        performance_config = self.config.get("performance", {})
+        if performance_config.get("execution_mode", "thread") != "process":
+            return self._analyze_repositories(repo_dirs, max_workers)
+
+        process_workers = performance_config.get("process_workers") or os.cpu_count() or 1
+        self.logger.info(f"Parsing git history in {process_workers} worker processes")
+        # spawn: the parent already runs threads, which fork does not mix well with
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=process_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as walk_executor:
+            self.git_collector.walk_executor = walk_executor
+            try:
+                return self._analyze_repositories(repo_dirs, max_workers)
+            finally:
+                self.git_collector.walk_executor = None
+
+    def _analyze_repositories(
+        self, repo_dirs: list[Path], max_workers: int
+    ) -> list[dict[str, Any]]:
+        """Analyze repositories sequentially or on a thread pool of ``max_workers``."""
         if max_workers == 1:
             # Sequential processing
             return [self._analyze_single_repository(repo_dir) for repo_dir in repo_dirs]
@@ -529,6 +841,7 @@ class RepositoryReporter:
         Returns:
             Repository metrics dictionary or error record
         """
+        start = time.perf_counter()
         try:
             self.logger.debug(f"Analyzing repository: {repo_path.name}")
 
@@ -548,6 +861,8 @@ class RepositoryReporter:
                 "repo": repo_path.name,
                 "category": "repository_analysis",
             }
+        finally:
+            self._repo_durations[repo_path] = time.perf_counter() - start
 
     def _compute_config_digest(self, config: dict[str, Any]) -> str:
         """
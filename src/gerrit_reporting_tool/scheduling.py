@@ -0,0 +1,221 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Cost-model-driven repository scheduling.
+
+Repositories are submitted to the worker pool all at once and started in
+submission order. When the largest repository happens to be submitted last,
+it runs alone at the end and sets the wall time of the whole run. Dispatching
+the most expensive repositories first (longest-processing-time-first, LPT)
+bounds the makespan to within 4/3 of the optimum.
+
+The cost of a repository is estimated, in seconds, from:
+
+- the analysis time recorded in the previous run (MetricsStore), or
+- the on-disk size of its object database (pack files and loose objects),
+  converted to seconds with a rate calibrated on the repositories that do
+  have a recorded time
+
+Nested repositories keep the existing guarantee that child projects are
+dispatched before their parents (Jenkins job allocation relies on it): a
+parent is scheduled with the priority of its most expensive descendant and
+sorts right after it.
+"""
+
+import heapq
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from gerrit_reporting_tool.collectors.git_refs import find_common_dir, find_git_dir
+
+
+# Fallback conversion of object database size to analysis time, used until a
+# run with recorded timings is available for calibration
+DEFAULT_SECONDS_PER_MB = 0.5
+
+# Fixed per-repository cost (process spawns, ref reads, feature scan)
+DEFAULT_OVERHEAD_SECONDS = 0.05
+
+
+@dataclass
+class RepositoryCost:
+    """
+    Estimated analysis cost of one repository.
+
+    Attributes:
+        path: Repository path
+        project: Gerrit project name (path relative to the scan root)
+        size_bytes: Size of the object database
+        seconds: Predicted analysis time
+        source: "history" (recorded time) or "size" (object database size)
+    """
+
+    path: Path
+    project: str
+    size_bytes: int
+    seconds: float
+    source: str
+
+
+def object_database_size(repo_path: Path) -> int:
+    """
+    Return the size in bytes of a repository's packs and loose objects.
+
+    Reads the object directory directly; no git process is spawned. Returns 0
+    when the git directory cannot be found.
+    """
+    git_dir = find_git_dir(repo_path)
+    if git_dir is None:
+        return 0
+
+    total = 0
+    objects_dir = find_common_dir(git_dir) / "objects"
+    try:
+        with os.scandir(objects_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if entry.name == "pack":
+                    total += sum(
+                        pack.stat().st_size
+                        for pack in os.scandir(entry.path)
+                        if pack.name.endswith(".pack")
+                    )
+                elif len(entry.name) == 2:
+                    total += sum(obj.stat().st_size for obj in os.scandir(entry.path))
+    except OSError:
+        pass
+    return total
+
+
+def simulate_makespan(costs: Sequence[float], workers: int) -> float:
+    """Return the makespan of list-scheduling ``costs`` in order on ``workers``."""
+    if not costs:
+        return 0.0
+    finish_times = [0.0] * max(1, min(workers, len(costs)))
+    for cost in costs:
+        heapq.heappush(finish_times, heapq.heappop(finish_times) + cost)
+    return max(finish_times)
+
+
+class RepositoryScheduler:
+    """
+    Orders repositories longest-predicted-first.
+
+    Args:
+        max_workers: Number of concurrent workers the order is planned for
+        history: Project -> (seconds, size_bytes) recorded in a previous run
+        logger: Logger instance
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        history: Optional[Mapping[str, Tuple[float, int]]] = None,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self.max_workers = max(1, max_workers)
+        self.history = dict(history or {})
+        self.logger = logger or logging.getLogger(__name__)
+        self.seconds_per_byte = self._calibrate()
+
+    def _calibrate(self) -> float:
+        """Fit analysis seconds per object database byte on recorded timings."""
+        seconds = sum(s - DEFAULT_OVERHEAD_SECONDS for s, size in self.history.values() if size)
+        size = sum(size for _, size in self.history.values() if size)
+        if size and seconds > 0:
+            return seconds / size
+        return DEFAULT_SECONDS_PER_MB / 1e6
+
+    def estimate(self, repo_path: Path, project: str) -> RepositoryCost:
+        """Estimate the analysis cost of a repository."""
+        size = object_database_size(repo_path)
+        recorded = self.history.get(project)
+        if recorded is not None:
+            return RepositoryCost(repo_path, project, size, recorded[0], "history")
+        return RepositoryCost(
+            repo_path,
+            project,
+            size,
+            DEFAULT_OVERHEAD_SECONDS + size * self.seconds_per_byte,
+            "size",
+        )
+
+    def order(self, costs: Sequence[RepositoryCost]) -> List[RepositoryCost]:
+        """
+        Return ``costs`` in dispatch order: most expensive first.
+
+        A repository nested inside another one inherits, for ordering only,
+        the cost of its parent's heaviest descendant, so children are always
+        dispatched before their parents.
+        """
+        priority: Dict[Path, float] = {cost.path: cost.seconds for cost in costs}
+        # Deepest first, so each priority is final before it is propagated up
+        for cost in sorted(costs, key=lambda c: -len(c.path.parts)):
+            for parent in cost.path.parents:
+                if parent in priority:
+                    priority[parent] = max(priority[parent], priority[cost.path])
+                    break
+        return sorted(
+            costs,
+            key=lambda c: (-priority[c.path], -len(c.path.parts), str(c.path)),
+        )
+
+    def plan(
+        self, repo_dirs: Sequence[Path], projects: Sequence[str]
+    ) -> List[RepositoryCost]:
+        """Estimate every repository and return them in dispatch order."""
+        return self.order(
+            [self.estimate(path, project) for path, project in zip(repo_dirs, projects)]
+        )
+
+    def report(
+        self,
+        plan: Sequence[RepositoryCost],
+        actual_seconds: Mapping[Path, float],
+        wall_seconds: float,
+    ) -> Dict[str, Any]:
+        """
+        Compare the planned schedule with the measured run.
+
+        Args:
+            plan: Repositories in dispatch order, as returned by plan()
+            actual_seconds: Measured analysis time per repository path
+            wall_seconds: Measured wall time of the whole analysis
+
+        Returns:
+            Summary with predicted and actual makespan and the largest
+            per-repository prediction errors
+        """
+        predicted = simulate_makespan([cost.seconds for cost in plan], self.max_workers)
+        replayed = simulate_makespan(
+            [actual_seconds.get(cost.path, 0.0) for cost in plan], self.max_workers
+        )
+        measured = sorted(
+            (cost for cost in plan if cost.path in actual_seconds),
+            key=lambda cost: -abs(actual_seconds[cost.path] - cost.seconds),
+        )
+        errors = [
+            {
+                "project": cost.project,
+                "predicted": round(cost.seconds, 3),
+                "actual": round(actual_seconds[cost.path], 3),
+                "source": cost.source,
+            }
+            for cost in measured[:10]
+        ]
+        return {
+            "max_workers": self.max_workers,
+            "repositories": len(plan),
+            "from_history": sum(1 for cost in plan if cost.source == "history"),
+            "predicted_makespan": round(predicted, 3),
+            "replayed_makespan": round(replayed, 3),
+            "actual_makespan": round(wall_seconds, 3),
+            "total_work": round(sum(actual_seconds.values()), 3),
+            "seconds_per_mb": round(self.seconds_per_byte * 1e6, 6),
+            "largest_errors": errors,
+        }
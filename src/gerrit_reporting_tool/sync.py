@@ -0,0 +1,224 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Repository sync stage run before analysis.
+
+Brings ``--repos-path`` up to date with the Gerrit project list, so the tool
+no longer needs a separate clone script. For every project the stage:
+
+- clones it to ``<repos-path>/<project>`` when missing, through
+  GitOptimizer (complete history: the analysis walks all of it)
+- otherwise fetches it and fast-forwards the checked-out branch
+
+Projects are synced in parallel with ``sync.max_workers`` workers. Two
+options reduce what is transferred:
+
+- ``sync.reference_dir``: bare reference repositories kept per project
+  URL; new clones borrow their objects (``git clone --reference``), so a
+  wiped repos path is re-cloned locally. The directory must be kept as
+  long as the clones, which depend on it.
+- ``sync.filter``: partial clone filter, e.g. ``blob:limit=1m`` to leave
+  out large binaries. Missing blobs are fetched on demand when a history
+  walk needs them, so filters that omit all blobs make the analysis slow.
+
+The project list comes from ``sync.projects`` when set, otherwise from the
+Gerrit API (hidden projects and All-Projects/All-Users are skipped). Clone
+URLs are built from ``sync.url_template``, defaulting to the Gerrit base
+URL. A ``file://`` template pointing at a directory of bare repositories
+is a complete local stand-in for Gerrit: without an explicit list, the
+projects are the repositories found there.
+"""
+
+import concurrent.futures
+import logging
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+from urllib.parse import unquote, urlparse
+
+from performance.git_optimizer import CloneStrategy, GitConfig, GitOptimizer
+from util.git import safe_git_command
+
+from gerrit_reporting_tool.collectors.git_backend import DEFAULT_GIT_TIMEOUT
+
+
+# Projects synced concurrently by default
+DEFAULT_SYNC_WORKERS = 4
+
+# Placeholder for the Gerrit project name in sync.url_template
+PROJECT_PLACEHOLDER = "{project}"
+
+# Gerrit's own configuration projects, which hold no branches
+GERRIT_META_PROJECTS = ("All-Projects", "All-Users")
+
+
+def project_clone_url(url_template: str, project: str) -> str:
+    """Return the clone URL of ``project``; templates without placeholder get it appended."""
+    if PROJECT_PLACEHOLDER in url_template:
+        return url_template.replace(PROJECT_PLACEHOLDER, project)
+    return f"{url_template.rstrip('/')}/{project}"
+
+
+def gerrit_sync_projects(projects: Mapping[str, Dict[str, Any]]) -> List[str]:
+    """Return the projects of a Gerrit ``/projects/`` listing worth syncing."""
+    return sorted(
+        name
+        for name, info in projects.items()
+        if name not in GERRIT_META_PROJECTS and info.get("state") != "HIDDEN"
+    )
+
+
+def list_local_projects(url_template: str) -> Optional[List[str]]:
+    """
+    Return the projects served by a ``file://`` URL template.
+
+    The template part before ``{project}`` names the base directory and the
+    part after it (typically ``.git``) the suffix of each repository. Every
+    bare repository or working tree below the base directory whose path
+    ends with the suffix is a project. None for other URL schemes.
+    """
+    if PROJECT_PLACEHOLDER not in url_template:
+        url_template = f"{url_template.rstrip('/')}/{PROJECT_PLACEHOLDER}"
+    prefix, _, suffix = url_template.partition(PROJECT_PLACEHOLDER)
+    parsed = urlparse(prefix)
+    if parsed.scheme != "file":
+        return None
+    base = Path(unquote(parsed.path))
+    if not base.is_dir():
+        return []
+
+    projects = []
+    for head in base.rglob("HEAD"):
+        repo = head.parent
+        if repo.name == ".git":
+            repo = repo.parent
+        elif not (repo / "objects").is_dir():
+            continue
+        relative = repo.relative_to(base).as_posix()
+        if relative != "." and relative.endswith(suffix):
+            projects.append(relative[: len(relative) - len(suffix)] if suffix else relative)
+    return sorted(set(projects))
+
+
+@dataclass
+class SyncResult:
+    """
+    Outcome of syncing one project.
+
+    Attributes:
+        project: Gerrit project name
+        action: "cloned", "updated" or "failed"
+        seconds: Wall time of the clone or fetch
+        error: Error message of a failed sync, or None
+    """
+
+    project: str
+    action: str
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+class RepositorySyncer:
+    """
+    Clones missing projects and updates existing ones in parallel.
+
+    Args:
+        repos_path: Directory holding one working tree per project
+        url_template: Clone URL with a ``{project}`` placeholder
+        max_workers: Number of projects synced concurrently
+        reference_dir: Directory of shared reference repositories, or None
+        partial_filter: Partial clone filter spec, or None
+        logger: Logger instance
+        timeout: Limit for each fetch or fast-forward, in seconds
+    """
+
+    def __init__(
+        self,
+        repos_path: Path,
+        url_template: str,
+        max_workers: int = DEFAULT_SYNC_WORKERS,
+        reference_dir: Optional[Path] = None,
+        partial_filter: Optional[str] = None,
+        logger: Optional[logging.Logger] = None,
+        timeout: float = DEFAULT_GIT_TIMEOUT,
+    ) -> None:
+        self.repos_path = repos_path
+        self.url_template = url_template
+        self.max_workers = max(1, max_workers)
+        self.logger = logger or logging.getLogger(__name__)
+        self.timeout = timeout
+        git_config = GitConfig(
+            shallow_clone=False,
+            use_reference_repos=reference_dir is not None,
+            partial_clone_filter=partial_filter or None,
+        )
+        if reference_dir is not None:
+            git_config.reference_dir = str(reference_dir)
+        self.optimizer = GitOptimizer(git_config)
+        self.strategy = (
+            CloneStrategy.REFERENCE if reference_dir is not None else CloneStrategy.FULL
+        )
+
+    def sync(self, project: str) -> SyncResult:
+        """Clone or update one project; never raises for git failures."""
+        destination = self.repos_path / project
+        start = time.perf_counter()
+        if (destination / ".git").exists():
+            result = self._update(project, destination)
+        else:
+            clone = self.optimizer.clone_optimized(
+                project_clone_url(self.url_template, project),
+                str(destination),
+                strategy=self.strategy,
+            )
+            result = SyncResult(
+                project,
+                "cloned" if clone.is_success else "failed",
+                error=None if clone.is_success else clone.error.strip(),
+            )
+        result.seconds = time.perf_counter() - start
+        if result.error:
+            self.logger.warning(f"Could not sync {project}: {result.error}")
+        return result
+
+    def _update(self, project: str, destination: Path) -> SyncResult:
+        """Fetch an existing clone and fast-forward its checked-out branch."""
+        fetch = self.optimizer.fetch_optimized(str(destination))
+        if not fetch.is_success:
+            return SyncResult(project, "failed", error=fetch.error.strip())
+        success, output = safe_git_command(
+            ["git", "merge", "--ff-only", "-q", "@{upstream}"],
+            destination,
+            self.logger,
+            timeout=self.timeout,
+        )
+        if not success:
+            return SyncResult(project, "failed", error=output)
+        return SyncResult(project, "updated")
+
+    def sync_all(self, projects: Sequence[str]) -> List[SyncResult]:
+        """Sync all projects on a thread pool, in input order."""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self.sync, projects))
+
+    @staticmethod
+    def summary(results: Sequence[SyncResult], wall_seconds: float) -> Dict[str, Any]:
+        """Summarize a sync stage for the run summary; only failures are detailed."""
+        return {
+            "repositories": len(results),
+            "cloned": sum(1 for r in results if r.action == "cloned"),
+            "updated": sum(1 for r in results if r.action == "updated"),
+            "failed": sum(1 for r in results if r.action == "failed"),
+            "sync_seconds": round(sum(r.seconds for r in results), 3),
+            "wall_seconds": round(wall_seconds, 3),
+            "details": [
+                {
+                    key: round(value, 3) if isinstance(value, float) else value
+                    for key, value in asdict(r).items()
+                }
+                for r in results
+                if r.action == "failed"
+            ],
+        }
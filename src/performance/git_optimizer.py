@@ -67,6 +67,8 @@ class GitConfig:
         parallel_fetch: Number of parallel fetch operations
         compression: Git compression level (0-9)
         http_post_buffer: HTTP post buffer size in bytes
+        partial_clone_filter: Partial clone filter spec (e.g. "blob:limit=1m"),
+            None for complete clones
     """
     shallow_clone: bool = True
     shallow_depth: int = 1
@@ -75,6 +77,7 @@ class GitConfig:
     parallel_fetch: int = 4
     compression: int = 9
     http_post_buffer: int = 524288000  # 500MB
+    partial_clone_filter: Optional[str] = None
 
     def validate(self):
         """Validate configuration."""
@@ -225,7 +228,10 @@ class ReferenceRepository:
             True if reference exists
         """
         ref_path = self._get_reference_path(repo_url)
-        return ref_path.exists() and (ref_path / ".git").exists()
+        # References are bare clones; non-bare ones are accepted as well
+        return ref_path.exists() and (
+            (ref_path / "HEAD").exists() or (ref_path / ".git").exists()
+        )
 
     def create_reference(self, repo_url: str, update: bool = False) -> Optional[Path]:
         """
@@ -497,6 +503,10 @@ class GitOptimizer:
                 if ref_path:
                     cmd.extend(["--reference", str(ref_path)])
 
+        # Add partial clone filter; the remote remembers it for later fetches
+        if self.config.partial_clone_filter:
+            cmd.append(f"--filter={self.config.partial_clone_filter}")
+
         # Add branch if specified
         if branch:
             cmd.extend(["--branch", branch])
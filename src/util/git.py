@@ -16,7 +16,10 @@ from typing import Optional
 
 
 def safe_git_command(
-    cmd: list[str], cwd: Optional[Path], logger: logging.Logger
+    cmd: list[str],
+    cwd: Optional[Path],
+    logger: logging.Logger,
+    timeout: float = 300,
 ) -> tuple[bool, str]:
     """
     Execute a git command safely with error handling.
@@ -25,6 +28,7 @@ def safe_git_command(
         cmd: List of command arguments (e.g., ['git', 'log', '--oneline'])
         cwd: Working directory for the command (None for current directory)
         logger: Logger instance for recording errors
+        timeout: Seconds before the command is killed (default 5 minutes)
 
     Returns:
         Tuple of (success: bool, output_or_error: str)
@@ -37,7 +41,7 @@ def safe_git_command(
             cwd=cwd,
             capture_output=True,
             text=True,
-            timeout=300,  # 5 minute timeout for long operations
+            timeout=timeout,
             check=False,
         )
 
@@ -49,7 +53,7 @@ def safe_git_command(
             return False, error_msg
 
     except subprocess.TimeoutExpired:
-        error_msg = f"Git command timed out after 300 seconds: {' '.join(cmd)}"
+        error_msg = f"Git command timed out after {timeout:g} seconds: {' '.join(cmd)}"
         logger.error(error_msg)
         return False, error_msg
     except Exception as e:
@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Shared fixtures for collector tests.
+
+Provides a small builder for git repositories with fully controlled commit
+authors, dates and file contents, so git collector behaviour can be asserted
+exactly.
+"""
+
+import logging
+import os
+import subprocess
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+
+class GitRepoBuilder:
+    """Create commits with explicit author identity and author date."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.git("init", "-q", "-b", "main")
+        self.git("config", "user.name", "Builder")
+        self.git("config", "user.email", "builder@example.com")
+        self.git("config", "commit.gpgsign", "false")
+
+    def git(self, *args: str, env: dict[str, str] | None = None) -> str:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=self.path,
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=30,
+            env=env,
+        )
+        return result.stdout.strip()
+
+    def commit(
+        self,
+        files: dict[str, str | bytes] | None = None,
+        message: str = "change",
+        author: str = "Alice Example",
+        email: str = "alice@example.com",
+        days_ago: float = 1,
+        when: datetime | None = None,
+    ) -> str:
+        """Write files, stage everything and commit; returns the commit SHA."""
+        for name, content in (files or {}).items():
+            target = self.path / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if isinstance(content, bytes):
+                target.write_bytes(content)
+            else:
+                target.write_text(content)
+
+        when = when or datetime.now(timezone.utc) - timedelta(days=days_ago)
+        date_str = when.strftime("%Y-%m-%dT%H:%M:%S%z")
+        env = os.environ.copy()
+        env.update(
+            {
+                "GIT_AUTHOR_NAME": author,
+                "GIT_AUTHOR_EMAIL": email,
+                "GIT_AUTHOR_DATE": date_str,
+                "GIT_COMMITTER_NAME": author,
+                "GIT_COMMITTER_EMAIL": email,
+                "GIT_COMMITTER_DATE": date_str,
+            }
+        )
+        self.git("add", "-A", env=env)
+        self.git("commit", "-q", "--allow-empty", "-m", message, env=env)
+        return self.git("rev-parse", "HEAD")
+
+
+@pytest.fixture
+def git_repo_builder(tmp_path: Path):
+    """Factory fixture returning GitRepoBuilder instances under tmp_path."""
+
+    def _make(name: str = "repo") -> GitRepoBuilder:
+        return GitRepoBuilder(tmp_path / name)
+
+    return _make
+
+
+@pytest.fixture
+def collector_time_windows() -> dict[str, dict[str, Any]]:
+    """Time windows equivalent to RepositoryReporter._setup_time_windows."""
+    now = datetime.now(timezone.utc)
+    windows = {}
+    for name, days in {"last_30": 30, "last_90": 90, "last_365": 365}.items():
+        start = now - timedelta(days=days)
+        windows[name] = {
+            "days": days,
+            "start": start.isoformat(),
+            "end": now.isoformat(),
+            "start_timestamp": start.timestamp(),
+            "end_timestamp": now.timestamp(),
+        }
+    return windows
+
+
+@pytest.fixture
+def collector_logger() -> logging.Logger:
+    """Logger for collector instances under test."""
+    return logging.getLogger("test.collectors")
@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Unit tests for daily activity histograms.
+
+Tests cover:
+- Prefix-sum window queries with open and closed ranges
+- Lazy prefix rebuild after modification and merging
+- Day alignment of reporter time windows
+"""
+
+from gerrit_reporting_tool.collectors.activity import (
+    DAY_SECONDS,
+    DailyHistogram,
+    RepoActivity,
+    timestamp_to_day,
+    window_start_day,
+)
+
+
+def _histogram() -> DailyHistogram:
+    histogram = DailyHistogram()
+    histogram.add(10, 5, 1)
+    histogram.add(12, 3, 0)
+    histogram.add(12, 1, 1)
+    histogram.add(20, 0, 7)
+    return histogram
+
+
+class TestDailyHistogram:
+    """Tests for DailyHistogram."""
+
+    def test_totals_open_range(self):
+        histogram = _histogram()
+
+        assert histogram.totals(0) == (4, 9, 9)
+        assert histogram.totals(11) == (3, 4, 8)
+        assert histogram.totals(12) == (3, 4, 8)
+        assert histogram.totals(13) == (1, 0, 7)
+        assert histogram.totals(21) == (0, 0, 0)
+
+    def test_totals_closed_range(self):
+        histogram = _histogram()
+
+        assert histogram.totals(10, 12) == (3, 9, 2)
+        assert histogram.totals(11, 11) == (0, 0, 0)
+        assert histogram.totals(20, 10) == (0, 0, 0)
+
+    def test_rebuilds_prefix_after_add(self):
+        histogram = _histogram()
+        assert histogram.totals(0) == (4, 9, 9)
+
+        histogram.add(5, 2, 2)
+
+        assert histogram.totals(0) == (5, 11, 11)
+        assert histogram.first_day == 5
+        assert histogram.last_day == 20
+
+    def test_merge(self):
+        histogram = _histogram()
+        other = DailyHistogram()
+        other.add(12, 10, 10)
+        other.add(30, 1, 0)
+
+        histogram.merge(other)
+
+        assert histogram.items() == [
+            (10, 1, 5, 1),
+            (12, 3, 14, 11),
+            (20, 1, 0, 7),
+            (30, 1, 1, 0),
+        ]
+
+    def test_empty(self):
+        histogram = DailyHistogram()
+
+        assert not histogram
+        assert histogram.totals(0) == (0, 0, 0)
+        assert histogram.last_day is None
+
+
+class TestWindows:
+    """Tests for day alignment helpers."""
+
+    def test_window_start_is_day_aligned(self):
+        start = 100 * DAY_SECONDS + 3600
+
+        assert timestamp_to_day(start) == 100
+        assert timestamp_to_day(start - 7200) == 99
+        assert window_start_day({"start_timestamp": float(start)}) == 100
+
+    def test_repo_activity_shares_author_histograms(self):
+        activity = RepoActivity()
+
+        assert activity.author("a@example.com") is activity.author("a@example.com")
+        assert list(activity.authors) == ["a@example.com"]
@@ -0,0 +1,194 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for co-author and sign-off attribution.
+
+Covers:
+- Trailer value and commit message parsing
+- Trailer fields in the NUL-delimited parser
+- Credit under each attribution policy, for both git backends
+- Collector output and stored-state settings
+"""
+
+import pytest
+
+from gerrit_reporting_tool.collectors.attribution import (
+    TRAILER_CO_AUTHOR,
+    TRAILER_SIGN_OFF,
+    AttributionPolicy,
+    parse_message_trailers,
+    parse_trailer_identity,
+)
+from gerrit_reporting_tool.collectors.git import GitDataCollector
+from gerrit_reporting_tool.collectors.git_backend import (
+    CliGitBackend,
+    Pygit2GitBackend,
+    pygit2,
+)
+from gerrit_reporting_tool.collectors.git_log import GitLogParser, build_git_log_command
+
+
+PAIRED = """Pair on the parser
+
+Co-authored-by: Bob Builder <bob@example.org>
+Signed-off-by: Alice Example <ALICE@example.com>
+Signed-off-by: Carol Maintainer <carol@example.net>
+"""
+
+BACKENDS = [
+    pytest.param(CliGitBackend, id="cli"),
+    pytest.param(
+        Pygit2GitBackend,
+        id="pygit2",
+        marks=pytest.mark.skipif(pygit2 is None, reason="pygit2 is not installed"),
+    ),
+]
+
+
+def _record(sha: str, trailers: str) -> bytes:
+    header = f"\x1e{sha}\x00100\x00Alice\x00alice@example.com\x00{trailers}\x00"
+    return header.encode() + b"\n3\t1\ta.txt\x00\x00"
+
+
+class TestParsing:
+    """Trailer values, messages and log records."""
+
+    def test_identity(self):
+        assert parse_trailer_identity(b"Bob B <bob@x.org>") == (b"Bob B", b"bob@x.org")
+        assert parse_trailer_identity(b"<bob@x.org>") == (b"", b"bob@x.org")
+        assert parse_trailer_identity(b"bob@x.org") == (b"", b"bob@x.org")
+        assert parse_trailer_identity(b"Bob <>") is None
+        assert parse_trailer_identity(b"the whole team") is None
+
+    def test_message_trailers(self):
+        assert parse_message_trailers(PAIRED.encode()) == [
+            (TRAILER_CO_AUTHOR, b"Bob Builder <bob@example.org>"),
+            (TRAILER_SIGN_OFF, b"Alice Example <ALICE@example.com>"),
+            (TRAILER_SIGN_OFF, b"Carol Maintainer <carol@example.net>"),
+        ]
+        assert parse_message_trailers(b"subject\n\nco-authored-by: B\n  <b@x>\n") == [
+            (TRAILER_CO_AUTHOR, b"B <b@x>")
+        ]
+        # Prose in the last paragraph: not a trailer block
+        assert parse_message_trailers(b"subject\n\nSee: this\nand more\n") == []
+        assert parse_message_trailers(b"Co-authored-by: B <b@x>") == []
+
+    def test_parser_trailer_field(self):
+        parser = GitLogParser(parse_trailers=True)
+        data = _record(
+            "a" * 40,
+            "Co-authored-by: Bob <bob@x.org>\x1fSigned-off-by: free text"
+            "\x1fsigned-off-by: Carol <carol@x.org>",
+        ) + _record("b" * 40, "")
+
+        commits = [c for batch in parser.parse([data]) for c in batch.iter_commits()]
+
+        assert [c["trailers"] for c in commits] == [
+            [
+                {"kind": TRAILER_CO_AUTHOR, "name": "Bob", "email": "bob@x.org"},
+                {"kind": TRAILER_SIGN_OFF, "name": "Carol", "email": "carol@x.org"},
+            ],
+            [],
+        ]
+        assert [c["added"] for c in commits] == [3, 3]
+
+    def test_command(self):
+        assert "%(trailers:" not in " ".join(build_git_log_command())
+        assert "%(trailers:" in " ".join(build_git_log_command(trailers=True))
+
+    def test_policy_from_config(self):
+        assert not AttributionPolicy.from_config({}).enabled
+        policy = AttributionPolicy.from_config(
+            {"data_quality": {"co_author_attribution": "split", "credit_sign_offs": True}}
+        )
+        assert policy == AttributionPolicy("split", True)
+        with pytest.raises(ValueError):
+            AttributionPolicy.from_config({"data_quality": {"co_author_attribution": "all"}})
+
+
+def _author_totals(walk) -> dict:
+    return {
+        email: histogram.totals(0)
+        for email, histogram in zip(walk.author_emails, walk.author_histograms)
+        if histogram
+    }
+
+
+@pytest.mark.parametrize("backend_class", BACKENDS)
+class TestCredit:
+    """Author histograms of a walk under each policy."""
+
+    def _walk(self, repo, backend_class, policy):
+        return backend_class().walk_log(repo.path, None, True, attribution=policy)
+
+    def _repo(self, git_repo_builder):
+        repo = git_repo_builder()
+        repo.commit({"a.txt": "1\n2\n3\n4\n5\n"}, message=PAIRED)
+        repo.commit({"b.txt": "1\n"}, message="solo\n\nSigned-off-by: Alice <alice@example.com>")
+        return repo
+
+    def test_author_only(self, git_repo_builder, backend_class):
+        walk = self._walk(self._repo(git_repo_builder), backend_class, None)
+
+        assert _author_totals(walk) == {"alice@example.com": (2, 6, 0)}
+        assert walk.co_authored_commits == 0
+
+    def test_co_authors(self, git_repo_builder, backend_class):
+        walk = self._walk(
+            self._repo(git_repo_builder), backend_class, AttributionPolicy("co_authors")
+        )
+
+        assert _author_totals(walk) == {
+            "alice@example.com": (2, 6, 0),
+            "bob@example.org": (1, 5, 0),
+        }
+        assert walk.repository.totals(0) == (2, 6, 0)
+        assert walk.co_authored_commits == 1
+
+    def test_split_with_sign_offs(self, git_repo_builder, backend_class):
+        walk = self._walk(
+            self._repo(git_repo_builder), backend_class, AttributionPolicy("split", True)
+        )
+
+        # 5 lines over three people, the author keeps the remainder (3 + 1
+        # from the second commit); the author's self sign-off is ignored
+        assert _author_totals(walk) == {
+            "alice@example.com": (2, 4, 0),
+            "bob@example.org": (1, 1, 0),
+            "carol@example.net": (1, 1, 0),
+        }
+        assert walk.repository.totals(0) == (2, 6, 0)
+
+
+class TestCollectorAttribution:
+    """GitDataCollector output."""
+
+    def test_co_author_records(
+        self, git_repo_builder, collector_time_windows, collector_logger, monkeypatch
+    ):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        repo = git_repo_builder()
+        repo.commit({"a.txt": "1\n2\n"}, message=PAIRED)
+        config = {
+            "gerrit": {"enabled": False},
+            "jenkins": {"enabled": False},
+            "data_quality": {"co_author_attribution": "co_authors"},
+        }
+        collector = GitDataCollector(config, collector_time_windows, collector_logger)
+
+        metrics = collector.collect_repo_git_metrics(repo.path)
+
+        # Carol only signed off, which is not credited by this policy
+        assert sorted(metrics["authors"]) == ["alice@example.com", "bob@example.org"]
+        bob = metrics["authors"]["bob@example.org"]
+        assert bob["commit_counts"]["last_30"] == 1
+        assert bob["loc_stats"]["last_30"]["added"] == 2
+        assert metrics["repository"]["commit_counts"]["last_30"] == 1
+        assert collector._collection_settings()["co_author_attribution"] == "co_authors"
+
+    def test_default_settings_unchanged(self, collector_time_windows, collector_logger):
+        config = {"gerrit": {"enabled": False}, "jenkins": {"enabled": False}}
+        collector = GitDataCollector(config, collector_time_windows, collector_logger)
+
+        assert "co_author_attribution" not in collector._collection_settings()
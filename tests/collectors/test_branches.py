@@ -0,0 +1,207 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for multi-branch analysis.
+
+Covers:
+- Ref pattern expansion and ref listing from the ref files
+- One git log walk over several branches, shared commits counted once
+- The per-branch breakdown, for both git backends
+- Collector output and stored state keyed by the branch tips
+"""
+
+import pytest
+
+from gerrit_reporting_tool.collectors.git import GitDataCollector
+from gerrit_reporting_tool.collectors.git_backend import (
+    CliGitBackend,
+    Pygit2GitBackend,
+    pygit2,
+)
+from gerrit_reporting_tool.collectors.git_log import RefSources, build_git_log_command
+from gerrit_reporting_tool.collectors.git_refs import (
+    expand_ref_pattern,
+    list_refs,
+    match_refs,
+    short_ref_name,
+)
+
+
+BACKENDS = [
+    pytest.param(CliGitBackend, id="cli"),
+    pytest.param(
+        Pygit2GitBackend,
+        id="pygit2",
+        marks=pytest.mark.skipif(pygit2 is None, reason="pygit2 is not installed"),
+    ),
+]
+
+
+def _branched_repo(git_repo_builder):
+    """main: 3 commits; stable/1.0 forks after the first and adds 2."""
+    repo = git_repo_builder()
+    repo.commit({"a.txt": "1\n"}, days_ago=10)
+    repo.git("branch", "stable/1.0")
+    repo.commit({"a.txt": "1\n2\n"}, days_ago=8)
+    repo.commit({"a.txt": "1\n2\n3\n"}, days_ago=6)
+    repo.git("checkout", "-q", "stable/1.0")
+    repo.commit({"fix.txt": "f\n"}, days_ago=7)
+    repo.commit({"fix.txt": "f\ng\n"}, days_ago=5)
+    repo.git("branch", "feature")
+    repo.git("checkout", "-q", "main")
+    return repo
+
+
+class TestRefs:
+    """Pattern handling and ref listing."""
+
+    def test_expand_ref_pattern(self):
+        assert expand_ref_pattern("stable/*") == "refs/heads/stable/*"
+        assert expand_ref_pattern("stable") == "refs/heads/stable/*"
+        assert expand_ref_pattern("refs/remotes/origin/*") == "refs/remotes/origin/*"
+        assert short_ref_name("refs/heads/stable/1.0") == "stable/1.0"
+        assert short_ref_name("HEAD") == "HEAD"
+
+    def test_list_and_match(self, git_repo_builder):
+        repo = _branched_repo(git_repo_builder)
+        repo.git("pack-refs", "--all")
+        repo.git("branch", "stable/2.0")
+
+        refs = list_refs(repo.path)
+
+        assert set(refs) == {
+            "refs/heads/main",
+            "refs/heads/stable/1.0",
+            "refs/heads/stable/2.0",
+            "refs/heads/feature",
+        }
+        assert refs["refs/heads/stable/1.0"] == repo.git("rev-parse", "stable/1.0")
+        assert set(match_refs(refs, ["stable/*"])) == {
+            "refs/heads/stable/1.0",
+            "refs/heads/stable/2.0",
+        }
+
+    def test_ref_sources_prefer_earlier_refs(self):
+        # HEAD: c -> a; stable: d -> b -> a; "a" is reachable from both
+        sources = RefSources([("HEAD", b"c"), ("refs/heads/stable", b"d")])
+
+        visits = [(b"d", [b"b"]), (b"c", [b"a"]), (b"b", [b"a"]), (b"a", [])]
+
+        assert [sources.visit(sha, parents) for sha, parents in visits] == [1, 0, 1, 0]
+        assert sources._pending == {}
+
+    def test_command(self):
+        command = build_git_log_command(ref_patterns=["stable/*"], parents=True)
+        assert command[-2:] == ["HEAD", "--glob=refs/heads/stable/*"]
+        assert "--date-order" in command
+
+
+@pytest.mark.parametrize("backend_class", BACKENDS)
+class TestBranchWalk:
+    """Backend walks over several branches."""
+
+    def test_shared_commits_counted_once(self, git_repo_builder, backend_class):
+        repo = _branched_repo(git_repo_builder)
+
+        walk = backend_class().walk_log(
+            repo.path, None, True, ref_patterns=["stable/*", "feature"], by_ref=True
+        )
+
+        # feature matches nothing ("feature/*"), stable/1.0 adds two commits
+        assert walk.commit_count == 5
+        assert walk.repository.totals(0) == (5, 5, 0)
+        by_ref = {
+            name: histogram.totals(0)
+            for name, histogram in zip(walk.ref_names, walk.ref_histograms)
+            if histogram
+        }
+        assert by_ref == {"HEAD": (3, 3, 0), "refs/heads/stable/1.0": (2, 2, 0)}
+
+    def test_head_only(self, git_repo_builder, backend_class):
+        walk = backend_class().walk_log(_branched_repo(git_repo_builder).path, None, True)
+
+        assert walk.commit_count == 3
+        assert walk.ref_names == []
+
+
+class TestCollectorBranches:
+    """GitDataCollector output."""
+
+    def _collector(self, tmp_path, time_windows, logger, monkeypatch, **branches):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        config = {
+            "gerrit": {"enabled": False},
+            "jenkins": {"enabled": False},
+            "branches": branches,
+            "performance": {
+                "cache": True,
+                "incremental": True,
+                "store_path": str(tmp_path / "metrics.sqlite3"),
+            },
+        }
+        return GitDataCollector(config, time_windows, logger)
+
+    def test_breakdown_and_cache(
+        self, tmp_path, git_repo_builder, collector_time_windows, collector_logger, monkeypatch
+    ):
+        repo = _branched_repo(git_repo_builder)
+        collector = self._collector(
+            tmp_path,
+            collector_time_windows,
+            collector_logger,
+            monkeypatch,
+            patterns=["stable/*"],
+            breakdown=True,
+        )
+
+        first = collector.collect_repo_git_metrics(repo.path)["repository"]
+        cached = collector.collect_repo_git_metrics(repo.path)["repository"]
+
+        assert first["total_commits_ever"] == 5
+        assert first["commit_counts"]["last_30"] == 5
+        assert first["branches"] == {
+            "HEAD": {
+                "commit_counts": {"last_30": 3, "last_90": 3, "last_365": 3},
+                "loc_stats": {
+                    window: {"added": 3, "removed": 0, "net": 3}
+                    for window in ("last_30", "last_90", "last_365")
+                },
+            },
+            "stable/1.0": {
+                "commit_counts": {"last_30": 2, "last_90": 2, "last_365": 2},
+                "loc_stats": {
+                    window: {"added": 2, "removed": 0, "net": 2}
+                    for window in ("last_30", "last_90", "last_365")
+                },
+            },
+        }
+        assert cached == first
+        assert collector.get_cache_stats()["hits"] == 1
+
+        # A new commit on a maintenance branch only invalidates the state
+        repo.git("checkout", "-q", "stable/1.0")
+        repo.commit({"fix.txt": "f\ng\nh\n"}, days_ago=1)
+        repo.git("checkout", "-q", "main")
+        updated = collector.collect_repo_git_metrics(repo.path)["repository"]
+        collector.state_store.close()
+
+        assert collector.get_cache_stats()["hits"] == 1
+        assert updated["total_commits_ever"] == 6
+        assert updated["branches"]["stable/1.0"]["commit_counts"]["last_30"] == 3
+
+    def test_no_breakdown(
+        self, tmp_path, git_repo_builder, collector_time_windows, collector_logger, monkeypatch
+    ):
+        repo = _branched_repo(git_repo_builder)
+        collector = self._collector(
+            tmp_path, collector_time_windows, collector_logger, monkeypatch, patterns=["stable"]
+        )
+
+        repository = collector.collect_repo_git_metrics(repo.path)["repository"]
+        collector.state_store.close()
+
+        assert repository["total_commits_ever"] == 5
+        assert "branches" not in repository
+        # The newest tip is on stable/1.0, not HEAD
+        assert repository["days_since_last_commit"] == 5
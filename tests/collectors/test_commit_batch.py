@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Unit tests for the columnar commit representation.
+
+Tests cover:
+- AuthorTable interning and lazy decoding
+- CommitBatch per-commit totals and optional per-file data
+"""
+
+from gerrit_reporting_tool.collectors.commit_batch import AuthorTable, CommitBatch
+
+
+class TestAuthorTable:
+    """Tests for AuthorTable."""
+
+    def test_interns_identities(self):
+        table = AuthorTable()
+
+        first = table.intern(b"Alice", b"alice@example.com")
+        second = table.intern(b"Bob", b"bob@example.com")
+
+        assert table.intern(b"Alice", b"alice@example.com") == first
+        assert (first, second) == (0, 1)
+        assert table.names == ["Alice", "Bob"]
+        assert len(table) == 2
+
+    def test_invalid_utf8_is_replaced(self):
+        table = AuthorTable()
+        author_id = table.intern(b"J\xfcrgen", b"j@example.de")
+
+        assert table.names[author_id] == "J�rgen"
+
+
+class TestCommitBatch:
+    """Tests for CommitBatch."""
+
+    def test_totals_without_files(self):
+        batch = CommitBatch(AuthorTable())
+        batch.append_commit(b"a" * 40, 100, 0, 5, 1, [(b"x", 3, 1), (b"y", 2, 0)])
+        batch.append_commit(b"b" * 40, 50, 0, 0, 0)
+
+        assert len(batch) == 2
+        assert list(batch.timestamps) == [100, 50]
+        assert list(batch.added) == [5, 0]
+        assert list(batch.removed) == [1, 0]
+        assert batch.files(0) == []
+        assert batch.file_paths == []
+
+    def test_keeps_files_on_request(self):
+        authors = AuthorTable()
+        author_id = authors.intern(b"Alice", b"alice@example.com")
+        batch = CommitBatch(authors, keep_files=True)
+        batch.append_commit(b"a" * 40, 100, author_id, 3, 1, [(b"x", 3, 1)])
+        batch.append_commit(b"b" * 40, 50, author_id, 0, 0)
+        batch.append_commit(b"c" * 40, 10, author_id, 2, 4, [(b"y", 2, 0), (b"z", 0, 4)])
+
+        assert batch.files(0) == [(b"x", 3, 1)]
+        assert batch.files(1) == []
+        assert batch.files(2) == [(b"y", 2, 0), (b"z", 0, 4)]
+        assert batch.commit(2)["files_changed"] == [
+            {"filename": b"y", "added": 2, "removed": 0},
+            {"filename": b"z", "added": 0, "removed": 4},
+        ]
+        assert batch.commit(2)["author_email"] == "alice@example.com"
@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for excluding vendored and generated paths from the line counts.
+
+Covers:
+- Pattern normalization and git pathspec matching rules
+- The git log invocation
+- Walks with both backends: lines excluded, every commit still counted
+- Collector settings, so cached states are invalidated
+"""
+
+import pytest
+
+from gerrit_reporting_tool.collectors import git_backend
+from gerrit_reporting_tool.collectors.git import GitDataCollector
+from gerrit_reporting_tool.collectors.git_backend import CliGitBackend, get_git_backend
+from gerrit_reporting_tool.collectors.git_log import (
+    build_git_log_command,
+    compile_exclude_paths,
+    is_excluded_path,
+)
+from gerrit_reporting_tool.collectors.hotspots import HotspotAccumulator
+
+
+BACKENDS = [
+    "cli",
+    pytest.param(
+        "pygit2",
+        marks=pytest.mark.skipif(git_backend.pygit2 is None, reason="pygit2 not installed"),
+    ),
+]
+
+EXCLUDES = ["vendor/", "*.pb.go"]
+
+
+@pytest.fixture
+def vendored(git_repo_builder):
+    """
+    Five commits, 3 lines outside the excluded paths.
+
+    A side branch only touching vendor/ is merged, so a plain pathspec walk
+    would simplify it away.
+    """
+    repo = git_repo_builder()
+    repo.commit({"main.go": "a\nb\n"}, days_ago=10)
+    repo.git("checkout", "-q", "-b", "deps")
+    repo.commit({"vendor/lib/x.go": "1\n2\n3\n4\n"}, days_ago=8)
+    repo.git("checkout", "-q", "main")
+    repo.commit({"api/svc.pb.go": "g\ng\ng\n", "api/svc.proto": "p\n"}, days_ago=6)
+    repo.git("merge", "-q", "--no-ff", "-m", "merge deps", "deps")
+    repo.commit({"vendor/lib/y.go": "5\n"}, days_ago=2)
+    return repo
+
+
+class TestPatterns:
+    """compile_exclude_paths and is_excluded_path."""
+
+    def test_compile(self):
+        assert compile_exclude_paths(None) == ()
+        assert compile_exclude_paths([":(exclude)vendor/**", ":!gen", "*.pb.go"]) == (
+            "vendor/**",
+            "gen",
+            "*.pb.go",
+        )
+        with pytest.raises(ValueError):
+            compile_exclude_paths([":(glob)*.go"])
+        with pytest.raises(ValueError):
+            compile_exclude_paths([":!"])
+
+    def test_matching(self):
+        assert is_excluded_path("vendor/a/b.go", ["vendor"])
+        assert is_excluded_path("vendor/a/b.go", ["vendor/"])
+        assert is_excluded_path("vendor/a/b.go", ["vendor/**"])
+        assert is_excluded_path("api/v1/svc.pb.go", ["*.pb.go"])
+        assert is_excluded_path("package-lock.json", ["package-lock.json"])
+        assert not is_excluded_path("web/package-lock.json", ["package-lock.json"])
+        assert not is_excluded_path("vendored.go", ["vendor"])
+
+    def test_command(self):
+        command = build_git_log_command("HEAD", exclude_paths=EXCLUDES)
+
+        assert command[-6:] == [
+            "HEAD",
+            "--full-history",
+            "--sparse",
+            "--",
+            ":(exclude)vendor/",
+            ":(exclude)*.pb.go",
+        ]
+        assert "--" not in build_git_log_command()
+
+
+class TestWalk:
+    """Walks with exclude_paths."""
+
+    @pytest.mark.parametrize("name", BACKENDS)
+    def test_lines_excluded_commits_kept(self, name, vendored):
+        backend = get_git_backend(name)
+
+        full = backend.walk_log(vendored.path, None, True)
+        walk = backend.walk_log(vendored.path, None, True, exclude_paths=EXCLUDES)
+
+        assert full.repository.totals(0) == (5, 11, 0)
+        assert walk.error is None
+        assert walk.commit_count == 5
+        assert walk.repository.totals(0) == (5, 3, 0)
+
+    @pytest.mark.parametrize("name", BACKENDS)
+    def test_hotspots_match_cli(self, name, vendored):
+        expected = CliGitBackend().walk_log(
+            vendored.path,
+            None,
+            True,
+            hotspots=HotspotAccumulator({"all": 0}),
+            exclude_paths=EXCLUDES,
+        )
+        walk = get_git_backend(name).walk_log(
+            vendored.path,
+            None,
+            True,
+            hotspots=HotspotAccumulator({"all": 0}),
+            exclude_paths=EXCLUDES,
+        )
+
+        report = walk.hotspots.report()
+        assert report == expected.hotspots.report()
+        paths = {row["path"] for row in report["windows"]["all"]["hottest_paths"]}
+        assert paths == {"main.go", "api/svc.proto"}
+
+
+class TestCollector:
+    """GitDataCollector wiring."""
+
+    def test_loc_and_settings(
+        self, vendored, collector_time_windows, collector_logger, monkeypatch
+    ):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        config = {
+            "gerrit": {"enabled": False},
+            "jenkins": {"enabled": False},
+            "data_quality": {"exclude_paths": [":(exclude)vendor/", "*.pb.go"]},
+        }
+        collector = GitDataCollector(config, collector_time_windows, collector_logger)
+
+        repository = collector.collect_repo_git_metrics(vendored.path)["repository"]
+
+        assert repository["total_commits_ever"] == 5
+        assert repository["loc_stats"]["last_30"]["added"] == 3
+        assert collector._collection_settings()["exclude_paths"] == EXCLUDES
+        plain = GitDataCollector(
+            {"gerrit": {"enabled": False}, "jenkins": {"enabled": False}},
+            collector_time_windows,
+            collector_logger,
+        )
+        assert "exclude_paths" not in plain._collection_settings()
@@ -0,0 +1,177 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for the git access backends.
+
+Covers:
+- Backend selection and fallback
+- Ref resolution, ancestry, tree listing and blob sizes
+- Identical history walks with the CLI and pygit2 backends
+- Collector wiring of the configured backend
+"""
+
+import logging
+import pickle
+
+import pytest
+
+from gerrit_reporting_tool.collectors import git_backend
+from gerrit_reporting_tool.collectors.git import GitDataCollector
+from gerrit_reporting_tool.collectors.git_backend import (
+    CliGitBackend,
+    get_git_backend,
+)
+from gerrit_reporting_tool.collectors.hotspots import HotspotAccumulator
+
+
+BACKENDS = [
+    "cli",
+    pytest.param(
+        "pygit2",
+        marks=pytest.mark.skipif(git_backend.pygit2 is None, reason="pygit2 not installed"),
+    ),
+]
+
+
+@pytest.fixture
+def history(git_repo_builder):
+    """Repository with a rename, a binary file, a branch merge and a tag."""
+    repo = git_repo_builder()
+    first = repo.commit({"src/a.txt": "1\n2\n3\n"}, author="Alice", days_ago=25)
+    repo.commit(
+        {"logo.png": b"\x89PNG\0\x01\x02"}, author="Bob", email="bob@example.org", days_ago=20
+    )
+    repo.git("mv", "src/a.txt", "src/b.txt")
+    repo.commit({"src/b.txt": "1\n2\n3\n4\n"}, author="Alice", days_ago=10)
+    repo.git("checkout", "-q", "-b", "topic")
+    repo.commit({"topic.txt": "t\n"}, author="Bob", email="bob@example.org", days_ago=5)
+    repo.git("checkout", "-q", "main")
+    repo.commit({"main.txt": "m\nm\n"}, author="Alice", days_ago=4)
+    repo.git("merge", "-q", "--no-ff", "-m", "merge topic", "topic")
+    repo.git("tag", "-a", "-m", "release", "v1.0")
+    repo.first = first
+    return repo
+
+
+def _authors(walk):
+    return sorted(
+        (email, histogram.items())
+        for email, histogram in zip(walk.author_emails, walk.author_histograms)
+    )
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    return get_git_backend(request.param, logging.getLogger("test.backend"))
+
+
+class TestSelection:
+    """get_git_backend."""
+
+    def test_default_is_cli(self):
+        assert isinstance(get_git_backend(), CliGitBackend)
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown git backend"):
+            get_git_backend("jgit")
+
+    def test_missing_package_falls_back_to_cli(self, monkeypatch, caplog):
+        monkeypatch.setattr(git_backend, "pygit2", None)
+        with caplog.at_level(logging.WARNING):
+            backend = get_git_backend("pygit2")
+        assert isinstance(backend, CliGitBackend)
+        assert "pygit2 is required" in caplog.text
+
+    def test_backends_are_picklable(self, backend):
+        assert type(pickle.loads(pickle.dumps(backend))) is type(backend)
+
+
+class TestOperations:
+    """Ref resolution, ancestry, trees and blobs."""
+
+    def test_resolve_ref(self, backend, history):
+        head = history.git("rev-parse", "HEAD")
+        assert backend.resolve_ref(history.path, "HEAD") == head
+        assert backend.resolve_ref(history.path, "v1.0") == head
+        assert backend.resolve_ref(history.path, "missing") is None
+
+    def test_is_ancestor(self, backend, history):
+        head = history.git("rev-parse", "HEAD")
+        assert backend.is_ancestor(history.path, history.first, head)
+        assert backend.is_ancestor(history.path, head, head)
+        assert not backend.is_ancestor(history.path, head, history.first)
+
+    def test_list_tree_and_blob_size(self, backend, history):
+        entries = {entry.path: entry for entry in backend.list_tree(history.path)}
+
+        assert sorted(entries) == ["logo.png", "main.txt", "src/b.txt", "topic.txt"]
+        entry = entries["src/b.txt"]
+        assert (entry.mode, entry.type, entry.size) == (0o100644, "blob", 8)
+        assert entry.oid == history.git("rev-parse", "HEAD:src/b.txt")
+        assert backend.blob_size(history.path, entry.oid) == 8
+        assert backend.blob_size(history.path, "0" * 40) is None
+        assert backend.list_tree(history.path, "missing") == []
+
+
+class TestWalkLog:
+    """History walks match across backends."""
+
+    def test_matches_cli(self, backend, history):
+        expected = CliGitBackend().walk_log(history.path, None, True)
+        walk = backend.walk_log(history.path, None, True)
+
+        assert walk.error is None
+        assert walk.commit_count == expected.commit_count == 6
+        assert walk.tip_epoch == expected.tip_epoch
+        assert walk.tip_offset == expected.tip_offset
+        assert walk.repository.items() == expected.repository.items()
+        assert walk.repository.totals(0) == (6, 7, 0)
+        assert _authors(walk) == _authors(expected)
+
+    def test_hotspots_match_cli(self, backend, history):
+        expected = CliGitBackend().walk_log(
+            history.path, None, True, hotspots=HotspotAccumulator({"all": 0})
+        )
+        walk = backend.walk_log(history.path, None, True, hotspots=HotspotAccumulator({"all": 0}))
+
+        assert walk.hotspots.report() == expected.hotspots.report()
+        assert walk.hotspots.report()["windows"]["all"]["churn"] == 7
+        assert walk.repository.totals(0) == (6, 7, 0)
+
+    def test_since(self, backend, history):
+        since = int(history.git("log", "-1", "--skip=1", "--format=%ct"))
+        walk = backend.walk_log(history.path, None, True, since=since)
+        assert walk.commit_count == 2
+
+    def test_revision_range(self, backend, history):
+        walk = backend.walk_log(history.path, f"{history.first}..HEAD", True)
+        assert walk.error is None
+        assert walk.commit_count == 5
+
+    def test_failure(self, backend, tmp_path):
+        walk = backend.walk_log(tmp_path, None, True)
+        assert walk.error
+        assert walk.commit_count == 0
+
+
+class TestCollectorBackend:
+    """GitDataCollector uses the configured backend."""
+
+    @pytest.mark.parametrize("name", BACKENDS)
+    def test_collects_with_backend(
+        self, name, history, collector_time_windows, collector_logger, monkeypatch
+    ):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        config = {
+            "gerrit": {"enabled": False},
+            "jenkins": {"enabled": False},
+            "performance": {"git_backend": name},
+        }
+        collector = GitDataCollector(config, collector_time_windows, collector_logger)
+        assert collector.git_backend.name == name
+
+        repository = collector.collect_repo_git_metrics(history.path)["repository"]
+
+        assert repository["total_commits_ever"] == 6
+        assert repository["loc_stats"]["last_30"] == {"added": 7, "removed": 0, "net": 7}
@@ -0,0 +1,172 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Unit tests for the NUL-delimited git log parser.
+
+Tests cover:
+- Chunk-boundary independence of the incremental parser
+- Fields containing "|" and tabs
+- Rename entries, binary files and empty commits
+- Invalid records
+- Parity with the legacy text parser (the benchmark baseline) on a real repository
+"""
+
+import subprocess
+
+import pytest
+
+from gerrit_reporting_tool.collectors.git_log import (
+    GitLogParser,
+    build_git_log_command,
+    parse_utc_offset,
+)
+
+
+def _record(sha: str, date: str, name: str, email: str, numstat: list[bytes]) -> bytes:
+    header = f"\x1e{sha}\0{date}\0{name}\0{email}\0".encode()
+    if not numstat:
+        return header + b"\0"
+    return header + b"\n" + b"".join(numstat) + b"\0"
+
+
+@pytest.fixture
+def sample_log() -> bytes:
+    return b"".join(
+        [
+            _record(
+                "a" * 40,
+                "1709283600 +0100",
+                "Pipe | Name",
+                "pipe@example.com",
+                [b"3\t1\tsrc/a|b.py\0", b"-\t-\tlogo.png\0", b"2\t2\t\0old.txt\0new.txt\0"],
+            ),
+            _record("b" * 40, "1706781600", "Empty", "empty@example.com", []),
+            _record(
+                "c" * 40,
+                "1704121200",
+                "Jürgen",
+                "jurgen@example.de",
+                [b"10\t0\tdir/with\ttab.txt\0"],
+            ),
+        ]
+    )
+
+
+def _commits(batches) -> list[dict]:
+    return [commit for batch in batches for commit in batch.iter_commits()]
+
+
+def _parse(data: bytes, chunk_size: int, **kwargs) -> list[dict]:
+    kwargs.setdefault("keep_files", True)
+    parser = GitLogParser(**kwargs)
+    chunks = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+    return _commits(parser.parse(chunks))
+
+
+class TestGitLogParser:
+    """Tests for GitLogParser."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 16])
+    def test_chunk_boundaries_do_not_matter(self, sample_log, chunk_size):
+        assert _parse(sample_log, chunk_size) == _parse(sample_log, len(sample_log))
+
+    def test_parses_fields(self, sample_log):
+        first, empty, last = _parse(sample_log, 64)
+
+        assert first["hash"] == "a" * 40
+        assert first["author_name"] == "Pipe | Name"
+        assert first["author_email"] == "pipe@example.com"
+        assert first["timestamp"] == 1709283600
+        assert (first["added"], first["removed"]) == (5, 3)
+        assert first["files_changed"] == [
+            {"filename": b"src/a|b.py", "added": 3, "removed": 1},
+            {"filename": b"new.txt", "added": 2, "removed": 2},
+        ]
+        assert empty["files_changed"] == []
+        assert last["author_name"] == "Jürgen"
+        assert last["files_changed"] == [
+            {"filename": b"dir/with\ttab.txt", "added": 10, "removed": 0}
+        ]
+
+    def test_tip_offset(self, sample_log):
+        parser = GitLogParser()
+        _commits(parser.parse([sample_log]))
+
+        assert parser.tip_offset == 60
+        assert parse_utc_offset(b"-0530") == -330
+        assert parse_utc_offset(b"+0000") == 0
+        assert parse_utc_offset(b"") is None
+
+    def test_binary_changes_kept_when_configured(self, sample_log):
+        first = _parse(sample_log, 64, skip_binary_changes=False)[0]
+
+        assert {"filename": b"logo.png", "added": 0, "removed": 0} in first["files_changed"]
+
+    def test_invalid_date_drops_commit(self):
+        data = _record("d" * 40, "not-a-date", "X", "x@example.com", [b"1\t1\tf\0"]) + _record(
+            "e" * 40, "1704067200", "Y", "y@example.com", [b"2\t0\tg\0"]
+        )
+        parser = GitLogParser(keep_files=True)
+        commits = _commits(parser.parse([data]))
+
+        assert [c["hash"] for c in commits] == ["e" * 40]
+        assert commits[0]["files_changed"] == [{"filename": b"g", "added": 2, "removed": 0}]
+        assert parser.invalid_records == 1
+
+    def test_batches_share_author_table(self, sample_log):
+        parser = GitLogParser(batch_size=1)
+        batches = list(parser.parse([sample_log]))
+
+        assert [len(batch) for batch in batches] == [1, 1, 1]
+        assert all(batch.authors is parser.authors for batch in batches)
+        assert len(parser.authors) == 3
+
+    def test_files_not_kept_by_default(self, sample_log):
+        first = _parse(sample_log, 64, keep_files=False)[0]
+
+        assert first["files_changed"] is None
+        assert (first["added"], first["removed"]) == (5, 3)
+
+    def test_empty_stream(self):
+        assert list(GitLogParser().parse([])) == []
+
+
+class TestRealGitOutput:
+    """Parity with the legacy parser on output produced by git itself."""
+
+    def test_matches_legacy_parser(self, git_repo_builder):
+        from tests.performance_tests.benchmark_git_log_parser import parse_legacy_git_log
+
+        repo = git_repo_builder()
+        repo.commit({"a.txt": "1\n2\n", "bin.dat": b"\x00\x01"}, author="A|B", days_ago=3)
+        repo.git("mv", "a.txt", "b.txt")
+        repo.commit({"b.txt": "1\n2\n3\n"}, author="Carol", email="carol@example.org", days_ago=2)
+        repo.commit(message="empty", days_ago=1)
+
+        nul = subprocess.run(
+            build_git_log_command(), cwd=repo.path, capture_output=True, check=True
+        ).stdout
+        commits = _commits(GitLogParser(keep_files=True).parse([nul]))
+
+        assert [c["author_name"] for c in commits] == ["Alice Example", "Carol", "A|B"]
+        assert [sum(f["added"] for f in c["files_changed"]) for c in commits] == [0, 1, 2]
+
+        legacy = subprocess.run(
+            ["git", "log", "--numstat", "--date=iso", "--pretty=format:%H|%ad|%an|%ae|%s"],
+            cwd=repo.path,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        legacy_commits = parse_legacy_git_log(legacy)
+
+        # Author names are not compared: the "|"-delimited format cannot
+        # represent "A|B". Hashes, dates and line counts must agree.
+        assert [c["hash"] for c in commits] == [c["hash"] for c in legacy_commits]
+        assert [c["timestamp"] for c in commits] == [
+            int(c["date"].timestamp()) for c in legacy_commits
+        ]
+        assert [
+            sum(f["added"] for f in c["files_changed"]) for c in commits
+        ] == [sum(f["added"] for f in c["files_changed"]) for c in legacy_commits]
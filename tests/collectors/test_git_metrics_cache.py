@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for the git metrics cache.
+
+Covers:
+- Cache hits across runs with different time windows (different "days")
+- Misses after new commits and after settings changes
+- Hit/miss counters
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from gerrit_reporting_tool.collectors.git import GitDataCollector
+
+
+def _windows(now: datetime) -> dict:
+    windows = {}
+    for name, days in {"last_30": 30, "last_365": 365}.items():
+        start = now - timedelta(days=days)
+        windows[name] = {
+            "days": days,
+            "start": start.isoformat(),
+            "end": now.isoformat(),
+            "start_timestamp": start.timestamp(),
+            "end_timestamp": now.timestamp(),
+        }
+    return windows
+
+
+@pytest.fixture
+def make_collector(tmp_path, collector_logger, monkeypatch):
+    """Factory for cache-enabled collectors sharing one state directory."""
+    monkeypatch.delenv("JENKINS_HOST", raising=False)
+
+    def _make(now: datetime, **data_quality) -> GitDataCollector:
+        config = {
+            "gerrit": {"enabled": False},
+            "jenkins": {"enabled": False},
+            "performance": {
+                "cache": True,
+                "store_path": str(tmp_path / "metrics.sqlite3"),
+            },
+            "data_quality": data_quality,
+        }
+        return GitDataCollector(config, _windows(now), collector_logger)
+
+    return _make
+
+
+@pytest.fixture
+def walk_count(monkeypatch):
+    """Count git log walks."""
+    calls = []
+    original = GitDataCollector._walk_git_log
+
+    def _spy(self, *args, **kwargs):
+        calls.append(args[1])
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(GitDataCollector, "_walk_git_log", _spy)
+    return calls
+
+
+class TestGitMetricsCache:
+    """Cache behaviour of GitDataCollector."""
+
+    def test_hit_on_next_day_recomputes_windows(
+        self, make_collector, git_repo_builder, walk_count
+    ):
+        now = datetime.now(timezone.utc)
+        repo = git_repo_builder()
+        repo.commit({"a.txt": "1\n2\n"}, author="Alice", email="alice@example.com", days_ago=29.5)
+        repo.commit({"a.txt": "1\n"}, author="Bob", email="bob@example.com", days_ago=200)
+
+        first = make_collector(now).collect_repo_git_metrics(repo.path)
+        later_collector = make_collector(now + timedelta(days=2))
+        later = later_collector.collect_repo_git_metrics(repo.path)
+
+        assert first["errors"] == [] and later["errors"] == []
+        assert len(walk_count) == 1
+        assert later_collector.get_cache_stats() == {"hits": 1, "misses": 0, "hit_rate": 100.0}
+        assert first["repository"]["commit_counts"] == {"last_30": 1, "last_365": 2}
+        # The Alice commit has aged out of the 30 day window
+        assert later["repository"]["commit_counts"] == {"last_30": 0, "last_365": 2}
+        assert later["repository"]["total_commits_ever"] == 2
+        assert later["repository"]["last_commit_timestamp"] == (
+            first["repository"]["last_commit_timestamp"]
+        )
+        assert {a["email"] for a in later["repository"]["authors"]} == {
+            "alice@example.com",
+            "bob@example.com",
+        }
+
+    def test_miss_after_new_commit(self, make_collector, git_repo_builder, walk_count):
+        now = datetime.now(timezone.utc)
+        repo = git_repo_builder()
+        repo.commit({"a.txt": "1\n"}, days_ago=3)
+        make_collector(now).collect_repo_git_metrics(repo.path)
+        repo.commit({"a.txt": "1\n2\n"}, days_ago=1)
+
+        collector = make_collector(now)
+        metrics = collector.collect_repo_git_metrics(repo.path)
+
+        assert len(walk_count) == 2
+        assert collector.get_cache_stats()["misses"] == 1
+        assert metrics["repository"]["total_commits_ever"] == 2
+
+    def test_miss_after_settings_change(self, make_collector, git_repo_builder, walk_count):
+        now = datetime.now(timezone.utc)
+        repo = git_repo_builder()
+        repo.commit({"a.txt": "1\n"}, days_ago=3)
+        make_collector(now).collect_repo_git_metrics(repo.path)
+
+        collector = make_collector(now, skip_binary_changes=False)
+        collector.collect_repo_git_metrics(repo.path)
+
+        assert len(walk_count) == 2
+        assert collector.get_cache_stats() == {"hits": 0, "misses": 1, "hit_rate": 0.0}
@@ -0,0 +1,129 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for subprocess-free ref resolution.
+
+Covers:
+- Loose and packed refs, detached HEAD, unborn branches
+- Linked worktrees and bare clones
+- Fallback signalling for the reftable backend
+- GitDataCollector spawning no extra git processes for HEAD / last commit
+"""
+
+import subprocess
+
+import pytest
+
+from gerrit_reporting_tool.collectors import git_backend
+from gerrit_reporting_tool.collectors.git import GitDataCollector
+from gerrit_reporting_tool.collectors.git_refs import (
+    find_git_dir,
+    read_head_commit,
+    read_packed_refs,
+    resolve_ref,
+)
+
+
+@pytest.fixture
+def repo(git_repo_builder):
+    builder = git_repo_builder()
+    builder.commit({"a.txt": "1\n"}, days_ago=2)
+    return builder
+
+
+class TestReadHeadCommit:
+    """read_head_commit() against git rev-parse."""
+
+    def test_loose_ref(self, repo):
+        head = repo.commit({"a.txt": "2\n"}, days_ago=1)
+        assert (repo.path / ".git" / "refs" / "heads" / "main").is_file()
+        assert read_head_commit(repo.path) == head
+
+    def test_packed_ref(self, repo):
+        head = repo.git("rev-parse", "HEAD")
+        repo.git("tag", "-a", "-m", "release", "v1.0")
+        repo.git("pack-refs", "--all")
+
+        assert not (repo.path / ".git" / "refs" / "heads" / "main").exists()
+        assert read_head_commit(repo.path) == head
+        packed = read_packed_refs(repo.path / ".git")
+        assert packed["refs/heads/main"] == head
+        # Annotated tags resolve to the tag object, peeled lines are skipped
+        assert packed["refs/tags/v1.0"] == repo.git("rev-parse", "v1.0")
+
+    def test_loose_ref_overrides_packed(self, repo):
+        repo.git("pack-refs", "--all")
+        head = repo.commit({"a.txt": "2\n"}, days_ago=1)
+        assert read_head_commit(repo.path) == head
+
+    def test_detached_head(self, repo):
+        first = repo.git("rev-parse", "HEAD")
+        repo.commit({"a.txt": "2\n"}, days_ago=1)
+        repo.git("checkout", "-q", "--detach", first)
+        assert read_head_commit(repo.path) == first
+
+    def test_unborn_branch(self, git_repo_builder):
+        assert read_head_commit(git_repo_builder("empty").path) is None
+
+    def test_not_a_repository(self, tmp_path):
+        assert find_git_dir(tmp_path) is None
+        assert read_head_commit(tmp_path) is None
+
+    def test_linked_worktree(self, repo, tmp_path):
+        repo.git("branch", "feature")
+        worktree = tmp_path / "worktree"
+        repo.git("worktree", "add", "-q", str(worktree), "feature")
+        subprocess.run(
+            ["git", "commit", "-q", "--allow-empty", "-m", "worktree change"],
+            cwd=worktree,
+            check=True,
+        )
+        expected = repo.git("rev-parse", "feature")
+
+        assert (worktree / ".git").is_file()
+        assert read_head_commit(worktree) == expected
+        assert read_head_commit(repo.path) == repo.git("rev-parse", "main")
+
+    def test_bare_clone(self, repo, tmp_path):
+        bare = tmp_path / "bare.git"
+        subprocess.run(
+            ["git", "clone", "-q", "--bare", str(repo.path), str(bare)], check=True
+        )
+        assert find_git_dir(bare) == bare
+        assert read_head_commit(bare) == repo.git("rev-parse", "HEAD")
+
+    def test_reftable_is_unresolved(self, repo):
+        (repo.path / ".git" / "reftable").mkdir()
+        assert resolve_ref(repo.path / ".git", "HEAD") is None
+
+
+class TestCollectorProcessCount:
+    """The collector derives HEAD and the last commit date without extra git calls."""
+
+    def test_no_rev_parse_or_log_one(
+        self, repo, tmp_path, collector_time_windows, collector_logger, monkeypatch
+    ):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        commands = []
+        original = git_backend.safe_git_command
+
+        def _spy(cmd, *args, **kwargs):
+            commands.append(cmd)
+            return original(cmd, *args, **kwargs)
+
+        monkeypatch.setattr(git_backend, "safe_git_command", _spy)
+        config = {
+            "gerrit": {"enabled": False},
+            "jenkins": {"enabled": False},
+            "performance": {
+                "cache": True,
+                "store_path": str(tmp_path / "metrics.sqlite3"),
+            },
+        }
+        collector = GitDataCollector(config, collector_time_windows, collector_logger)
+        metrics = collector.collect_repo_git_metrics(repo.path)
+
+        assert metrics["errors"] == []
+        assert metrics["repository"]["last_commit_timestamp"] is not None
+        assert not [c for c in commands if "rev-parse" in c or "-1" in c]
@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for streaming git log collection in GitDataCollector.
+
+Covers:
+- GitCommandStream line streaming, failure reporting and timeouts
+- End-to-end metric folding from a live git log pipe
+"""
+
+import sys
+
+import pytest
+
+from gerrit_reporting_tool.collectors.git import GitDataCollector
+from gerrit_reporting_tool.collectors.git_backend import GitCommandStream
+
+
+@pytest.fixture
+def collector(collector_time_windows, collector_logger, monkeypatch):
+    """GitDataCollector with external integrations disabled."""
+    monkeypatch.delenv("JENKINS_HOST", raising=False)
+    config = {"gerrit": {"enabled": False}, "jenkins": {"enabled": False}}
+    return GitDataCollector(config, collector_time_windows, collector_logger)
+
+
+class TestGitCommandStream:
+    """Tests for the Popen-backed line stream."""
+
+    def test_streams_lines(self, tmp_path, collector_logger):
+        cmd = [sys.executable, "-c", "print('a'); print('b|c')"]
+        with GitCommandStream(cmd, tmp_path, collector_logger) as stream:
+            lines = [line.rstrip("\n") for line in stream]
+
+        assert lines == ["a", "b|c"]
+        assert stream.success
+        assert stream.returncode == 0
+
+    def test_reports_failure_with_stderr(self, tmp_path, collector_logger):
+        cmd = [sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(3)"]
+        with GitCommandStream(cmd, tmp_path, collector_logger) as stream:
+            assert list(stream) == []
+
+        assert not stream.success
+        assert stream.returncode == 3
+        assert stream.error == "boom"
+
+    def test_missing_executable(self, tmp_path, collector_logger):
+        with GitCommandStream(["/nonexistent/git"], tmp_path, collector_logger) as stream:
+            assert list(stream) == []
+
+        assert not stream.success
+        assert stream.error
+
+    def test_timeout_kills_process(self, tmp_path, collector_logger):
+        # Output read before the deadline depends on interpreter startup time,
+        # so only the timeout outcome is checked
+        cmd = [sys.executable, "-c", "import time; print('x', flush=True); time.sleep(30)"]
+        with GitCommandStream(cmd, tmp_path, collector_logger, timeout=0.5) as stream:
+            list(stream)
+
+        assert stream.timed_out
+        assert stream.error == "Command timed out"
+        assert not stream.success
+
+
+class TestStreamingCollection:
+    """End-to-end collection through the streaming pipe."""
+
+    def test_collects_metrics(self, collector, git_repo_builder):
+        repo = git_repo_builder()
+        repo.commit({"a.txt": "1\n2\n3\n"}, author="Alice", email="alice@example.com", days_ago=5)
+        repo.commit({"a.txt": "1\n"}, author="Bob", email="bob@example.com", days_ago=60)
+        repo.commit({"b.txt": "x\n"}, author="Alice", email="alice@example.com", days_ago=400)
+
+        metrics = collector.collect_repo_git_metrics(repo.path)
+        repository = metrics["repository"]
+
+        assert metrics["errors"] == []
+        assert repository["total_commits_ever"] == 3
+        assert repository["has_any_commits"] is True
+        assert repository["commit_counts"] == {"last_30": 1, "last_90": 2, "last_365": 2}
+        assert repository["loc_stats"]["last_30"] == {"added": 3, "removed": 0, "net": 3}
+        assert repository["loc_stats"]["last_90"] == {"added": 3, "removed": 2, "net": 1}
+        assert repository["unique_contributors"] == {"last_30": 1, "last_90": 2, "last_365": 2}
+        assert {a["email"] for a in repository["authors"]} == {
+            "alice@example.com",
+            "bob@example.com",
+        }
+
+    def test_empty_repository_reports_git_error(self, collector, git_repo_builder):
+        repo = git_repo_builder("empty")
+
+        metrics = collector.collect_repo_git_metrics(repo.path)
+
+        assert metrics["repository"]["total_commits_ever"] == 0
+        assert len(metrics["errors"]) == 1
+        assert metrics["errors"][0].startswith("Git command failed:")
+
+    def test_last_commit_from_epoch(self, collector, git_repo_builder):
+        from datetime import datetime, timezone
+
+        repo = git_repo_builder()
+        when = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+        repo.commit({"a.txt": "1\n"}, when=when)
+
+        metrics = collector.collect_repo_git_metrics(repo.path)
+        repository = metrics["repository"]
+
+        assert repository["last_commit_timestamp"] == "2024-05-01T12:00:00+00:00"
+        assert repository["days_since_last_commit"] == (datetime.now(timezone.utc) - when).days
+        assert repository["commit_counts"] == {"last_30": 0, "last_90": 0, "last_365": 0}
+
+    def test_last_commit_keeps_author_offset(self, collector, git_repo_builder):
+        from datetime import datetime, timedelta, timezone
+
+        repo = git_repo_builder()
+        ist = timezone(timedelta(hours=5, minutes=30))
+        repo.commit({"a.txt": "1\n"}, when=datetime(2024, 5, 1, 17, 30, tzinfo=ist))
+
+        repository = collector.collect_repo_git_metrics(repo.path)["repository"]
+
+        assert repository["last_commit_timestamp"] == "2024-05-01T17:30:00+05:30"
+
+    def test_extra_windows_from_histograms(self, collector, git_repo_builder):
+        from datetime import datetime, timedelta, timezone
+
+        repo = git_repo_builder()
+        repo.commit({"a.txt": "1\n"}, author="Alice", email="alice@example.com", days_ago=3)
+        repo.commit({"a.txt": "1\n2\n"}, author="Bob", email="bob@example.com", days_ago=10)
+        now = datetime.now(timezone.utc)
+        start = now - timedelta(days=7)
+        collector.time_windows = {
+            **collector.time_windows,
+            "last_7": {
+                "days": 7,
+                "start": start.isoformat(),
+                "end": now.isoformat(),
+                "start_timestamp": start.timestamp(),
+                "end_timestamp": now.timestamp(),
+            },
+        }
+
+        metrics = collector.collect_repo_git_metrics(repo.path)
+        repository = metrics["repository"]
+
+        assert repository["commit_counts"]["last_7"] == 1
+        assert repository["commit_counts"]["last_30"] == 2
+        assert repository["unique_contributors"] == {
+            "last_30": 2,
+            "last_90": 2,
+            "last_365": 2,
+            "last_7": 1,
+        }
+        authors = {a["email"]: a for a in repository["authors"]}
+        assert authors["bob@example.com"]["commits"]["last_7"] == 0
+        assert authors["bob@example.com"]["repositories"] == {
+            "last_30": 1,
+            "last_90": 1,
+            "last_365": 1,
+            "last_7": 0,
+        }
@@ -0,0 +1,217 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for per-directory churn and hotspot paths.
+
+Covers:
+- Space-Saving counts, errors and memory bound
+- Per-window folding of per-file numstat data
+- Collector output for full walks and for cached repositories, and the stored
+  report reused while the time windows are unchanged
+- The Markdown hotspots section
+"""
+
+import logging
+import random
+from collections import Counter
+
+from gerrit_reporting_tool.collectors.activity import DAY_SECONDS
+from gerrit_reporting_tool.collectors.git import GitDataCollector
+from gerrit_reporting_tool.collectors.git_log import GitLogParser
+from gerrit_reporting_tool.collectors.hotspots import (
+    HotspotAccumulator,
+    SpaceSaving,
+    top_level_directory,
+)
+from gerrit_reporting_tool.renderers.report import ReportRenderer
+
+
+def _record(sha: str, epoch: int, files: list[tuple[int, int, str]]) -> bytes:
+    numstat = b"".join(f"{a}\t{r}\t{p}\0".encode() for a, r, p in files)
+    return f"\x1e{sha}\0{epoch}\0Dev\0dev@example.com\0".encode() + b"\n" + numstat + b"\0"
+
+
+class TestSpaceSaving:
+    """The heavy-hitters sketch."""
+
+    def test_exact_below_capacity(self):
+        sketch = SpaceSaving(capacity=10)
+        for key, weight in [(b"a", 5), (b"b", 2), (b"a", 1), (b"c", 0)]:
+            sketch.offer(key, weight)
+
+        assert sketch.top(5) == [(b"a", 6, 0), (b"b", 2, 0)]
+        assert sketch.total == 8
+
+    def test_heavy_hitters_survive_eviction(self):
+        rng = random.Random(7)
+        stream = [(b"hot1", 50), (b"hot2", 30)] * 200
+        stream += [(f"cold{i}".encode(), rng.randint(1, 5)) for i in range(20000)]
+        rng.shuffle(stream)
+        exact = Counter()
+        sketch = SpaceSaving(capacity=50)
+        for key, weight in stream:
+            sketch.offer(key, weight)
+            exact[key] += weight
+
+        assert len(sketch) == 50
+        assert len(sketch._heap) <= 4 * 50 + 1
+        top = sketch.top(2)
+        assert [key for key, _, _ in top] == [b"hot1", b"hot2"]
+        for key, count, error in top:
+            assert count - error <= exact[key] <= count
+
+
+class TestHotspotAccumulator:
+    """Folding parsed batches into windows."""
+
+    def test_windows_and_directories(self):
+        day = 86400
+        parser = GitLogParser(keep_files=True)
+        data = (
+            _record("a" * 40, 100 * day, [(5, 1, "src/main.c"), (2, 0, "README")])
+            + _record("b" * 40, 95 * day, [(1, 1, "src/main.c")])
+            + _record("c" * 40, 10 * day, [(100, 0, "docs/old.md")])
+        )
+        hotspots = HotspotAccumulator({"recent": 90, "all": 0}, capacity=10)
+        for batch in parser.parse([data]):
+            hotspots.fold(batch)
+
+        report = hotspots.report(top_n=1)
+        recent = report["windows"]["recent"]
+        assert recent["commits"] == 2
+        assert recent["churn"] == 10
+        assert recent["directories"] == [
+            {"directory": "src", "commits": 2, "added": 6, "removed": 2, "churn": 8},
+            {"directory": "/", "commits": 1, "added": 2, "removed": 0, "churn": 2},
+        ]
+        assert recent["hottest_paths"] == [{"path": "src/main.c", "churn": 8, "error": 0}]
+        assert report["windows"]["all"]["hottest_paths"][0]["path"] == "docs/old.md"
+        assert hotspots.earliest_day == 0
+
+    def test_top_level_directory(self):
+        assert top_level_directory(b"a/b/c") == b"a"
+        assert top_level_directory(b"file") == b""
+
+
+class TestCollectorHotspots:
+    """GitDataCollector hotspot section."""
+
+    def _collector(self, tmp_path, time_windows, logger, monkeypatch, cache=False):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        config = {
+            "gerrit": {"enabled": False},
+            "jenkins": {"enabled": False},
+            "hotspots": {"enabled": True, "top_n": 2, "capacity": 16},
+            "performance": {
+                "cache": cache,
+                "store_path": str(tmp_path / "metrics.sqlite3"),
+            },
+        }
+        return GitDataCollector(config, time_windows, logger)
+
+    def test_full_walk_and_cached_walk_agree(
+        self, tmp_path, git_repo_builder, collector_time_windows, collector_logger, monkeypatch
+    ):
+        repo = git_repo_builder()
+        repo.commit({"src/a.py": "1\n2\n3\n"}, days_ago=200)
+        repo.commit({"src/a.py": "1\n"}, days_ago=20)
+        repo.commit({"docs/x.md": "x\n", "top.txt": "t\n"}, days_ago=5)
+
+        collector = self._collector(
+            tmp_path, collector_time_windows, collector_logger, monkeypatch, cache=True
+        )
+        first = collector.collect_repo_git_metrics(repo.path)["repository"]["hotspots"]
+        cached = collector.collect_repo_git_metrics(repo.path)["repository"]["hotspots"]
+        collector.state_store.close()
+
+        assert collector.get_cache_stats()["hits"] == 1
+        assert cached == first
+        last_30 = first["windows"]["last_30"]
+        assert last_30["commits"] == 2
+        assert [d["directory"] for d in last_30["directories"]] == ["src", "/", "docs"]
+        assert last_30["hottest_paths"][0] == {"path": "src/a.py", "churn": 2, "error": 0}
+        assert len(last_30["hottest_paths"]) == 2
+        assert first["windows"]["last_365"]["churn"] == 7
+
+    def test_stored_report_reused_until_windows_move(
+        self, tmp_path, git_repo_builder, collector_time_windows, collector_logger, monkeypatch
+    ):
+        repo = git_repo_builder()
+        repo.commit({"src/a.py": "1\n2\n"}, days_ago=40)
+        repo.commit({"src/a.py": "1\n"}, days_ago=3)
+        collector = self._collector(
+            tmp_path, collector_time_windows, collector_logger, monkeypatch, cache=True
+        )
+        first = collector.collect_repo_git_metrics(repo.path)["repository"]["hotspots"]
+        collector.state_store.close()
+
+        walks = []
+
+        def collect(time_windows):
+            collector = self._collector(
+                tmp_path, time_windows, collector_logger, monkeypatch, cache=True
+            )
+            run_walk = collector._run_walk
+
+            def counting_walk(*args, **kwargs):
+                walks.append(kwargs.get("since"))
+                return run_walk(*args, **kwargs)
+
+            monkeypatch.setattr(collector, "_run_walk", counting_walk)
+            try:
+                return collector.collect_repo_git_metrics(repo.path)["repository"]["hotspots"]
+            finally:
+                collector.state_store.close()
+
+        assert collect(collector_time_windows) == first
+        assert walks == []
+
+        # A day later every window starts one day later
+        moved = {
+            name: {**window, "start_timestamp": window["start_timestamp"] + DAY_SECONDS}
+            for name, window in collector_time_windows.items()
+        }
+        assert collect(moved)["windows"]["last_30"]["commits"] == 1
+        assert len(walks) == 1
+        assert collect(moved)["windows"]["last_30"]["commits"] == 1
+        assert len(walks) == 1
+
+    def test_disabled_by_default(
+        self, git_repo_builder, collector_time_windows, collector_logger, monkeypatch
+    ):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        repo = git_repo_builder()
+        repo.commit({"a.txt": "1\n"})
+        config = {"gerrit": {"enabled": False}, "jenkins": {"enabled": False}}
+        collector = GitDataCollector(config, collector_time_windows, collector_logger)
+
+        assert "hotspots" not in collector.collect_repo_git_metrics(repo.path)["repository"]
+
+
+class TestHotspotsSection:
+    """Markdown rendering."""
+
+    def test_section(self):
+        renderer = ReportRenderer(
+            {"time_windows": {"last_365": {"days": 365}}}, logging.getLogger("test")
+        )
+        window = {
+            "churn": 12,
+            "directories": [{"directory": "src", "churn": 12}],
+            "hottest_paths": [{"path": "src/a.py", "churn": 12, "error": 0}],
+        }
+        data = {
+            "repositories": [
+                {"gerrit_project": "hot", "hotspots": {"windows": {"last_365": window}}},
+                {"gerrit_project": "plain"},
+            ]
+        }
+
+        section = renderer._generate_hotspots_section(data)
+
+        assert "## 🔥 Churn Hotspots" in section
+        assert "the past 365 days" in section
+        assert "| hot | 12 | src (12) | `src/a.py` (12) |" in section
+        assert "plain" not in section
+        assert renderer._generate_hotspots_section({"repositories": []}) == ""
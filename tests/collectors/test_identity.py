@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for the run-wide author identity table.
+
+Covers:
+- Normalization and organizational domain extraction
+- Shared author ids for raw identities with the same email
+- Concurrent lookups from many threads
+- Sharing between GitDataCollector repositories and DataAggregator
+"""
+
+import threading
+
+from gerrit_reporting_tool.aggregators import DataAggregator
+from gerrit_reporting_tool.collectors.git import GitDataCollector
+from gerrit_reporting_tool.collectors.identity import IdentityTable, normalize_identity
+
+
+class TestNormalization:
+    """Identity normalization and organization lookup."""
+
+    def test_normalize_identity(self):
+        assert normalize_identity(" Alice ", " Alice@Example.COM ") == (
+            "Alice",
+            "alice@example.com",
+        )
+        assert normalize_identity("", "not-an-email") == ("Unknown", "unknown@unknown")
+        assert normalize_identity("Bob", "", "nobody@example.org") == (
+            "Bob",
+            "nobody@example.org",
+        )
+
+    def test_organization(self):
+        table = IdentityTable(
+            preserve_full_domain=["zte.com.cn"],
+            custom_mappings={"research.example.net": "example.com"},
+        )
+        assert table.organization("users.noreply.github.com") == "github.com"
+        assert table.organization("zte.com.cn") == "zte.com.cn"
+        assert table.organization("research.example.net") == "example.com"
+        assert table.organization("simple.com") == "simple.com"
+        assert table.organization("localhost") == "localhost"
+        assert table.organization("lab.example.co.uk") == "example.co.uk"
+
+    def test_extra_public_suffixes(self):
+        table = IdentityTable(public_suffixes=["corp.example"])
+        assert table.organization("mail.team.corp.example") == "team.corp.example"
+        assert IdentityTable().organization("mail.team.corp.example") == "corp.example"
+
+    def test_resolve_sets_domain(self):
+        identity = IdentityTable().resolve("Carol", "carol@dev.lab.example.org")
+        assert identity.email == "carol@dev.lab.example.org"
+        assert identity.domain == "example.org"
+        assert IdentityTable().resolve("Dan", "").domain == "unknown"
+
+
+class TestIdentityTable:
+    """Interning, ids and statistics."""
+
+    def test_shared_author_id_per_email(self):
+        table = IdentityTable()
+        first = table.resolve("Alice", "alice@example.com")
+        second = table.resolve("Alice A.", "ALICE@example.com")
+        other = table.resolve("Bob", "bob@example.com")
+
+        assert first.author_id == second.author_id != other.author_id
+        assert second.name == "Alice A."
+        assert table.by_email("alice@example.com") is first
+        assert table.resolve("Alice", "alice@example.com") is first
+
+    def test_stats(self):
+        table = IdentityTable()
+        for _ in range(3):
+            table.resolve("Alice", "alice@example.com")
+        table.resolve("Bob", "bob@sub.example.com")
+
+        assert table.get_stats() == {
+            "lookups": 4,
+            "hits": 2,
+            "misses": 2,
+            "hit_rate": 50.0,
+            "identities": 2,
+            "authors": 2,
+            "domains": 2,
+            "domain_hits": 0,
+            "domain_misses": 2,
+        }
+
+    def test_concurrent_resolve(self):
+        table = IdentityTable()
+        raw = [(f"User {i}", f"user{i % 50}@example.com") for i in range(200)]
+        results = []
+        barrier = threading.Barrier(8)
+
+        def _worker():
+            barrier.wait()
+            results.append([table.resolve(name, email) for name, email in raw])
+
+        threads = [threading.Thread(target=_worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(table) == 200
+        assert sorted({i.author_id for i in results[0]}) == list(range(50))
+        for result in results[1:]:
+            assert [a is b for a, b in zip(result, results[0])] == [True] * 200
+        assert table.get_stats()["misses"] == 200
+
+
+class TestSharedTable:
+    """One table per run, shared by collector and aggregator."""
+
+    def test_repositories_share_identities(
+        self, git_repo_builder, collector_time_windows, collector_logger, monkeypatch
+    ):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        collector = GitDataCollector(
+            {"gerrit": {"enabled": False}, "jenkins": {"enabled": False}},
+            collector_time_windows,
+            collector_logger,
+        )
+        repos = []
+        for name in ("one", "two"):
+            repo = git_repo_builder(name)
+            repo.commit({"a.txt": "1\n"}, author="Alice", email="alice@ci.example.com")
+            repo.commit({"a.txt": "2\n"}, author="Alice", email="alice@ci.example.com")
+            repos.append(collector.collect_repo_git_metrics(repo.path)["repository"])
+
+        stats = collector.identities.get_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert repos[1]["authors"][0]["domain"] == "example.com"
+
+        aggregator = DataAggregator({}, collector_logger, identities=collector.identities)
+        repos[0]["authors"][0]["domain"] = "stale.example"
+        (author,) = aggregator.compute_author_rollups(repos)
+        assert author["domain"] == "example.com"
+        assert author["repositories_count"]["last_30"] == 2
@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for incremental git collection.
+
+Covers:
+- Walking only old_head..new_head on subsequent runs
+- Skipping the walk entirely when HEAD is unchanged
+- Falling back to a full walk after history rewrites or settings changes
+"""
+
+import pytest
+
+from gerrit_reporting_tool.collectors.git import GitDataCollector
+
+
+@pytest.fixture
+def make_collector(tmp_path, collector_time_windows, collector_logger, monkeypatch):
+    """Factory for collectors sharing one incremental state directory."""
+    monkeypatch.delenv("JENKINS_HOST", raising=False)
+
+    def _make(incremental: bool = True, **data_quality) -> GitDataCollector:
+        config = {
+            "gerrit": {"enabled": False},
+            "jenkins": {"enabled": False},
+            "performance": {
+                "incremental": incremental,
+                "store_path": str(tmp_path / "metrics.sqlite3"),
+            },
+            "data_quality": data_quality,
+        }
+        return GitDataCollector(config, collector_time_windows, collector_logger)
+
+    return _make
+
+
+@pytest.fixture
+def walked_ranges(monkeypatch):
+    """Record the revision ranges passed to _walk_git_log."""
+    ranges = []
+    original = GitDataCollector._walk_git_log
+
+    def _spy(self, repo_path, revision_range, *args, **kwargs):
+        ranges.append(revision_range)
+        return original(self, repo_path, revision_range, *args, **kwargs)
+
+    monkeypatch.setattr(GitDataCollector, "_walk_git_log", _spy)
+    return ranges
+
+
+def _comparable(metrics):
+    repository = dict(metrics["repository"])
+    repository["authors"] = sorted(repository["authors"], key=lambda a: a["email"])
+    return repository
+
+
+class TestIncrementalCollection:
+    """End-to-end incremental collection."""
+
+    def test_walks_only_new_commits(self, make_collector, git_repo_builder, walked_ranges):
+        repo = git_repo_builder()
+        first = repo.commit({"a.txt": "1\n"}, author="Alice", email="alice@example.com", days_ago=40)
+        make_collector().collect_repo_git_metrics(repo.path)
+        second = repo.commit({"a.txt": "1\n2\n"}, author="Bob", email="bob@example.com", days_ago=2)
+
+        incremental = make_collector().collect_repo_git_metrics(repo.path)
+        full = make_collector(incremental=False).collect_repo_git_metrics(repo.path)
+
+        assert walked_ranges == [first, f"{first}..{second}", None]
+        assert _comparable(incremental) == _comparable(full)
+        assert incremental["repository"]["total_commits_ever"] == 2
+
+    def test_unchanged_head_skips_walk(self, make_collector, git_repo_builder, walked_ranges):
+        repo = git_repo_builder()
+        repo.commit({"a.txt": "1\n"}, days_ago=5)
+        before = make_collector().collect_repo_git_metrics(repo.path)
+
+        after = make_collector().collect_repo_git_metrics(repo.path)
+
+        assert len(walked_ranges) == 1
+        assert _comparable(after) == _comparable(before)
+
+    def test_rewritten_history_falls_back(self, make_collector, git_repo_builder, walked_ranges):
+        repo = git_repo_builder()
+        repo.commit({"a.txt": "1\n"}, days_ago=5)
+        repo.commit({"a.txt": "1\n2\n3\n"}, days_ago=4)
+        make_collector().collect_repo_git_metrics(repo.path)
+        repo.git("reset", "-q", "--hard", "HEAD~1")
+        rewritten = repo.commit({"b.txt": "x\n"}, days_ago=3)
+
+        metrics = make_collector().collect_repo_git_metrics(repo.path)
+
+        assert walked_ranges[-1] == rewritten
+        assert metrics["repository"]["total_commits_ever"] == 2
+        assert metrics["repository"]["loc_stats"]["last_30"]["added"] == 2
+
+    def test_settings_change_forces_full_walk(
+        self, make_collector, git_repo_builder, walked_ranges
+    ):
+        repo = git_repo_builder()
+        head = repo.commit({"a.txt": "1\n"}, days_ago=5)
+        make_collector().collect_repo_git_metrics(repo.path)
+
+        make_collector(skip_binary_changes=False).collect_repo_git_metrics(repo.path)
+
+        assert walked_ranges == [head, head]
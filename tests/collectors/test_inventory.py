@@ -0,0 +1,192 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for the code-size inventory.
+
+Covers:
+- Grouping per extension and top-level directory, the "(other)" row
+- Tree listings of bare clones, for both git backends
+- Collector output, the largest repositories leaderboard and its Markdown section
+"""
+
+import logging
+import subprocess
+
+import pytest
+
+from gerrit_reporting_tool.aggregators.data import DataAggregator
+from gerrit_reporting_tool.collectors.git import GitDataCollector
+from gerrit_reporting_tool.collectors.git_backend import (
+    CliGitBackend,
+    Pygit2GitBackend,
+    TreeEntry,
+    pygit2,
+)
+from gerrit_reporting_tool.collectors.inventory import (
+    NO_EXTENSION,
+    OTHER_GROUP,
+    code_inventory,
+    file_extension,
+)
+from gerrit_reporting_tool.renderers.report import ReportRenderer
+
+
+BACKENDS = [
+    pytest.param(CliGitBackend, id="cli"),
+    pytest.param(
+        Pygit2GitBackend,
+        id="pygit2",
+        marks=pytest.mark.skipif(pygit2 is None, reason="pygit2 is not installed"),
+    ),
+]
+
+
+def _blob(path: str, size: int, mode: int = 0o100644) -> TreeEntry:
+    return TreeEntry(path, mode, "blob", "0" * 40, size)
+
+
+class TestCodeInventory:
+    """Grouping of tree entries."""
+
+    def test_extensions(self):
+        assert file_extension("src/Main.JAVA") == ".java"
+        assert file_extension("docs/a.tar.gz") == ".gz"
+        assert file_extension("Makefile") == NO_EXTENSION
+        assert file_extension("sub/.gitignore") == NO_EXTENSION
+
+    def test_groups_and_other(self):
+        entries = [
+            _blob("src/a.py", 300),
+            _blob("src/b.py", 200),
+            _blob("src/c.c", 50),
+            _blob("docs/index.md", 100),
+            _blob("README", 10),
+            _blob("run.sh", 5, mode=0o100755),
+            _blob("link", 8, mode=0o120000),
+            TreeEntry("vendor/lib", 0o160000, "commit", "1" * 40, None),
+        ]
+
+        inventory = code_inventory(entries, top_n=2)
+
+        assert inventory["total_files"] == 6
+        assert inventory["total_bytes"] == 665
+        assert inventory["submodules"] == 1
+        assert inventory["extensions"] == [
+            {"extension": ".py", "files": 2, "bytes": 500},
+            {"extension": ".md", "files": 1, "bytes": 100},
+            {"extension": OTHER_GROUP, "files": 3, "bytes": 65},
+        ]
+        assert inventory["directories"] == [
+            {"directory": "src", "files": 3, "bytes": 550},
+            {"directory": "docs", "files": 1, "bytes": 100},
+            {"directory": OTHER_GROUP, "files": 2, "bytes": 15},
+        ]
+        assert code_inventory([])["extensions"] == []
+
+
+@pytest.mark.parametrize("backend_class", BACKENDS)
+class TestBareClone:
+    """Inventory of a bare clone from the tree listing."""
+
+    def test_bare_clone(self, git_repo_builder, tmp_path, backend_class):
+        repo = git_repo_builder()
+        repo.commit({"src/a.py": "x" * 100, "src/b.py": "y" * 20, "README": "r\n"})
+        bare = tmp_path / "bare.git"
+        subprocess.run(
+            ["git", "clone", "-q", "--bare", str(repo.path), str(bare)],
+            check=True,
+            capture_output=True,
+        )
+
+        inventory = code_inventory(backend_class().list_tree(bare))
+
+        assert inventory["total_files"] == 3
+        assert inventory["total_bytes"] == 122
+        assert inventory["directories"][0] == {"directory": "src", "files": 2, "bytes": 120}
+
+
+class TestCollectorInventory:
+    """GitDataCollector output, aggregation and rendering."""
+
+    def test_collect_aggregate_and_render(
+        self, git_repo_builder, collector_time_windows, collector_logger, monkeypatch
+    ):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        config = {
+            "gerrit": {"enabled": False},
+            "jenkins": {"enabled": False},
+            "inventory": {"enabled": True},
+        }
+        collector = GitDataCollector(config, collector_time_windows, collector_logger)
+        small = git_repo_builder("small")
+        small.commit({"a.py": "1\n"})
+        large = git_repo_builder("large")
+        large.commit({"lib/a.java": "x" * 4000, "lib/b.py": "y" * 1000})
+        repos = [
+            collector.collect_repo_git_metrics(built.path)["repository"]
+            for built in (small, large)
+        ]
+
+        assert repos[1]["inventory"]["total_bytes"] == 5000
+        assert repos[1]["inventory"]["extensions"][0]["extension"] == ".java"
+
+        summaries = DataAggregator({}, collector_logger).aggregate_global_data(repos)
+        assert [row["gerrit_project"] for row in summaries["largest_repositories"]] == [
+            "large",
+            "small",
+        ]
+        assert summaries["code_inventory"]["total_bytes"] == 5002
+        assert summaries["code_inventory"]["extensions"][1] == {
+            "extension": ".py",
+            "files": 2,
+            "bytes": 1002,
+            "repositories": 2,
+        }
+
+        section = ReportRenderer({}, logging.getLogger("test"))._generate_inventory_section(
+            {"summaries": summaries}
+        )
+        assert "## 📦 Code Size" in section
+        assert "| large | 4.9 KB | 2 | `.java` |" in section
+        assert "| `.py` | 1002.0 B | 2 | 2 |" in section
+
+    def test_bare_clone(
+        self, git_repo_builder, tmp_path, collector_time_windows, collector_logger, monkeypatch
+    ):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        repo = git_repo_builder()
+        repo.commit({"src/a.py": "x" * 100, "README": "r\n"})
+        bare = tmp_path / "bare.git"
+        subprocess.run(
+            ["git", "clone", "-q", "--bare", str(repo.path), str(bare)],
+            check=True,
+            capture_output=True,
+        )
+        config = {
+            "gerrit": {"enabled": False},
+            "jenkins": {"enabled": False},
+            "inventory": {"enabled": True},
+        }
+        collector = GitDataCollector(config, collector_time_windows, collector_logger)
+
+        metrics = collector.collect_repo_git_metrics(bare)
+
+        assert metrics["errors"] == []
+        assert metrics["repository"]["total_commits_ever"] == 1
+        assert metrics["repository"]["inventory"]["total_bytes"] == 102
+
+    def test_disabled_by_default(
+        self, git_repo_builder, collector_time_windows, collector_logger, monkeypatch
+    ):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        repo = git_repo_builder()
+        repo.commit({"a.txt": "1\n"})
+        config = {"gerrit": {"enabled": False}, "jenkins": {"enabled": False}}
+        collector = GitDataCollector(config, collector_time_windows, collector_logger)
+
+        repository = collector.collect_repo_git_metrics(repo.path)["repository"]
+
+        assert "inventory" not in repository
+        summaries = DataAggregator({}, collector_logger).aggregate_global_data([repository])
+        assert "largest_repositories" not in summaries
@@ -0,0 +1,149 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Unit tests for the SQLite metrics store.
+
+Tests cover:
+- RepoState round trip and per-project upserts
+- Indexed lookup by HEAD
+- Run metadata
+- Schema version check: stores of another version are rebuilt
+- WAL journaling and concurrent writers
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from gerrit_reporting_tool.collectors.activity import RepoActivity
+from gerrit_reporting_tool.collectors.metrics_store import SCHEMA_VERSION, MetricsStore
+from gerrit_reporting_tool.collectors.repo_state import RepoState
+
+
+def _state(head: str, commits: int = 1) -> RepoState:
+    activity = RepoActivity()
+    for day in range(commits):
+        activity.repository.add(100 + day, 5, 1)
+        activity.author("a@example.com").add(100 + day, 5, 1)
+    activity.author("b@example.com").add(50, 0, 3)
+    activity.repository.add(50, 0, 3)
+    return RepoState(
+        head=head,
+        total_commits=commits + 1,
+        activity=activity,
+        author_names={"a@example.com": "Alice", "b@example.com": "Bob"},
+        settings={"skip_binary_changes": True},
+        last_commit_timestamp=1_700_000_000,
+        last_commit_offset=-300,
+    )
+
+
+@pytest.fixture
+def store(tmp_path, collector_logger):
+    metrics_store = MetricsStore(tmp_path / "nested" / "metrics.sqlite3", collector_logger)
+    yield metrics_store
+    metrics_store.close()
+
+
+class TestMetricsStore:
+    """Tests for MetricsStore."""
+
+    def test_round_trip(self, store):
+        store.save("group/project", _state("a" * 40))
+
+        loaded = store.load("group/project")
+
+        assert loaded is not None
+        assert loaded.head == "a" * 40
+        assert loaded.total_commits == 2
+        assert loaded.settings == {"skip_binary_changes": True}
+        assert loaded.last_commit_timestamp == 1_700_000_000
+        assert loaded.last_commit_offset == -300
+        assert loaded.author_names == {"a@example.com": "Alice", "b@example.com": "Bob"}
+        assert loaded.activity.repository.items() == [(50, 1, 0, 3), (100, 1, 5, 1)]
+        assert loaded.activity.authors["b@example.com"].items() == [(50, 1, 0, 3)]
+
+    def test_upsert_replaces_previous_state(self, store):
+        store.save("project", _state("a" * 40, commits=3))
+        store.save("project", _state("b" * 40, commits=1))
+
+        loaded = store.load("project")
+
+        assert loaded.head == "b" * 40
+        assert loaded.activity.repository.totals(0) == (2, 5, 4)
+        assert store.load("missing") is None
+
+    def test_lookup_by_head(self, store):
+        store.save("one", _state("a" * 40))
+        store.save("two", _state("a" * 40))
+        store.save("three", _state("c" * 40))
+
+        assert store.projects_with_head("a" * 40) == ["one", "two"]
+        assert store.projects_with_head("f" * 40) == []
+
+    def test_run_metadata(self, store):
+        run_id = store.start_run("ONAP", tool_version="1.2.3", config_digest="abc")
+        store.finish_run(run_id, repositories=10, errors=1, details={"cache": {"hits": 9}})
+
+        run = store.get_run(run_id)
+
+        assert run["project"] == "ONAP"
+        assert run["tool_version"] == "1.2.3"
+        assert run["repositories"] == 10
+        assert run["errors"] == 1
+        assert run["details"] == {"cache": {"hits": 9}}
+        assert run["finished_at"] >= run["started_at"]
+
+    def test_other_schema_version_is_rebuilt(self, store, collector_logger):
+        store.save("project", _state("a" * 40))
+        run_id = store.start_run("ONAP")
+        store.close()
+        connection = sqlite3.connect(store.path)
+        with connection:
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION - 1}")
+        connection.close()
+
+        reopened = MetricsStore(store.path, collector_logger)
+        try:
+            assert reopened.load("project") is None
+            assert reopened.get_run(run_id)["project"] == "ONAP"
+            reopened.save("project", _state("b" * 40))
+        finally:
+            reopened.close()
+
+        same = MetricsStore(store.path, collector_logger)
+        try:
+            assert same.load("project").head == "b" * 40
+        finally:
+            same.close()
+
+    def test_uses_wal_journal(self, store):
+        connection = sqlite3.connect(store.path)
+        try:
+            assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            connection.close()
+
+    def test_concurrent_writers(self, store):
+        errors = []
+
+        def _write(index: int) -> None:
+            try:
+                for round_number in range(5):
+                    store.save(f"project-{index}", _state(f"{round_number:040d}", commits=3))
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=_write, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        for index in range(8):
+            loaded = store.load(f"project-{index}")
+            assert loaded.head == f"{4:040d}"
+            assert loaded.activity.repository.totals(0) == (4, 15, 6)
@@ -0,0 +1,221 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for sampled blame-based code ownership.
+
+Covers:
+- Blame per author, for both git backends
+- Sample selection (largest, churned, size limit, excluded paths)
+- Per-author and per-organization percentages
+- The (path, blob SHA) blame cache across runs
+- Fleet-wide ownership and its Markdown section
+"""
+
+import logging
+
+import pytest
+
+from gerrit_reporting_tool.aggregators.data import DataAggregator
+from gerrit_reporting_tool.collectors import git_backend
+from gerrit_reporting_tool.collectors.git import GitDataCollector
+from gerrit_reporting_tool.collectors.git_backend import TreeEntry, get_git_backend
+from gerrit_reporting_tool.collectors.identity import IdentityTable
+from gerrit_reporting_tool.collectors.ownership import (
+    ownership_metrics,
+    select_ownership_sample,
+)
+from gerrit_reporting_tool.renderers.report import ReportRenderer
+
+
+BACKENDS = [
+    "cli",
+    pytest.param(
+        "pygit2",
+        marks=pytest.mark.skipif(git_backend.pygit2 is None, reason="pygit2 not installed"),
+    ),
+]
+
+
+def _owned_repo(git_repo_builder, name: str = "repo"):
+    """a.txt: 1 line by Alice, 3 by Bob; b.txt: 2 lines by Carol."""
+    repo = git_repo_builder(name)
+    repo.commit({"a.txt": "1\n2\n3\n4\n", "b.txt": "x\ny\n"}, days_ago=20)
+    repo.commit(
+        {"a.txt": "1\nb\nb\nb\n"}, author="Bob", email="bob@corp.example.com", days_ago=10
+    )
+    repo.commit(
+        {"b.txt": "c\nc\n"}, author="Carol", email="carol@other.org", days_ago=5
+    )
+    return repo
+
+
+def _blob(path: str, size: int, mode: int = 0o100644) -> TreeEntry:
+    return TreeEntry(path, mode, "blob", path.ljust(40, "0"), size)
+
+
+def _collector(collector_time_windows, collector_logger, tmp_path, **ownership):
+    config = {
+        "gerrit": {"enabled": False},
+        "jenkins": {"enabled": False},
+        "performance": {"cache": True, "store_path": str(tmp_path / "store.sqlite3")},
+        "ownership": {"enabled": True, **ownership},
+    }
+    return GitDataCollector(config, collector_time_windows, collector_logger)
+
+
+class TestBlame:
+    """GitBackend.blame."""
+
+    @pytest.mark.parametrize("name", BACKENDS)
+    def test_lines_per_author(self, name, git_repo_builder):
+        repo = _owned_repo(git_repo_builder)
+        backend = get_git_backend(name)
+
+        assert backend.blame(repo.path, "a.txt") == {
+            ("Alice Example", "alice@example.com"): 1,
+            ("Bob", "bob@corp.example.com"): 3,
+        }
+        assert backend.blame(repo.path, "missing.txt") is None
+
+
+class TestSample:
+    """select_ownership_sample and ownership_metrics."""
+
+    def test_largest_churned_and_limits(self):
+        entries = [
+            _blob("small.c", 10),
+            _blob("big.c", 5000),
+            _blob("huge.bin", 10_000_000),
+            _blob("vendor/lib.c", 9000),
+            _blob("empty", 0),
+            _blob("hot.c", 20),
+            _blob("link", 100, mode=0o120000),
+        ]
+
+        def sample(**options):
+            selected = select_ownership_sample(entries, exclude_paths=["vendor"], **options)
+            return [entry.path for entry in selected]
+
+        assert sample(max_files=2) == ["big.c", "hot.c"]
+        assert sample(max_files=2, churned_paths=["small.c", "gone.c"]) == [
+            "small.c",
+            "big.c",
+        ]
+        assert sample(max_file_bytes=10) == ["small.c"]
+
+    def test_percentages(self):
+        identities = IdentityTable()
+        ownership = ownership_metrics(
+            [
+                {("Bob", "bob@corp.example.com"): 3, ("Alice", "ALICE@example.com"): 1},
+                {("Alice", "alice@example.com"): 4},
+            ],
+            identities,
+        )
+
+        assert ownership["lines"] == 8
+        assert [(a["email"], a["lines"], a["percent"]) for a in ownership["authors"]] == [
+            ("alice@example.com", 5, 62.5),
+            ("bob@corp.example.com", 3, 37.5),
+        ]
+        assert ownership["organizations"] == [
+            {"domain": "example.com", "lines": 8, "percent": 100.0},
+        ]
+
+
+class TestCollectorOwnership:
+    """GitDataCollector output, blame cache, aggregation and rendering."""
+
+    def test_cache_across_runs(
+        self, git_repo_builder, tmp_path, collector_time_windows, collector_logger, monkeypatch
+    ):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        repo = _owned_repo(git_repo_builder)
+        collector = _collector(collector_time_windows, collector_logger, tmp_path)
+        blamed = []
+        blame = collector.git_backend.blame
+
+        def counting_blame(repo_path, path, *args, **kwargs):
+            blamed.append(path)
+            return blame(repo_path, path, *args, **kwargs)
+
+        monkeypatch.setattr(collector.git_backend, "blame", counting_blame)
+
+        first = collector.collect_repo_git_metrics(repo.path)["repository"]["ownership"]
+
+        assert sorted(blamed) == ["a.txt", "b.txt"]
+        assert first["files"] == first["blamed_files"] == 2
+        assert first["lines"] == 6
+        assert [(a["email"], a["percent"]) for a in first["authors"]] == [
+            ("bob@corp.example.com", 50.0),
+            ("carol@other.org", 33.3),
+            ("alice@example.com", 16.7),
+        ]
+
+        # Only the changed file is blamed again
+        repo.commit({"b.txt": "c\nc\nd\n"}, author="Dan", email="dan@other.org", days_ago=1)
+        blamed.clear()
+        second = collector.collect_repo_git_metrics(repo.path)["repository"]["ownership"]
+
+        assert blamed == ["b.txt"]
+        assert second["blamed_files"] == 1
+        # bob@corp.example.com belongs to the example.com organization
+        assert second["organizations"] == [
+            {"domain": "example.com", "lines": 4, "percent": 57.1},
+            {"domain": "other.org", "lines": 3, "percent": 42.9},
+        ]
+
+    def test_aggregate_and_render(
+        self, git_repo_builder, tmp_path, collector_time_windows, collector_logger, monkeypatch
+    ):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        collector = _collector(collector_time_windows, collector_logger, tmp_path, max_files=1)
+        repos = [
+            collector.collect_repo_git_metrics(_owned_repo(git_repo_builder, name).path)[
+                "repository"
+            ]
+            for name in ("one", "two")
+        ]
+        assert repos[0]["ownership"]["files"] == 1
+
+        summaries = DataAggregator({}, collector_logger).aggregate_global_data(repos)
+        ownership = summaries["code_ownership"]
+        assert ownership["lines"] == 8
+        assert ownership["authors"][0]["email"] == "bob@corp.example.com"
+        assert ownership["authors"][0]["percent"] == 75.0
+
+        section = ReportRenderer({}, logging.getLogger("test"))._generate_ownership_section(
+            {"summaries": summaries}
+        )
+        assert "## 🧭 Code Ownership" in section
+        assert "| example.com | 8 | 100.0% |" in section
+        assert "| Bob | bob@corp.example.com | 6 | 75.0% |" in section
+
+    def test_disabled_by_default_and_invalid_sample(
+        self, git_repo_builder, collector_time_windows, collector_logger, monkeypatch
+    ):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        repo = _owned_repo(git_repo_builder)
+        config = {"gerrit": {"enabled": False}, "jenkins": {"enabled": False}}
+        collector = GitDataCollector(config, collector_time_windows, collector_logger)
+
+        repository = collector.collect_repo_git_metrics(repo.path)["repository"]
+
+        assert "ownership" not in repository
+        summaries = DataAggregator({}, collector_logger).aggregate_global_data([repository])
+        assert "code_ownership" not in summaries
+        with pytest.raises(ValueError, match="ownership.sample"):
+            GitDataCollector(
+                {**config, "ownership": {"sample": "random"}},
+                collector_time_windows,
+                collector_logger,
+            )
+
+    def test_churn_without_hotspots_warns(
+        self, tmp_path, collector_time_windows, collector_logger, caplog
+    ):
+        with caplog.at_level(logging.WARNING, logger=collector_logger.name):
+            _collector(collector_time_windows, collector_logger, tmp_path, sample="churn")
+
+        assert "hotspots are disabled" in caplog.text
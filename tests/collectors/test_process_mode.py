@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for the process-pool execution mode of git collection.
+
+Covers:
+- walk_git_log aggregates for raw identities
+- Pickling of walk results
+- Identical metrics in thread and process mode
+- Reporter wiring of the process pool
+"""
+
+import logging
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from gerrit_reporting_tool.collectors.git import GitDataCollector
+from gerrit_reporting_tool.collectors.git_backend import walk_git_log
+from gerrit_reporting_tool.reporter import RepositoryReporter
+
+
+@pytest.fixture
+def history(git_repo_builder):
+    """Repository with two raw identities of the same author and one other author."""
+    repo = git_repo_builder()
+    repo.commit({"a.txt": "1\n2\n"}, author="Alice", email="alice@example.com", days_ago=40)
+    repo.commit({"a.txt": "1\n"}, author="Alice", email="ALICE@example.com", days_ago=10)
+    repo.commit({"b.txt": "x\n"}, author="Bob", email="bob@lab.example.co.uk", days_ago=2)
+    return repo
+
+
+def _collector(config, time_windows, logger, monkeypatch):
+    monkeypatch.delenv("JENKINS_HOST", raising=False)
+    base = {"gerrit": {"enabled": False}, "jenkins": {"enabled": False}}
+    return GitDataCollector({**base, **config}, time_windows, logger)
+
+
+class TestWalkGitLog:
+    """The picklable walk function."""
+
+    def test_aggregates_raw_identities(self, history):
+        walk = walk_git_log(history.path, None, True)
+
+        assert walk.error is None
+        assert walk.commit_count == 3
+        assert walk.author_emails == [
+            "bob@lab.example.co.uk",
+            "ALICE@example.com",
+            "alice@example.com",
+        ]
+        assert [h.totals(0) for h in walk.author_histograms] == [
+            (1, 1, 0),
+            (1, 0, 1),
+            (1, 2, 0),
+        ]
+        assert walk.repository.totals(0) == (3, 3, 1)
+
+        restored = pickle.loads(pickle.dumps(walk))
+        assert restored.repository.items() == walk.repository.items()
+        assert restored.tip_epoch == walk.tip_epoch
+
+    def test_reports_git_failure(self, tmp_path):
+        walk = walk_git_log(tmp_path, None, True)
+        assert walk.error
+        assert walk.commit_count == 0
+
+
+class TestProcessMode:
+    """Thread and process mode produce the same metrics."""
+
+    def test_process_pool_matches_thread_mode(
+        self, history, collector_time_windows, collector_logger, monkeypatch
+    ):
+        threaded = _collector({}, collector_time_windows, collector_logger, monkeypatch)
+        expected = threaded.collect_repo_git_metrics(history.path)
+
+        pooled = _collector({}, collector_time_windows, collector_logger, monkeypatch)
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            pooled.walk_executor = executor
+            actual = pooled.collect_repo_git_metrics(history.path)
+
+        assert actual["errors"] == []
+        assert actual["repository"] == expected["repository"]
+        alice = actual["authors"]["alice@example.com"]
+        assert alice["commit_counts"] == {"last_30": 1, "last_90": 2, "last_365": 2}
+        assert actual["authors"]["bob@lab.example.co.uk"]["domain"] == "example.co.uk"
+
+    def test_reporter_sets_and_clears_executor(self, history, monkeypatch):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        config = {
+            "project": "test",
+            "gerrit": {"enabled": False},
+            "jenkins": {"enabled": False},
+            "performance": {
+                "max_workers": 2,
+                "execution_mode": "process",
+                "process_workers": 1,
+            },
+        }
+        reporter = RepositoryReporter(config, logging.getLogger("test.reporter"))
+        seen = []
+        original = reporter._analyze_repositories
+
+        def _spy(repo_dirs, max_workers):
+            seen.append(reporter.git_collector.walk_executor)
+            return original(repo_dirs, max_workers)
+
+        monkeypatch.setattr(reporter, "_analyze_repositories", _spy)
+        results = reporter._analyze_repositories_parallel([history.path])
+
+        assert isinstance(seen[0], ProcessPoolExecutor)
+        assert reporter.git_collector.walk_executor is None
+        assert results[0]["repository"]["total_commits_ever"] == 3
@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for public-suffix-aware organizational domains.
+
+Covers:
+- Parsing Public Suffix List formatted rules
+- Plain, wildcard and exception rules in the suffix trie
+- The bundled suffix list (ICANN section of the Public Suffix List)
+"""
+
+import pytest
+
+from gerrit_reporting_tool.collectors.public_suffix import (
+    PublicSuffixTrie,
+    bundled_suffix_rules,
+    icann_section,
+    parse_suffix_rules,
+)
+
+
+class TestParseSuffixRules:
+    """Rule file parsing."""
+
+    def test_skips_comments_and_blank_lines(self):
+        lines = ["// header", "", "co.uk", "  *.ck // wildcard", "!www.ck extra", "COM.CN"]
+        assert list(parse_suffix_rules(lines)) == ["co.uk", "*.ck", "!www.ck", "com.cn"]
+
+
+class TestPublicSuffixTrie:
+    """Suffix matching and registrable domains."""
+
+    @pytest.fixture
+    def trie(self):
+        return PublicSuffixTrie(["co.uk", "uk", "*.ck", "!www.ck", "com.cn"])
+
+    @pytest.mark.parametrize(
+        "domain,expected",
+        [
+            ("example.co.uk", 2),
+            ("co.uk", 2),
+            ("example.uk", 1),
+            ("example.com", 1),
+            ("a.b.ck", 2),
+            ("www.ck", 1),
+            ("mail.www.ck", 1),
+            ("localhost", 1),
+        ],
+    )
+    def test_suffix_label_count(self, trie, domain, expected):
+        assert trie.suffix_label_count(domain) == expected
+
+    @pytest.mark.parametrize(
+        "domain,expected",
+        [
+            ("lab.example.co.uk", "example.co.uk"),
+            ("co.uk", "co.uk"),
+            ("users.noreply.github.com", "github.com"),
+            ("zte.com.cn", "zte.com.cn"),
+            ("host.a.b.ck", "a.b.ck"),
+            ("mail.www.ck", "www.ck"),
+            ("com", "com"),
+        ],
+    )
+    def test_registrable_domain(self, trie, domain, expected):
+        assert trie.registrable_domain(domain) == expected
+
+    def test_len_and_empty_rules(self):
+        trie = PublicSuffixTrie(["co.uk", "", "!"])
+        trie.add(".ac.uk.")
+        assert len(trie) == 2
+        assert trie.registrable_domain("www.ox.ac.uk") == "ox.ac.uk"
+
+
+class TestBundledList:
+    """The suffix list shipped with the package."""
+
+    def test_bundled_rules(self):
+        rules = bundled_suffix_rules()
+        assert rules is bundled_suffix_rules()
+        trie = PublicSuffixTrie(rules)
+
+        assert trie.registrable_domain("mail.example.co.uk") == "example.co.uk"
+        assert trie.registrable_domain("dev.example.com.au") == "example.com.au"
+        assert trie.registrable_domain("tokyo.example.co.jp") == "example.co.jp"
+        assert trie.registrable_domain("lab.example.ac.jp") == "example.ac.jp"
+        assert trie.registrable_domain("mail.zte.com.cn") == "zte.com.cn"
+        assert trie.registrable_domain("tnaplab.telekom.de") == "telekom.de"
+        assert trie.registrable_domain("a.b.ck") == "a.b.ck"
+        assert trie.registrable_domain("mail.www.ck") == "www.ck"
+
+    def test_private_section_not_used(self):
+        trie = PublicSuffixTrie(bundled_suffix_rules())
+
+        assert trie.registrable_domain("ec2-1-2-3-4.compute-1.amazonaws.com") == (
+            "amazonaws.com"
+        )
+        assert trie.registrable_domain("project.github.io") == "github.io"
+
+    def test_icann_section(self):
+        lines = ["// ===BEGIN ICANN DOMAINS===", "co.uk", "// ===END ICANN DOMAINS===", "github.io"]
+        assert list(parse_suffix_rules(icann_section(lines))) == ["co.uk"]
@@ -0,0 +1,187 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for release and tag cadence metrics.
+
+Covers:
+- Tag counts per window, last release and median interval
+- Tag listing with creation dates, for both git backends
+- Collector output, the stale releases leaderboard and its Markdown section
+"""
+
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from gerrit_reporting_tool.aggregators.data import DataAggregator
+from gerrit_reporting_tool.collectors.git import GitDataCollector
+from gerrit_reporting_tool.collectors.git_backend import (
+    CliGitBackend,
+    Pygit2GitBackend,
+    pygit2,
+)
+from gerrit_reporting_tool.collectors.releases import (
+    TagEntry,
+    compile_tag_pattern,
+    release_metrics,
+)
+from gerrit_reporting_tool.renderers.report import ReportRenderer
+
+
+BACKENDS = [
+    pytest.param(CliGitBackend, id="cli"),
+    pytest.param(
+        Pygit2GitBackend,
+        id="pygit2",
+        marks=pytest.mark.skipif(pygit2 is None, reason="pygit2 is not installed"),
+    ),
+]
+
+DAY = 86400
+NOW = 1_700_000_000
+
+
+def _annotated_tag(repo, name: str, days_ago: float) -> None:
+    when = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    env = os.environ.copy()
+    env["GIT_COMMITTER_DATE"] = when.strftime("%Y-%m-%dT%H:%M:%S%z")
+    repo.git("tag", "-a", name, "-m", name, env=env)
+
+
+def _tagged_repo(git_repo_builder):
+    """v1.0 (lightweight, 200 days ago), v1.1 (annotated, 50), nightly (10)."""
+    repo = git_repo_builder()
+    repo.commit({"a.txt": "1\n"}, days_ago=200)
+    repo.git("tag", "v1.0")
+    repo.commit({"a.txt": "2\n"}, days_ago=60)
+    _annotated_tag(repo, "v1.1", days_ago=50)
+    repo.commit({"a.txt": "3\n"}, days_ago=10)
+    repo.git("tag", "nightly")
+    return repo
+
+
+class TestReleaseMetrics:
+    """Per-repository metrics from tag entries."""
+
+    def test_windows_last_release_and_median(self, collector_time_windows):
+        now = int(datetime.now(timezone.utc).timestamp())
+        tags = [
+            TagEntry("v1.0", now - 400 * DAY),
+            TagEntry("v1.1", now - 100 * DAY),
+            TagEntry("v1.2", now - 40 * DAY),
+            TagEntry("1.2", now - 40 * DAY),
+            TagEntry("v1.3", now - 5 * DAY),
+        ]
+
+        metrics = release_metrics(tags, collector_time_windows, now=now)
+
+        assert metrics["tag_count"] == 5
+        assert metrics["tag_counts"] == {"last_30": 1, "last_90": 3, "last_365": 4}
+        assert metrics["last_release"]["tag"] == "v1.3"
+        assert metrics["days_since_last_release"] == 5
+        # Release days 400, 100, 40 (two tags), 5 days ago: gaps 300, 60, 35
+        assert metrics["median_release_interval_days"] == 60
+
+    def test_pattern_and_no_tags(self, collector_time_windows):
+        pattern = compile_tag_pattern(r"^v\d")
+        tags = [TagEntry("v2", NOW - DAY), TagEntry("nightly", NOW)]
+
+        metrics = release_metrics(tags, {}, pattern, now=NOW)
+
+        assert metrics["tag_count"] == 1
+        assert metrics["last_release"] == {
+            "tag": "v2",
+            "date": "2023-11-13T22:13:20+00:00",
+        }
+        assert metrics["median_release_interval_days"] is None
+        empty = release_metrics([], collector_time_windows, now=NOW)
+        assert empty["last_release"] is None
+        assert empty["days_since_last_release"] is None
+        assert compile_tag_pattern(None) is None
+        with pytest.raises(ValueError):
+            compile_tag_pattern("v[")
+
+
+@pytest.mark.parametrize("backend_class", BACKENDS)
+class TestListTags:
+    """GitBackend.list_tags."""
+
+    def test_lightweight_and_annotated(self, git_repo_builder, backend_class):
+        repo = _tagged_repo(git_repo_builder)
+        repo.git("pack-refs", "--all")
+        now = datetime.now(timezone.utc).timestamp()
+
+        tags = backend_class().list_tags(repo.path)
+
+        ages = {tag.name: round((now - tag.epoch) / DAY) for tag in tags}
+        assert ages == {"v1.0": 200, "v1.1": 50, "nightly": 10}
+
+    def test_no_tags(self, git_repo_builder, backend_class):
+        repo = git_repo_builder()
+        repo.commit({"a.txt": "1\n"})
+
+        assert backend_class().list_tags(repo.path) == []
+
+
+class TestCollectorReleases:
+    """GitDataCollector output, aggregation and rendering."""
+
+    def test_collect_aggregate_and_render(
+        self, git_repo_builder, collector_time_windows, collector_logger, monkeypatch
+    ):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        config = {
+            "gerrit": {"enabled": False},
+            "jenkins": {"enabled": False},
+            "releases": {"enabled": True, "tag_pattern": "^v"},
+        }
+        collector = GitDataCollector(config, collector_time_windows, collector_logger)
+        tagged = git_repo_builder("tagged")
+        tagged.commit({"a.txt": "1\n"}, days_ago=300)
+        tagged.git("tag", "v0.9")
+        untagged = git_repo_builder("untagged")
+        untagged.commit({"a.txt": "1\n"})
+        repos = [
+            collector.collect_repo_git_metrics(built.path)["repository"]
+            for built in (_tagged_repo(git_repo_builder), tagged, untagged)
+        ]
+
+        releases = repos[0]["releases"]
+        assert releases["tag_count"] == 2
+        assert releases["tag_counts"] == {"last_30": 0, "last_90": 1, "last_365": 2}
+        assert releases["last_release"]["tag"] == "v1.1"
+        assert releases["days_since_last_release"] in (49, 50)
+        assert releases["median_release_interval_days"] == 150
+        assert repos[2]["releases"]["tag_count"] == 0
+
+        summaries = DataAggregator({}, collector_logger).aggregate_global_data(repos)
+        stale = summaries["stale_releases"]
+        assert [row["gerrit_project"] for row in stale] == ["tagged", "repo"]
+        assert stale[0]["last_release"]["tag"] == "v0.9"
+
+        section = ReportRenderer({}, logging.getLogger("test"))._generate_releases_section(
+            {"summaries": summaries}
+        )
+        assert "## 🏷️ Release Cadence" in section
+        assert "| repo | `v1.1` |" in section
+        assert "| 150 | 2 |" in section
+        assert "untagged" not in section
+
+    def test_disabled_by_default(
+        self, git_repo_builder, collector_time_windows, collector_logger, monkeypatch
+    ):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        repo = git_repo_builder()
+        repo.commit({"a.txt": "1\n"})
+        repo.git("tag", "v1")
+        config = {"gerrit": {"enabled": False}, "jenkins": {"enabled": False}}
+        collector = GitDataCollector(config, collector_time_windows, collector_logger)
+
+        repository = collector.collect_repo_git_metrics(repo.path)["repository"]
+
+        assert "releases" not in repository
+        summaries = DataAggregator({}, collector_logger).aggregate_global_data([repository])
+        assert "stale_releases" not in summaries
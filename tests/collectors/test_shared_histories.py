@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for repositories sharing one history (forks, mirrors).
+
+Covers:
+- History keys from HEAD and branch tips
+- One walk per history, aliases seeded from it
+- Reporter ordering, alias links and author rollups counted once
+"""
+
+import logging
+import subprocess
+
+from gerrit_reporting_tool.aggregators.data import DataAggregator
+from gerrit_reporting_tool.collectors.git import GitDataCollector
+from gerrit_reporting_tool.reporter import RepositoryReporter
+
+
+def _config(**performance) -> dict:
+    return {
+        "project": "test",
+        "gerrit": {"enabled": False},
+        "jenkins": {"enabled": False},
+        "performance": {"deduplicate_histories": True, **performance},
+    }
+
+
+def _fleet(git_repo_builder, tmp_path):
+    """gerrit/app with a mirror clone, plus an unrelated repository."""
+    app = git_repo_builder("gerrit/app")
+    app.commit({"a.txt": "1\n2\n"}, days_ago=5)
+    app.commit({"a.txt": "1\n2\n3\n"}, author="Bob", email="bob@example.org", days_ago=2)
+    subprocess.run(
+        ["git", "clone", "-q", str(app.path), str(tmp_path / "github" / "app")],
+        check=True,
+        capture_output=True,
+    )
+    other = git_repo_builder("other")
+    other.commit({"b.txt": "1\n"}, days_ago=3)
+    return app
+
+
+class TestCollectorSharing:
+    """GitDataCollector with deduplicate_histories."""
+
+    def test_second_copy_reuses_walk(
+        self, tmp_path, git_repo_builder, collector_time_windows, collector_logger, monkeypatch
+    ):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        _fleet(git_repo_builder, tmp_path)
+        collector = GitDataCollector(
+            {**_config(), "hotspots": {"enabled": True}},
+            collector_time_windows,
+            collector_logger,
+        )
+        collector.repos_path = tmp_path
+        walks = []
+        run_walk = collector._run_walk
+
+        def counting_walk(repo_path, *args, **kwargs):
+            walks.append(repo_path)
+            return run_walk(repo_path, *args, **kwargs)
+
+        monkeypatch.setattr(collector, "_run_walk", counting_walk)
+
+        first = collector.collect_repo_git_metrics(tmp_path / "gerrit" / "app")["repository"]
+        mirror = collector.collect_repo_git_metrics(tmp_path / "github" / "app")["repository"]
+
+        assert walks == [tmp_path / "gerrit" / "app"]
+        assert "alias_of" not in first
+        assert mirror["alias_of"] == "gerrit/app"
+        for key in ("total_commits_ever", "commit_counts", "loc_stats", "authors", "hotspots"):
+            assert mirror[key] == first[key]
+        assert mirror["local_path"] == str(tmp_path / "github" / "app")
+
+    def test_history_key(
+        self, tmp_path, git_repo_builder, collector_time_windows, collector_logger
+    ):
+        app = _fleet(git_repo_builder, tmp_path)
+        collector = GitDataCollector(_config(), collector_time_windows, collector_logger)
+        mirror = tmp_path / "github" / "app"
+
+        assert collector.history_key(app.path) == collector.history_key(mirror)
+        assert collector.history_key(app.path) != collector.history_key(tmp_path / "other")
+        assert collector.history_key(git_repo_builder("empty").path) is None
+
+        # Branch tips are part of the history once branches are walked
+        collector.ref_patterns = ["stable/*"]
+        app.git("branch", "stable/1.0")
+        assert collector.history_key(app.path) != collector.history_key(mirror)
+
+
+class TestReporterAliases:
+    """Reporter ordering, JSON links and rollups."""
+
+    def test_aliases_counted_once(self, tmp_path, git_repo_builder, monkeypatch):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        _fleet(git_repo_builder, tmp_path)
+        logger = logging.getLogger("test.histories")
+        reporter = RepositoryReporter(_config(max_workers=2, phase_timeout=600), logger)
+        collector = reporter.git_collector
+        collector.repos_path = tmp_path
+        collector.time_windows = reporter._setup_time_windows({})
+        deadlines = {}
+        collect = collector.collect_repo_git_metrics
+
+        def recording_collect(repo_path, *args, **kwargs):
+            deadlines[reporter._project_name(repo_path)] = collector.phase_deadline
+            return collect(repo_path, *args, **kwargs)
+
+        monkeypatch.setattr(collector, "collect_repo_git_metrics", recording_collect)
+
+        repo_dirs, alias_dirs = reporter._split_history_aliases(
+            reporter._discover_repositories(tmp_path)
+        )
+        assert [reporter._project_name(p) for p in alias_dirs] == ["github/app"]
+        assert sorted(reporter._project_name(p) for p in repo_dirs) == ["gerrit/app", "other"]
+
+        results = reporter._analyze_repositories_parallel(repo_dirs, alias_dirs)
+
+        # Aliases run last, under the same phase budget
+        assert results[-1]["repository"]["gerrit_project"] == "github/app"
+        assert deadlines["github/app"] is not None
+        assert deadlines["github/app"] == deadlines["gerrit/app"]
+        assert collector.phase_deadline is None
+        repositories = sorted(
+            (r["repository"] for r in results), key=lambda r: r["gerrit_project"]
+        )
+        reporter._link_history_aliases(repositories)
+
+        assert repositories[0]["aliases"] == ["github/app"]
+        assert repositories[1]["alias_of"] == "gerrit/app"
+        assert "aliases" not in repositories[2]
+
+        aggregator = DataAggregator({}, logger)
+        bob = next(
+            a for a in aggregator.compute_author_rollups(repositories)
+            if a["email"] == "bob@example.org"
+        )
+        assert bob["commits"]["last_30"] == 1
+        assert bob["repositories_count"]["last_30"] == 1
+        summaries = aggregator.aggregate_global_data(repositories)
+        assert summaries["counts"]["total_repositories"] == 3
+        assert summaries["counts"]["total_commits"] == 3
@@ -0,0 +1,189 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for per-repository and per-phase time budgets.
+
+Covers:
+- Cooperative cancellation of GitCommandStream
+- Truncated streams in GitLogParser
+- Partial walks that keep the history folded before the deadline
+- Partial flags in repository metrics, and no stored state for them
+"""
+
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from gerrit_reporting_tool.collectors import git_backend
+from gerrit_reporting_tool.collectors.git import GitDataCollector
+from gerrit_reporting_tool.collectors.git_backend import GitCommandStream, walk_git_log
+from gerrit_reporting_tool.collectors.git_log import GitLogParser
+
+
+def _record(sha: str, epoch: int, numstat: bytes = b"1\t0\tf.txt\0") -> bytes:
+    return f"\x1e{sha}\0{epoch}\0Dev\0dev@example.com\0".encode() + b"\n" + numstat + b"\0"
+
+
+# Emits two complete commits, starts a third one, then hangs like a git log
+# stuck on a corrupt pack. The output is a single write below PIPE_BUF, so
+# the reader receives it as one chunk.
+_HANGING_OUTPUT = (
+    _record("a" * 40, 1_700_086_400)
+    + _record("b" * 40, 1_700_000_000)
+    + b"\x1e" + b"c" * 40 + b"\x001699900000\x00Dev\x00dev@example.com\x00\n5\t0"
+)
+_HANGING_LOG = f"import os, time\nos.write(1, {_HANGING_OUTPUT!r})\ntime.sleep(30)\n"
+
+
+@pytest.fixture
+def hanging_git_log(monkeypatch):
+    """Replace the git log command with a process that hangs after some output."""
+    monkeypatch.setattr(
+        git_backend,
+        "build_git_log_command",
+        lambda *args, **kwargs: [sys.executable, "-c", _HANGING_LOG],
+    )
+
+
+@pytest.fixture
+def deadline_after_first_chunk(monkeypatch):
+    """
+    Clock of git_backend that passes every deadline after its first reading.
+
+    walk_git_log reads the clock once to start the watchdog and again after
+    each chunk of output, so the walk is stopped right after the first chunk
+    however long the fake git command takes to start. _HANGING_LOG writes
+    its output with a single flush, which a pipe delivers as one chunk.
+    """
+    readings = []
+
+    def fake_time() -> float:
+        readings.append(1)
+        return time.time() + (0 if len(readings) == 1 else 3600)
+
+    monkeypatch.setattr(git_backend, "time", SimpleNamespace(time=fake_time))
+
+
+class TestCancellation:
+    """GitCommandStream.cancel and GitLogParser.abort."""
+
+    def test_cancel_stops_command(self, tmp_path, collector_logger):
+        cmd = [sys.executable, "-c", "import time; print('x', flush=True); time.sleep(30)"]
+        start = time.monotonic()
+        with GitCommandStream(cmd, tmp_path, collector_logger) as stream:
+            assert next(iter(stream)) == "x\n"
+            stream.cancel()
+
+        assert time.monotonic() - start < 10
+        assert stream.cancelled and stream.interrupted
+        assert not stream.timed_out
+        assert not stream.success
+        assert stream.error == "Command cancelled"
+
+    def test_abort_drops_commit_in_progress(self):
+        parser = GitLogParser()
+        data = _record("a" * 40, 200) + _record("b" * 40, 100)[:-6]
+        assert list(parser.feed(data)) == []
+
+        batches = list(parser.abort())
+
+        assert [len(batch) for batch in batches] == [1]
+        assert batches[0].timestamps[0] == 200
+        assert list(parser.close()) == []
+
+
+class TestPartialWalk:
+    """walk_git_log under a deadline."""
+
+    def test_expired_deadline(self, tmp_path):
+        walk = walk_git_log(tmp_path, None, True, deadline=time.time() - 1)
+        assert walk.partial
+        assert walk.commit_count == 0
+        assert walk.cutoff_epoch is None
+        assert walk.error is None
+
+    def test_keeps_history_folded_before_deadline(
+        self, tmp_path, hanging_git_log, deadline_after_first_chunk
+    ):
+        start = time.monotonic()
+        walk = walk_git_log(tmp_path, None, True, deadline=time.time() + 60)
+
+        assert time.monotonic() - start < 10
+        assert walk.partial
+        assert walk.error is None
+        assert walk.commit_count == 2
+        assert walk.tip_epoch == 1_700_086_400
+        assert walk.cutoff_epoch == 1_700_000_000
+        assert walk.repository.totals(0) == (2, 2, 0)
+
+
+class TestPartialMetrics:
+    """Partial repositories in GitDataCollector output."""
+
+    def test_partial_repository_is_flagged_and_not_stored(
+        self,
+        tmp_path,
+        git_repo_builder,
+        collector_time_windows,
+        collector_logger,
+        monkeypatch,
+        hanging_git_log,
+        deadline_after_first_chunk,
+    ):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        config = {
+            "gerrit": {"enabled": False},
+            "jenkins": {"enabled": False},
+            "performance": {
+                "cache": True,
+                "repo_timeout": 60,
+                "store_path": str(tmp_path / "metrics.sqlite3"),
+            },
+        }
+        collector = GitDataCollector(config, collector_time_windows, collector_logger)
+        repo = git_repo_builder()
+        repo.commit({"a.txt": "1\n"})
+
+        metrics = collector.collect_repo_git_metrics(repo.path)
+        repository = metrics["repository"]
+
+        assert metrics["errors"] == []
+        assert repository["partial"] is True
+        assert repository["history_cutoff"] == "2023-11-14T22:13:20+00:00"
+        assert repository["total_commits_ever"] == 2
+        assert collector.state_store.load(repository["gerrit_project"]) is None
+        collector.state_store.close()
+
+    def test_complete_walk_is_not_partial(
+        self, git_repo_builder, collector_time_windows, collector_logger, monkeypatch
+    ):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        config = {"gerrit": {"enabled": False}, "jenkins": {"enabled": False}}
+        collector = GitDataCollector(config, collector_time_windows, collector_logger)
+        collector.phase_deadline = time.time() + 60
+        repo = git_repo_builder()
+        repo.commit({"a.txt": "1\n"})
+
+        repository = collector.collect_repo_git_metrics(repo.path)["repository"]
+
+        assert repository["partial"] is False
+        assert repository["history_cutoff"] is None
+        assert repository["total_commits_ever"] == 1
+
+    def test_exhausted_phase_budget(
+        self, git_repo_builder, collector_time_windows, collector_logger, monkeypatch
+    ):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        config = {"gerrit": {"enabled": False}, "jenkins": {"enabled": False}}
+        collector = GitDataCollector(config, collector_time_windows, collector_logger)
+        collector.phase_deadline = time.time() - 1
+        repo = git_repo_builder()
+        repo.commit({"a.txt": "1\n"})
+
+        repository = collector.collect_repo_git_metrics(repo.path)["repository"]
+
+        assert repository["partial"] is True
+        assert repository["total_commits_ever"] == 0
@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Benchmark: thread vs process execution mode for git collection.
+
+Runs RepositoryReporter._analyze_repositories_parallel over the same set of
+repositories with performance.execution_mode set to "thread" and "process".
+In thread mode git log parsing and folding are serialized by the GIL; in
+process mode they run in a process pool. The speedup is bounded by the
+number of cores, so run this on a multi-core machine.
+
+Usage:
+    # Benchmark an existing directory of clones
+    python tests/performance_tests/benchmark_execution_modes.py --repos /path/to/clones
+
+    # No clones at hand: synthesize repositories with git fast-import
+    python tests/performance_tests/benchmark_execution_modes.py --count 8 --commits 20000
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gerrit_reporting_tool.reporter import RepositoryReporter
+
+
+def synthesize_repo(path: Path, commits: int, seed: int) -> None:
+    """Create a repository with ``commits`` commits using git fast-import."""
+    path.mkdir(parents=True)
+    subprocess.run(["git", "init", "-q", "-b", "main"], cwd=path, check=True)
+    base = int(time.time()) - commits * 3600
+    stream: list[bytes] = []
+    for i in range(commits):
+        name = f"Developer {(i + seed) % 250}"
+        email = f"dev{(i + seed) % 250}@example{i % 17}.org"
+        message = f"Change {i}\n".encode()
+        stream.append(b"commit refs/heads/main\n")
+        stream.append(f"author {name} <{email}> {base + i * 3600} +0000\n".encode())
+        stream.append(f"committer {name} <{email}> {base + i * 3600} +0000\n".encode())
+        stream.append(f"data {len(message)}\n".encode() + message)
+        for f in range(1 + i % 4):
+            content = hashlib.sha1(f"{seed}-{i}-{f}".encode()).hexdigest().encode() + b"\n"
+            stream.append(f"M 644 inline src/module{f}/file{i % 97}.txt\n".encode())
+            stream.append(f"data {len(content)}\n".encode() + content)
+    subprocess.run(
+        ["git", "fast-import", "--quiet"], cwd=path, input=b"".join(stream), check=True
+    )
+    subprocess.run(["git", "checkout", "-q", "main"], cwd=path, check=True)
+
+
+def run_mode(repo_dirs: list[Path], mode: str, max_workers: int) -> float:
+    """Return the wall time of one collection run in the given mode."""
+    os.environ.pop("JENKINS_HOST", None)
+    config = {
+        "project": "benchmark",
+        "gerrit": {"enabled": False},
+        "jenkins": {"enabled": False},
+        "performance": {"max_workers": max_workers, "execution_mode": mode},
+    }
+    reporter = RepositoryReporter(config, logging.getLogger("benchmark"))
+    reporter.git_collector.time_windows = reporter._setup_time_windows(config)
+    start = time.perf_counter()
+    results = reporter._analyze_repositories_parallel(repo_dirs)
+    elapsed = time.perf_counter() - start
+    failed = [r for r in results if "error" in r or r.get("errors")]
+    if failed:
+        raise RuntimeError(f"{len(failed)} repositories failed in {mode} mode")
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repos", type=Path, help="Directory containing git clones")
+    parser.add_argument("--count", type=int, default=8, help="Synthetic repositories")
+    parser.add_argument("--commits", type=int, default=20000, help="Commits per repository")
+    parser.add_argument("--max-workers", type=int, default=8, help="performance.max_workers")
+    parser.add_argument("--rounds", type=int, default=3, help="Timed rounds per mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.repos:
+            repo_dirs = sorted(p.parent for p in args.repos.rglob(".git"))
+            source = f"{len(repo_dirs)} repositories in {args.repos}"
+        else:
+            repo_dirs = [Path(tmp) / f"repo{i}" for i in range(args.count)]
+            for seed, repo in enumerate(repo_dirs):
+                synthesize_repo(repo, args.commits, seed)
+            source = f"{args.count} synthetic repositories x {args.commits} commits"
+
+        timings = {
+            mode: statistics.median(
+                run_mode(repo_dirs, mode, args.max_workers) for _ in range(args.rounds)
+            )
+            for mode in ("thread", "process")
+        }
+
+    print("=" * 70)
+    print(f"EXECUTION MODE BENCHMARK ({source}, {os.cpu_count()} CPUs)")
+    print("=" * 70)
+    for mode, seconds in timings.items():
+        print(f"{mode:<10} {seconds:>10.3f} s")
+    print(f"\nSpeedup: {timings['thread'] / timings['process']:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
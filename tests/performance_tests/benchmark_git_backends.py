@@ -0,0 +1,153 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Benchmark: git access backends (git command line vs libgit2).
+
+Times every GitBackend operation with each available backend on the same
+repositories:
+
+- walk_log: full history walk with numstat totals
+- resolve_ref: HEAD resolution (one call per repository)
+- is_ancestor: ancestry check of the root commit against HEAD
+- list_tree: recursive listing of HEAD's tree with blob sizes
+- blob_size: size lookups for the blobs of HEAD's tree
+
+The CLI backend pays a process spawn per call, so the small operations are
+where libgit2 is expected to win; for walk_log the diff work dominates.
+
+Usage:
+    # Benchmark an existing directory of clones
+    python tests/performance_tests/benchmark_git_backends.py --repos /path/to/clones
+
+    # No clones at hand: synthesize repositories with git fast-import
+    python tests/performance_tests/benchmark_git_backends.py --count 4 --commits 5000
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from benchmark_execution_modes import synthesize_repo
+
+from gerrit_reporting_tool.collectors.git_backend import (
+    GIT_BACKENDS,
+    GitBackend,
+    get_git_backend,
+    pygit2,
+)
+
+
+# Blob size lookups timed per repository
+BLOB_SAMPLE = 200
+
+
+def root_commit(repo: Path) -> str:
+    """Return the first root commit of HEAD."""
+    result = subprocess.run(
+        ["git", "rev-list", "--max-parents=0", "HEAD"],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.split()[0]
+
+
+def operations(
+    backend: GitBackend, repo_dirs: list[Path], roots: dict[Path, str]
+) -> dict[str, Callable[[], object]]:
+    """Return one callable per operation, each covering all repositories."""
+    blobs = {
+        repo: [e.oid for e in backend.list_tree(repo) if e.type == "blob"][:BLOB_SAMPLE]
+        for repo in repo_dirs
+    }
+    return {
+        "walk_log": lambda: [backend.walk_log(repo, None, True) for repo in repo_dirs],
+        "resolve_ref": lambda: [backend.resolve_ref(repo, "HEAD") for repo in repo_dirs],
+        "is_ancestor": lambda: [
+            backend.is_ancestor(repo, roots[repo], "HEAD") for repo in repo_dirs
+        ],
+        "list_tree": lambda: [backend.list_tree(repo) for repo in repo_dirs],
+        "blob_size": lambda: [
+            backend.blob_size(repo, oid) for repo in repo_dirs for oid in blobs[repo]
+        ],
+    }
+
+
+def check_walks(backends: dict[str, GitBackend], repo_dirs: list[Path]) -> None:
+    """Fail if the backends disagree on any repository's aggregates."""
+    for repo in repo_dirs:
+        walks = {
+            name: backend.walk_log(repo, None, True) for name, backend in backends.items()
+        }
+        summaries = {
+            name: (walk.commit_count, walk.repository.totals(0))
+            for name, walk in walks.items()
+        }
+        if len(set(summaries.values())) > 1:
+            raise RuntimeError(f"Backends disagree on {repo}: {summaries}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repos", type=Path, help="Directory containing git clones")
+    parser.add_argument("--count", type=int, default=4, help="Synthetic repositories")
+    parser.add_argument("--commits", type=int, default=5000, help="Commits per repository")
+    parser.add_argument("--rounds", type=int, default=3, help="Timed rounds per operation")
+    args = parser.parse_args()
+
+    logger = logging.getLogger("benchmark")
+    names = [name for name in GIT_BACKENDS if name != "pygit2" or pygit2 is not None]
+    backends = {name: get_git_backend(name, logger) for name in names}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.repos:
+            repo_dirs = sorted(p.parent for p in args.repos.rglob(".git"))
+            source = f"{len(repo_dirs)} repositories in {args.repos}"
+        else:
+            repo_dirs = [Path(tmp) / f"repo{i}" for i in range(args.count)]
+            for seed, repo in enumerate(repo_dirs):
+                synthesize_repo(repo, args.commits, seed)
+            source = f"{args.count} synthetic repositories x {args.commits} commits"
+
+        roots = {repo: root_commit(repo) for repo in repo_dirs}
+        check_walks(backends, repo_dirs)
+
+        timings: dict[str, dict[str, float]] = {}
+        for name, backend in backends.items():
+            for operation, run in operations(backend, repo_dirs, roots).items():
+                samples = []
+                for _ in range(args.rounds):
+                    start = time.perf_counter()
+                    run()
+                    samples.append(time.perf_counter() - start)
+                timings.setdefault(operation, {})[name] = statistics.median(samples)
+
+    print("=" * 70)
+    print(f"GIT BACKEND BENCHMARK ({source}, {os.cpu_count()} CPUs)")
+    print("=" * 70)
+    if pygit2 is None:
+        print("pygit2 is not installed; only the cli backend was timed\n")
+    print(f"{'operation':<14}" + "".join(f"{name:>12}" for name in names) + f"{'speedup':>10}")
+    for operation, by_backend in timings.items():
+        row = f"{operation:<14}" + "".join(f"{by_backend[name]:>11.3f}s" for name in names)
+        if len(names) > 1:
+            row += f"{by_backend[names[0]] / by_backend[names[1]]:>9.2f}x"
+        print(row)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
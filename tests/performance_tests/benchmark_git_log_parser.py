@@ -0,0 +1,298 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Microbenchmark: legacy "|"-split git log parser vs NUL-delimited bytes parser.
+
+Both parsers are run over the same history, recorded once in each format:
+- legacy:   git log --numstat --date=iso --pretty=format:%H|%ad|%an|%ae|%s
+- nul:      git log -z --numstat --pretty=format:<GIT_LOG_FORMAT>
+- trailers: the nul format plus the Co-authored-by/Signed-off-by trailers
+            field, parsed with parse_trailers (co-author attribution)
+
+The legacy parser is kept here, and only here, as the baseline. Its timing
+includes decoding the whole output to text, because that is what
+subprocess.run(text=True) did before the parser ever saw it. The trailers row
+shows the parsing overhead of enabling co-author attribution.
+
+Usage:
+    # Record logs from a real (large) repository, then benchmark them
+    python tests/performance_tests/benchmark_git_log_parser.py --repo /path/to/repo \\
+        --record-dir /tmp/gitlogs
+
+    # Re-run against previously recorded logs
+    python tests/performance_tests/benchmark_git_log_parser.py --log-dir /tmp/gitlogs
+
+    # No repository at hand: synthesize a history
+    python tests/performance_tests/benchmark_git_log_parser.py --commits 50000
+"""
+
+import argparse
+import datetime
+import hashlib
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gerrit_reporting_tool.collectors.git_log import (
+    GitLogParser,
+    build_git_log_command,
+)
+
+
+LEGACY_FILE = "legacy.log"
+NUL_FILE = "nul.log"
+TRAILERS_FILE = "trailers.log"
+LEGACY_COMMAND = [
+    "git",
+    "log",
+    "--numstat",
+    "--date=iso",
+    "--pretty=format:%H|%ad|%an|%ae|%s",
+]
+CHUNK_SIZE = 1 << 16
+
+
+def record_logs(repo: Path, record_dir: Path) -> tuple[bytes, bytes, bytes]:
+    """Record the history of a repository in all formats."""
+    record_dir.mkdir(parents=True, exist_ok=True)
+    legacy = subprocess.run(LEGACY_COMMAND, cwd=repo, capture_output=True, check=True).stdout
+    nul = subprocess.run(
+        build_git_log_command(), cwd=repo, capture_output=True, check=True
+    ).stdout
+    trailers = subprocess.run(
+        build_git_log_command(trailers=True), cwd=repo, capture_output=True, check=True
+    ).stdout
+    (record_dir / LEGACY_FILE).write_bytes(legacy)
+    (record_dir / NUL_FILE).write_bytes(nul)
+    (record_dir / TRAILERS_FILE).write_bytes(trailers)
+    return legacy, nul, trailers
+
+
+def load_logs(log_dir: Path) -> tuple[bytes, bytes, bytes]:
+    """Load previously recorded logs."""
+    return (
+        (log_dir / LEGACY_FILE).read_bytes(),
+        (log_dir / NUL_FILE).read_bytes(),
+        (log_dir / TRAILERS_FILE).read_bytes(),
+    )
+
+
+def synthesize_logs(
+    commits: int, files_per_commit: int = 6
+) -> tuple[bytes, bytes, bytes]:
+    """
+    Generate an equivalent history in all formats.
+
+    Every fifth commit has a Co-authored-by trailer and every other commit a
+    Signed-off-by trailer.
+    """
+    legacy_parts: list[bytes] = []
+    nul_parts: list[bytes] = []
+    trailer_parts: list[bytes] = []
+    base = 1_600_000_000
+    for i in range(commits):
+        sha = hashlib.sha1(str(i).encode()).hexdigest()
+        epoch = base - i * 3600
+        iso = time.strftime("%Y-%m-%d %H:%M:%S +0000", time.gmtime(epoch))
+        name = f"Developer {i % 250}"
+        email = f"dev{i % 250}@example{i % 17}.org"
+        subject = f"Fix issue {i}: update component handling"
+        numstat = [
+            (str((i * 7 + f) % 120), str((i * 3 + f) % 40), f"src/module{f}/file{i % 97}.py")
+            for f in range(1 + i % files_per_commit)
+        ]
+
+        legacy_parts.append(f"{sha}|{iso}|{name}|{email}|{subject}\n".encode())
+        legacy_parts.extend(f"{a}\t{r}\t{p}\n".encode() for a, r, p in numstat)
+        legacy_parts.append(b"\n")
+
+        header = f"\x1e{sha}\0{epoch}\0{name}\0{email}\0".encode()
+        body = [b"\n", *(f"{a}\t{r}\t{p}\0".encode() for a, r, p in numstat), b"\0"]
+        nul_parts.append(header)
+        nul_parts.extend(body)
+
+        trailers = []
+        if i % 5 == 0:
+            trailers.append(f"Co-authored-by: Developer {i % 13} <dev{i % 13}@example.org>")
+        if i % 2 == 0:
+            trailers.append(f"Signed-off-by: {name} <{email}>")
+        trailer_parts.append(header + "\x1f".join(trailers).encode() + b"\0")
+        trailer_parts.extend(body)
+    return b"".join(legacy_parts), b"".join(nul_parts), b"".join(trailer_parts)
+
+
+def parse_git_iso_date(date_str: str) -> datetime.datetime:
+    """Parse git's --date=iso format ("2013-03-25 16:50:06 +0100")."""
+    # Replace first space with 'T' to separate date and time
+    date_str = date_str.replace(" ", "T", 1)
+
+    # Handle timezone offset: convert "+0100" to "+01:00"
+    if "+" in date_str or date_str.count("-") > 2:
+        if "+" in date_str:
+            parts = date_str.rsplit("+", 1)
+            tz_sign = "+"
+        else:
+            parts = date_str.rsplit("-", 1)
+            tz_sign = "-"
+
+        if len(parts) == 2 and len(parts[1]) == 4:
+            tz_offset = parts[1]
+            date_str = f"{parts[0]}{tz_sign}{tz_offset[:2]}:{tz_offset[2:]}"
+
+    return datetime.datetime.fromisoformat(date_str)
+
+
+def parse_legacy_git_log(text: str, skip_binary_changes: bool = True) -> list[dict]:
+    """
+    The legacy "|"-split parser of LEGACY_COMMAND output.
+
+    Returns one dict per commit with hash, date, author_name, author_email,
+    subject and files_changed; lines with an unparsable date are skipped.
+    """
+    commits: list[dict] = []
+    current_commit: dict | None = None
+
+    for line in text.strip().split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+
+        # Commit header: hash|date|author_name|author_email|subject
+        if "|" in line and len(line.split("|")) >= 5:
+            if current_commit:
+                commits.append(current_commit)
+            current_commit = None
+
+            parts = line.split("|", 4)
+            try:
+                commit_date = parse_git_iso_date(parts[1])
+                if commit_date.tzinfo is None:
+                    commit_date = commit_date.replace(tzinfo=datetime.timezone.utc)
+            except (ValueError, IndexError):
+                continue
+
+            current_commit = {
+                "hash": parts[0],
+                "date": commit_date,
+                "author_name": parts[2],
+                "author_email": parts[3],
+                "subject": parts[4] if len(parts) > 4 else "",
+                "files_changed": [],
+            }
+        else:
+            # Numstat line: added<tab>removed<tab>filename
+            parts = line.split("\t")
+            if len(parts) >= 3 and current_commit:
+                try:
+                    # Binary files are marked with -
+                    added = 0 if parts[0] == "-" else int(parts[0])
+                    removed = 0 if parts[1] == "-" else int(parts[1])
+                    if skip_binary_changes and (parts[0] == "-" or parts[1] == "-"):
+                        continue
+                    current_commit["files_changed"].append(
+                        {"filename": parts[2], "added": added, "removed": removed}
+                    )
+                except (ValueError, IndexError):
+                    continue
+
+    if current_commit:
+        commits.append(current_commit)
+    return commits
+
+
+def bench_legacy(data: bytes) -> int:
+    text = data.decode("utf-8", errors="replace")
+    return len(parse_legacy_git_log(text))
+
+
+def bench_nul(data: bytes, parse_trailers: bool = False) -> int:
+    parser = GitLogParser(skip_binary_changes=True, parse_trailers=parse_trailers)
+    chunks = (data[i : i + CHUNK_SIZE] for i in range(0, len(data), CHUNK_SIZE))
+    return sum(len(batch) for batch in parser.parse(chunks))
+
+
+def _peak_memory(fn) -> int:
+    """Peak traced allocation size (bytes) of a single run."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _time(fn, rounds: int) -> tuple[float, int]:
+    timings = []
+    result = 0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repo", type=Path, help="Repository to record the logs from")
+    parser.add_argument("--record-dir", type=Path, help="Where to store recorded logs")
+    parser.add_argument("--log-dir", type=Path, help="Directory with recorded logs")
+    parser.add_argument("--commits", type=int, default=20000, help="Synthetic history size")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per parser")
+    args = parser.parse_args()
+
+    if args.log_dir:
+        legacy, nul, trailers = load_logs(args.log_dir)
+        source = f"recorded logs in {args.log_dir}"
+    elif args.repo:
+        legacy, nul, trailers = record_logs(args.repo, args.record_dir or Path("git-log-recordings"))
+        source = f"repository {args.repo}"
+    else:
+        legacy, nul, trailers = synthesize_logs(args.commits)
+        source = f"{args.commits} synthetic commits"
+
+    legacy_time, legacy_commits = _time(lambda: bench_legacy(legacy), args.rounds)
+    nul_time, nul_commits = _time(lambda: bench_nul(nul), args.rounds)
+    trailers_time, trailers_commits = _time(lambda: bench_nul(trailers, True), args.rounds)
+    legacy_peak = _peak_memory(lambda: bench_legacy(legacy))
+    nul_peak = _peak_memory(lambda: bench_nul(nul))
+    trailers_peak = _peak_memory(lambda: bench_nul(trailers, True))
+
+    print("=" * 70)
+    print(f"GIT LOG PARSER BENCHMARK ({source})")
+    print("=" * 70)
+    print(
+        f"{'parser':<10} {'commits':>10} {'MB':>8} {'median s':>10} "
+        f"{'commits/s':>12} {'peak MB':>10}"
+    )
+    for label, seconds, commits, size, peak in (
+        ("legacy", legacy_time, legacy_commits, len(legacy), legacy_peak),
+        ("nul", nul_time, nul_commits, len(nul), nul_peak),
+        ("trailers", trailers_time, trailers_commits, len(trailers), trailers_peak),
+    ):
+        rate = commits / seconds if seconds else float("inf")
+        print(
+            f"{label:<10} {commits:>10} {size / 1e6:>8.1f} {seconds:>10.3f} "
+            f"{rate:>12.0f} {peak / 1e6:>10.1f}"
+        )
+    print(f"\nSpeedup: {legacy_time / nul_time:.2f}x")
+    print(f"Trailer parsing overhead: {(trailers_time / nul_time - 1) * 100:+.1f}%")
+
+    if not legacy_commits == nul_commits == trailers_commits:
+        print(
+            f"WARNING: commit counts differ "
+            f"({legacy_commits} vs {nul_commits} vs {trailers_commits})"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -338,6 +338,22 @@ def test_github_enabled_without_token_warning(
     assert any("github" in str(w).lower() and "token" in str(w).lower() for w in result.warnings)
 
 
+def test_churn_ownership_without_hotspots_warning(
+    validator: ConfigValidator, full_config: dict[str, Any]
+):
+    """Test warning for churn ownership sampling with hotspots disabled."""
+    full_config["ownership"] = {"enabled": True, "sample": "churn"}
+    full_config["hotspots"] = {"enabled": False}
+
+    result = validator.validate(full_config)
+    assert result.is_valid
+    assert any("ownership.sample" in str(w) for w in result.warnings)
+
+    full_config["hotspots"]["enabled"] = True
+    result = validator.validate(full_config)
+    assert not any("ownership.sample" in str(w) for w in result.warnings)
+
+
 # =============================================================================
 # COMPATIBILITY VALIDATION TESTS
 # =============================================================================
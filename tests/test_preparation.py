@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for the repository preparation stage.
+
+Covers:
+- Detection of existing commit-graph and bitmap files
+- Commit-graph writes with before/after commit walk timings
+- Failures on broken repositories
+- The run summary and reporter wiring
+"""
+
+import logging
+import subprocess
+from pathlib import Path
+
+from gerrit_reporting_tool.preparation import (
+    PreparationResult,
+    RepositoryPreparer,
+    has_bitmap,
+    has_commit_graph,
+    time_commit_walk,
+)
+from gerrit_reporting_tool.reporter import RepositoryReporter
+
+
+def _git_repo(path: Path, commits: int = 3) -> Path:
+    path.mkdir(parents=True)
+    subprocess.run(["git", "init", "-q"], cwd=path, check=True)
+    for i in range(commits):
+        (path / "file.txt").write_text(f"content {i}\n")
+        subprocess.run(["git", "add", "-A"], cwd=path, check=True)
+        subprocess.run(
+            ["git", "-c", "user.name=T", "-c", "user.email=t@example.com",
+             "commit", "-q", "-m", f"change {i}"],
+            cwd=path,
+            check=True,
+        )
+    return path
+
+
+class TestDetection:
+    """Index detection without git."""
+
+    def test_commit_graph(self, tmp_path):
+        repo = _git_repo(tmp_path / "repo")
+        assert not has_commit_graph(repo)
+
+        subprocess.run(["git", "commit-graph", "write", "--reachable"], cwd=repo, check=True)
+        assert has_commit_graph(repo)
+        assert not has_commit_graph(tmp_path / "missing")
+
+    def test_bitmap(self, tmp_path):
+        repo = _git_repo(tmp_path / "repo")
+        assert not has_bitmap(repo)
+
+        subprocess.run(["git", "repack", "-q", "-a", "-d", "-b"], cwd=repo, check=True)
+        assert has_bitmap(repo)
+
+    def test_time_commit_walk(self, tmp_path):
+        logger = logging.getLogger("test.preparation")
+        assert time_commit_walk(_git_repo(tmp_path / "repo"), logger) > 0
+        assert time_commit_walk(tmp_path, logger) is None
+
+
+class TestPreparer:
+    """RepositoryPreparer."""
+
+    def test_writes_missing_commit_graph(self, tmp_path):
+        repo = _git_repo(tmp_path / "repo")
+        preparer = RepositoryPreparer(2)
+
+        result = preparer.prepare(repo, "repo")
+
+        assert result.commit_graph == "written"
+        assert result.bitmap is None
+        assert result.error is None
+        assert result.log_seconds_before > 0 and result.log_seconds_after > 0
+        assert has_commit_graph(repo)
+        assert preparer.prepare(repo, "repo") == PreparationResult("repo", "present")
+
+    def test_writes_bitmap(self, tmp_path):
+        repo = _git_repo(tmp_path / "repo")
+        subprocess.run(["git", "repack", "-q", "-a", "-d"], cwd=repo, check=True)
+
+        result = RepositoryPreparer(1, write_bitmaps=True).prepare(repo, "repo")
+
+        assert (result.commit_graph, result.bitmap) == ("written", "written")
+        assert has_bitmap(repo)
+
+    def test_failure(self, tmp_path):
+        broken = tmp_path / "broken"
+        (broken / ".git").mkdir(parents=True)
+
+        result = RepositoryPreparer(1).prepare(broken, "broken")
+
+        assert result.commit_graph == "failed"
+        assert result.error
+        assert result.log_seconds_after is None
+
+    def test_prepare_all_and_summary(self, tmp_path):
+        repos = [_git_repo(tmp_path / "a"), _git_repo(tmp_path / "b")]
+        subprocess.run(["git", "commit-graph", "write", "--reachable"], cwd=repos[1], check=True)
+
+        results = RepositoryPreparer(2).prepare_all(repos, ["a", "b"])
+        summary = RepositoryPreparer.summary(results, wall_seconds=0.5)
+
+        assert [r.project for r in results] == ["a", "b"]
+        assert summary["repositories"] == 2
+        assert summary["commit_graphs_written"] == 1
+        assert summary["commit_graphs_present"] == 1
+        assert summary["failed"] == 0
+        assert summary["log_seconds_before"] > 0
+        assert [d["project"] for d in summary["details"]] == ["a"]
+
+
+class TestReporterPreparation:
+    """Reporter stage wiring."""
+
+    def test_prepare_repositories(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        root = tmp_path / "repos"
+        repos = [_git_repo(root / "one"), _git_repo(root / "two")]
+        config = {
+            "project": "test",
+            "gerrit": {"enabled": False},
+            "jenkins": {"enabled": False},
+            "performance": {"max_workers": 2, "prepare_repositories": True},
+        }
+        reporter = RepositoryReporter(config, logging.getLogger("test.preparation"))
+        reporter.git_collector.repos_path = root
+
+        reporter._prepare_repositories(repos)
+
+        assert reporter.preparation_report["commit_graphs_written"] == 2
+        assert sorted(d["project"] for d in reporter.preparation_report["details"]) == [
+            "one",
+            "two",
+        ]
+        assert all(has_commit_graph(repo) for repo in repos)
@@ -0,0 +1,172 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for cost-model-driven repository scheduling.
+
+Covers:
+- Object database size estimation
+- Calibration from recorded timings
+- Longest-first ordering with children before parents
+- Makespan simulation and the predicted-vs-actual report
+- Reporter integration with the metrics store
+"""
+
+import logging
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from gerrit_reporting_tool.collectors.metrics_store import MetricsStore
+from gerrit_reporting_tool.reporter import RepositoryReporter
+from gerrit_reporting_tool.scheduling import (
+    DEFAULT_OVERHEAD_SECONDS,
+    RepositoryCost,
+    RepositoryScheduler,
+    object_database_size,
+    simulate_makespan,
+)
+
+
+def _git_repo(path: Path, files: int = 1) -> Path:
+    path.mkdir(parents=True)
+    subprocess.run(["git", "init", "-q"], cwd=path, check=True)
+    for i in range(files):
+        (path / f"file{i}.txt").write_text(f"content {i}\n" * 50)
+    subprocess.run(["git", "add", "-A"], cwd=path, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=T", "-c", "user.email=t@example.com",
+         "commit", "-q", "-m", "init"],
+        cwd=path,
+        check=True,
+    )
+    return path
+
+
+def _cost(path: str, seconds: float) -> RepositoryCost:
+    return RepositoryCost(Path(path), path.strip("/"), 0, seconds, "history")
+
+
+class TestEstimates:
+    """Cost estimation."""
+
+    def test_object_database_size(self, tmp_path):
+        small = _git_repo(tmp_path / "small", files=1)
+        large = _git_repo(tmp_path / "large", files=20)
+
+        assert 0 < object_database_size(small) < object_database_size(large)
+        assert object_database_size(tmp_path / "missing") == 0
+
+    def test_history_takes_precedence(self, tmp_path):
+        repo = _git_repo(tmp_path / "repo")
+        scheduler = RepositoryScheduler(4, {"repo": (12.5, 1000)})
+
+        cost = scheduler.estimate(repo, "repo")
+        assert (cost.seconds, cost.source) == (12.5, "history")
+
+        other = scheduler.estimate(repo, "other")
+        assert other.source == "size"
+        assert other.seconds > DEFAULT_OVERHEAD_SECONDS
+
+    def test_calibration(self):
+        history = {"a": (1.05, 1_000_000), "b": (2.05, 2_000_000)}
+        scheduler = RepositoryScheduler(2, history)
+        assert scheduler.seconds_per_byte == pytest.approx(1e-6)
+
+
+class TestOrdering:
+    """LPT ordering and makespan."""
+
+    def test_longest_first_children_before_parents(self):
+        scheduler = RepositoryScheduler(2)
+        plan = scheduler.order(
+            [
+                _cost("/r/small", 1),
+                _cost("/r/parent", 2),
+                _cost("/r/parent/child", 9),
+                _cost("/r/huge", 20),
+                _cost("/r/medium", 5),
+            ]
+        )
+        assert [c.project for c in plan] == [
+            "r/huge",
+            "r/parent/child",
+            "r/parent",
+            "r/medium",
+            "r/small",
+        ]
+
+    def test_simulate_makespan(self):
+        assert simulate_makespan([], 4) == 0.0
+        assert simulate_makespan([1, 1, 1, 10], 2) == 11
+        assert simulate_makespan([10, 1, 1, 1], 2) == 10
+        assert simulate_makespan([3, 2], 8) == 3
+
+    def test_report(self):
+        scheduler = RepositoryScheduler(2)
+        plan = scheduler.order([_cost("/a", 4), _cost("/b", 2), _cost("/c", 2)])
+        actual = {Path("/a"): 5.0, Path("/b"): 1.0, Path("/c"): 1.0}
+
+        report = scheduler.report(plan, actual, wall_seconds=5.2)
+
+        assert report["predicted_makespan"] == 4
+        assert report["replayed_makespan"] == 5
+        assert report["actual_makespan"] == 5.2
+        assert report["total_work"] == 7
+        assert report["largest_errors"][0]["project"] == "a"
+
+
+class TestReporterScheduling:
+    """Reporter dispatch order and timing persistence."""
+
+    def test_records_timings_and_report(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        root = tmp_path / "repos"
+        repos = [_git_repo(root / "small"), _git_repo(root / "large", files=20)]
+        config = {
+            "project": "test",
+            "gerrit": {"enabled": False},
+            "jenkins": {"enabled": False},
+            "performance": {
+                "max_workers": 1,
+                "cache": True,
+                "store_path": str(tmp_path / "metrics.sqlite3"),
+            },
+        }
+        reporter = RepositoryReporter(config, logging.getLogger("test.scheduling"))
+        reporter.git_collector.repos_path = root
+        order = []
+        original = reporter._analyze_single_repository
+
+        def _spy(repo_path):
+            order.append(repo_path.name)
+            return original(repo_path)
+
+        monkeypatch.setattr(reporter, "_analyze_single_repository", _spy)
+        reporter._analyze_repositories_parallel(repos)
+
+        assert order == ["large", "small"]
+        assert reporter.schedule_report["repositories"] == 2
+        assert reporter.schedule_report["from_history"] == 0
+
+        store = MetricsStore(tmp_path / "metrics.sqlite3", logging.getLogger("test"))
+        try:
+            assert set(store.load_timings()) == {"small", "large"}
+        finally:
+            store.close()
+
+    def test_discovery_order(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        repos = [_git_repo(tmp_path / "small"), _git_repo(tmp_path / "large", files=20)]
+        config = {
+            "project": "test",
+            "gerrit": {"enabled": False},
+            "jenkins": {"enabled": False},
+            "performance": {"max_workers": 1, "scheduling": "discovery"},
+        }
+        reporter = RepositoryReporter(config, logging.getLogger("test.scheduling"))
+        results = reporter._analyze_repositories_parallel(repos)
+
+        assert [r["repository"]["local_path"] for r in results] == [str(p) for p in repos]
+        assert reporter.schedule_report is None
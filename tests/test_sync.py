@@ -0,0 +1,165 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""
+Tests for the repository sync stage.
+
+Covers:
+- Clone URLs and project lists (Gerrit listing, file:// stand-in)
+- Clones, fast-forward updates and failures against a local file:// server
+- Reference repositories and partial clone filters
+- The run summary and reporter wiring
+"""
+
+import logging
+import subprocess
+from pathlib import Path
+
+from gerrit_reporting_tool.reporter import RepositoryReporter
+from gerrit_reporting_tool.sync import (
+    RepositorySyncer,
+    gerrit_sync_projects,
+    list_local_projects,
+    project_clone_url,
+)
+
+
+def _git(*args: str, cwd: Path) -> str:
+    result = subprocess.run(
+        ["git", "-c", "user.name=T", "-c", "user.email=t@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip()
+
+
+def _serve(server: Path, project: str) -> Path:
+    """Create a bare ``<project>.git`` with one commit under ``server``."""
+    bare = server / f"{project}.git"
+    bare.mkdir(parents=True)
+    _git("init", "-q", "--bare", "-b", "main", cwd=bare)
+    _push(bare, "first")
+    return bare
+
+
+def _push(bare: Path, message: str) -> str:
+    """Add a commit to ``bare`` through a temporary clone; returns its SHA."""
+    work = bare.parent / f"{bare.name}-work"
+    if not work.exists():
+        _git("clone", "-q", str(bare), str(work), cwd=bare.parent)
+    (work / "file.txt").write_text(message + "\n")
+    _git("add", "-A", cwd=work)
+    _git("commit", "-q", "-m", message, cwd=work)
+    _git("push", "-q", "origin", "HEAD:main", cwd=work)
+    return _git("rev-parse", "HEAD", cwd=work)
+
+
+def _head(repo: Path) -> str:
+    return _git("rev-parse", "HEAD", cwd=repo)
+
+
+class TestProjects:
+    """URL templates and project lists."""
+
+    def test_clone_url(self):
+        assert project_clone_url("file:///srv/{project}.git", "a/b") == "file:///srv/a/b.git"
+        assert project_clone_url("https://gerrit.example.org/r/", "a/b") == (
+            "https://gerrit.example.org/r/a/b"
+        )
+
+    def test_gerrit_projects(self):
+        listing = {
+            "All-Projects": {"state": "ACTIVE"},
+            "app": {"state": "ACTIVE"},
+            "old": {"state": "READ_ONLY"},
+            "secret": {"state": "HIDDEN"},
+        }
+        assert gerrit_sync_projects(listing) == ["app", "old"]
+
+    def test_local_projects(self, tmp_path):
+        server = tmp_path / "gerrit"
+        _serve(server, "app")
+        _serve(server, "group/lib")
+
+        assert list_local_projects(f"file://{server}/{{project}}.git") == ["app", "group/lib"]
+        assert list_local_projects("https://gerrit.example.org/{project}") is None
+        assert list_local_projects(f"file://{tmp_path}/missing/{{project}}") == []
+
+
+class TestSyncer:
+    """Clones and updates against a file:// server."""
+
+    def test_clone_update_and_failure(self, tmp_path):
+        server = tmp_path / "gerrit"
+        app = _serve(server, "app")
+        _serve(server, "group/lib")
+        repos = tmp_path / "repos"
+        syncer = RepositorySyncer(repos, f"file://{server}/{{project}}.git", max_workers=2)
+
+        results = syncer.sync_all(["app", "group/lib", "missing"])
+
+        assert [(r.project, r.action) for r in results] == [
+            ("app", "cloned"),
+            ("group/lib", "cloned"),
+            ("missing", "failed"),
+        ]
+        assert results[2].error
+        assert _head(repos / "app") == _git("rev-parse", "main", cwd=app)
+
+        new_head = _push(app, "second")
+        results = syncer.sync_all(["app"])
+
+        assert results[0].action == "updated"
+        assert _head(repos / "app") == new_head
+
+        summary = syncer.summary(results, 1.5)
+        assert summary["updated"] == 1
+        assert summary["failed"] == 0
+        assert summary["details"] == []
+
+    def test_reference_and_filter(self, tmp_path):
+        server = tmp_path / "gerrit"
+        _serve(server, "app")
+        _git("config", "uploadpack.allowFilter", "true", cwd=server / "app.git")
+        repos = tmp_path / "repos"
+        syncer = RepositorySyncer(
+            repos,
+            f"file://{server}/{{project}}.git",
+            reference_dir=tmp_path / "references",
+            partial_filter="blob:none",
+        )
+
+        (result,) = syncer.sync_all(["app"])
+
+        assert result.action == "cloned"
+        alternates = repos / "app" / ".git" / "objects" / "info" / "alternates"
+        assert str(tmp_path / "references") in alternates.read_text()
+        assert _git("config", "remote.origin.partialclonefilter", cwd=repos / "app") == (
+            "blob:none"
+        )
+
+
+class TestReporterSync:
+    """Reporter stage wiring."""
+
+    def test_sync_from_local_server(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("JENKINS_HOST", raising=False)
+        server = tmp_path / "gerrit"
+        _serve(server, "app")
+        _serve(server, "group/lib")
+        repos = tmp_path / "repos"
+        repos.mkdir()
+        config = {
+            "project": "test",
+            "gerrit": {"enabled": False},
+            "jenkins": {"enabled": False},
+            "sync": {"enabled": True, "url_template": f"file://{server}/{{project}}.git"},
+        }
+        reporter = RepositoryReporter(config, logging.getLogger("test.sync"))
+
+        reporter._sync_repositories(repos)
+
+        assert reporter.sync_report["cloned"] == 2
+        assert len(reporter._discover_repositories(repos)) == 2